@@ -64,6 +64,29 @@ class Credentials(APIObject):
         return translate_aliases(kwargs, cls.ALIASES)
 
 
+class QueryLatencies(object):
+    """A thread-safe record of how long the main statement of each node took
+    to run, for consumers that want to react to warehouse load.
+    """
+    def __init__(self):
+        self.lock = multiprocessing.Lock()
+        self._latencies = []
+
+    def record(self, seconds, unique_id=None):
+        with self.lock:
+            self._latencies.append((unique_id, seconds))
+
+    def drain(self):
+        """Return every latency recorded since the last call, as
+        (unique_id, seconds) pairs. The unique ID is None if the query wasn't
+        run for a node.
+        """
+        with self.lock:
+            latencies = self._latencies
+            self._latencies = []
+        return latencies
+
+
 @six.add_metaclass(abc.ABCMeta)
 class BaseConnectionManager(object):
     """Methods to implement:
@@ -84,6 +107,7 @@ class BaseConnectionManager(object):
         self.profile = profile
         self.thread_connections = {}
         self.lock = multiprocessing.RLock()
+        self.query_latencies = QueryLatencies()
 
     @staticmethod
     def get_thread_identifier():
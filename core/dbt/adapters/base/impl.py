@@ -1,5 +1,6 @@
 import abc
 from contextlib import contextmanager
+import time
 
 import agate
 import pytz
@@ -239,6 +240,28 @@ class BaseAdapter(object):
             fetch=fetch
         )
 
+    @available
+    def execute_main(self, sql, auto_begin=False, fetch=False,
+                     unique_id=None):
+        """Execute the main statement of a node, and record how long it took
+        in the connection manager's query latencies. Other statements, like
+        transaction control and metadata queries, say little about how busy
+        the warehouse is, so they are not recorded.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param bool fetch: If set, fetch results.
+        :param Optional[str] unique_id: The unique ID of the node the
+            statement belongs to.
+        :return: A tuple of the status and the results (empty if fetch=False).
+        :rtype: Tuple[str, agate.Table]
+        """
+        pre = time.time()
+        result = self.execute(sql, auto_begin=auto_begin, fetch=fetch)
+        self.connections.query_latencies.record(time.time() - pre, unique_id)
+        return result
+
     ###
     # Methods that should never be overridden
     ###
@@ -1,4 +1,5 @@
 from dbt.api import APIObject
+from dbt.api.object import trusted_construction
 from dbt.utils import filter_null_values
 from dbt.node_types import NodeType
 
@@ -109,14 +110,16 @@ class BaseRelation(APIObject):
 
         return exact_match
 
+    # these read the nested dicts without handing them out, so relations
+    # made with incorporate() can keep sharing them
     def get_path_part(self, part):
-        return self.path.get(part)
+        return self._peek('path', {}).get(part)
 
     def should_quote(self, part):
-        return self.quote_policy.get(part)
+        return self._peek('quote_policy', {}).get(part)
 
     def should_include(self, part):
-        return self.include_policy.get(part)
+        return self._peek('include_policy', {}).get(part)
 
     def quote(self, database=None, schema=None, identifier=None):
         policy = filter_null_values({
@@ -144,7 +147,7 @@ class BaseRelation(APIObject):
             'identifier': identifier is not None
         })
         quote_policy = filter_null_values({
-            'database': self.quote_policy['database'],
+            'database': self.should_quote('database'),
             'schema': False,
             'identifier': False,
         })
@@ -210,13 +213,14 @@ class BaseRelation(APIObject):
             source.quoting,
             kwargs.get('quote_policy', {})
         )
-        return cls.create(
-            database=source.database,
-            schema=source.schema,
-            identifier=source.identifier,
-            quote_policy=quote_policy,
-            **kwargs
-        )
+        with trusted_construction():
+            return cls.create(
+                database=source.database,
+                schema=source.schema,
+                identifier=source.identifier,
+                quote_policy=quote_policy,
+                **kwargs
+            )
 
     @classmethod
     def create_from_node(cls, config, node, table_name=None, quote_policy=None,
@@ -226,13 +230,14 @@ class BaseRelation(APIObject):
 
         quote_policy = dbt.utils.merge(config.quoting, quote_policy)
 
-        return cls.create(
-            database=node.get('database'),
-            schema=node.get('schema'),
-            identifier=node.get('alias'),
-            table_name=table_name,
-            quote_policy=quote_policy,
-            **kwargs)
+        with trusted_construction():
+            return cls.create(
+                database=node.get('database'),
+                schema=node.get('schema'),
+                identifier=node.get('alias'),
+                table_name=table_name,
+                quote_policy=quote_policy,
+                **kwargs)
 
     @classmethod
     def create_from(cls, config, node, **kwargs):
@@ -272,15 +277,15 @@ class BaseRelation(APIObject):
 
     @property
     def database(self):
-        return self.path.get('database')
+        return self.get_path_part('database')
 
     @property
     def schema(self):
-        return self.path.get('schema')
+        return self.get_path_part('schema')
 
     @property
     def identifier(self):
-        return self.path.get('identifier')
+        return self.get_path_part('identifier')
 
     # Here for compatibility with old Relation interface
     @property
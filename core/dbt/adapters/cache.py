@@ -295,6 +295,14 @@ class RelationsCache(object):
         with self.lock:
             self._add_link(referenced, dependent)
 
+    def _log_graph(self, message):
+        # dumping the whole graph is slow, so only do it when cache events
+        # are being logged
+        if logger.propagate or logger.handlers:
+            logger.debug('{}: {}'.format(
+                message, pprint.pformat(self.dump_graph()))
+            )
+
     def add(self, relation):
         """Add the relation inner to the cache, under the schema schema and
         identifier identifier
@@ -303,14 +311,10 @@ class RelationsCache(object):
         """
         cached = _CachedRelation(relation)
         logger.debug('Adding relation: {!s}'.format(cached))
-        logger.debug('before adding: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('before adding')
         with self.lock:
             self._setdefault(cached)
-        logger.debug('after adding: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('after adding')
 
     def _remove_refs(self, keys):
         """Removes all references to all entries in keys. This does not
@@ -433,9 +437,7 @@ class RelationsCache(object):
         logger.debug('Renaming relation {!s} to {!s}'.format(
             old_key, new_key)
         )
-        logger.debug('before rename: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('before rename')
 
         with self.lock:
             if self._check_rename_constraints(old_key, new_key):
@@ -443,9 +445,7 @@ class RelationsCache(object):
             else:
                 self._setdefault(_CachedRelation(new))
 
-        logger.debug('after rename: {}'.format(
-            pprint.pformat(self.dump_graph()))
-        )
+        self._log_graph('after rename')
 
     def get_relations(self, database, schema):
         """Case-insensitively yield all relations matching the given schema.
@@ -1,5 +1,6 @@
-from dbt.api.object import APIObject
+from dbt.api.object import APIObject, SlottedAPIObject
 
 __all__ = [
-    'APIObject'
+    'APIObject',
+    'SlottedAPIObject',
 ]
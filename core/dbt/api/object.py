@@ -1,10 +1,95 @@
 import copy
+import threading
 from collections import Mapping
+from contextlib import contextmanager
 from jsonschema import Draft4Validator
 
+from dbt.compat import basestring, NUMBERS
 from dbt.exceptions import JSONValidationException
 from dbt.utils import deep_merge
 from dbt.clients.system import write_json
+import dbt.flags
+
+
+# class -> (schema, validator, whether serialize() returns the contents)
+_VALIDATORS = {}
+
+_trusted = threading.local()
+
+_IMMUTABLE_TYPES = (basestring, bool, type(None)) + NUMBERS
+
+# the states of a value in an APIObject's contents, see APIObject.incorporate
+_SHARED = 'shared'
+_EXPOSED = 'exposed'
+
+
+@contextmanager
+def trusted_construction():
+    """Within this block, APIObjects created on the current thread are not
+    validated unless dbt is running in strict mode. Only use this when dbt
+    builds the objects itself from data that has already been validated.
+    """
+    previous = getattr(_trusted, 'active', False)
+    _trusted.active = True
+    try:
+        yield
+    finally:
+        _trusted.active = previous
+
+
+def _is_trusted():
+    return getattr(_trusted, 'active', False) and not dbt.flags.STRICT_MODE
+
+
+def _overrides(cls, name):
+    """Return True if a subclass of APIObject overrides the given method."""
+    for klass in cls.__mro__:
+        if klass is APIObject:
+            return False
+        if name in klass.__dict__:
+            return True
+    return False
+
+
+def _get_validator(cls):
+    cached = _VALIDATORS.get(cls)
+    if cached is not None and cached[0] is cls.SCHEMA:
+        return cached
+
+    plain_serialize = not _overrides(cls, 'serialize')
+    cached = (cls.SCHEMA, Draft4Validator(cls.SCHEMA), plain_serialize)
+    _VALIDATORS[cls] = cached
+    return cached
+
+
+def _merge_shared(base, updates):
+    """Merge the updates into base like deep_merge(base, updates), but only
+    build new dicts along the paths that the updates change. The values in
+    the updates are copied, and everything else is shared with base.
+
+    :return Tuple[dict, Set[str]]: The merged dict, and the keys of it whose
+        values share mutable objects with base.
+    """
+    merged = dict(base)
+    shared = {
+        k for k, v in base.items() if not isinstance(v, _IMMUTABLE_TYPES)
+    }
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            merged[key], nested = _merge_shared(merged.get(key, {}), value)
+        elif isinstance(value, (list, tuple)) and key in merged:
+            old = merged[key]
+            merged[key] = copy.deepcopy(list(value)) + list(old)
+            nested = any(not isinstance(v, _IMMUTABLE_TYPES) for v in old)
+        else:
+            merged[key] = copy.deepcopy(value)
+            nested = False
+
+        if nested:
+            shared.add(key)
+        else:
+            shared.discard(key)
+    return merged, shared
 
 
 class APIObject(Mapping):
@@ -19,6 +104,8 @@ class APIObject(Mapping):
     calls this constructor.
     """
 
+    __slots__ = ('_contents', '_sharing')
+
     SCHEMA = {
         'type': 'object',
         'properties': {}
@@ -35,7 +122,17 @@ class APIObject(Mapping):
         super(APIObject, self).__init__()
         # note: deep_merge does a deep copy on its arguments.
         self._contents = deep_merge(self.DEFAULTS, kwargs)
-        self.validate()
+        self._sharing = None
+        if not _is_trusted():
+            self.validate()
+
+    @classmethod
+    def from_trusted(cls, *args, **kwargs):
+        """Create an instance from data that dbt has already validated,
+        skipping validation outside of strict mode.
+        """
+        with trusted_construction():
+            return cls(*args, **kwargs)
 
     def __str__(self):
         return '{}(**{})'.format(self.__class__.__name__, self._contents)
@@ -53,8 +150,62 @@ class APIObject(Mapping):
         Given a list of kwargs, incorporate these arguments
         into a new copy of this instance, and return the new
         instance after validating.
+
+        Rather than copying all of the contents, the new instance shares the
+        values that the arguments don't change with this one. Each instance
+        tracks which of its mutable values are shared and copies them the
+        first time they are handed out, and values that were already handed
+        out are copied here, so changing one instance never changes the
+        other.
+        """
+        cls = type(self)
+        if _overrides(cls, '__init__'):
+            # the subclass may do more than store its arguments
+            return cls(**deep_merge(self._contents, kwargs))
+
+        base = self._contents
+        sharing = self._sharing
+        exposed = []
+        if sharing:
+            exposed = [k for k, v in sharing.items() if v == _EXPOSED]
+        if exposed:
+            base = dict(base)
+            for key in exposed:
+                base[key] = copy.deepcopy(base[key])
+
+        contents, shared = _merge_shared(base, kwargs)
+        shared.difference_update(exposed)
+        if shared:
+            if sharing is None:
+                sharing = self._sharing = {}
+            sharing.update(dict.fromkeys(shared, _SHARED))
+
+        # the contents already have the DEFAULTS merged in
+        new = cls.__new__(cls)
+        new._contents = contents
+        new._sharing = dict.fromkeys(shared, _SHARED) if shared else None
+        if not _is_trusted():
+            new.validate()
+        return new
+
+    def _peek(self, key, default=None):
+        """Get a value without handing it out, for reading inside the class.
+        The result may be shared with other instances and must not be changed
+        or kept.
         """
-        return type(self)(**deep_merge(self._contents, kwargs))
+        return self._contents.get(key, default)
+
+    def _hand_out(self, key):
+        value = self._contents[key]
+        if isinstance(value, _IMMUTABLE_TYPES):
+            return value
+        sharing = self._sharing
+        if sharing is None:
+            sharing = self._sharing = {}
+        if sharing.get(key) == _SHARED:
+            value = self._contents[key] = copy.deepcopy(value)
+        sharing[key] = _EXPOSED
+        return value
 
     def serialize(self):
         """
@@ -79,11 +230,18 @@ class APIObject(Mapping):
         of this instance. If any attributes are missing or
         invalid, raise a ValidationException.
         """
-        validator = Draft4Validator(self.SCHEMA)
+        _, validator, plain_serialize = _get_validator(type(self))
+
+        # validating doesn't modify the instance, so skip the deep copy in
+        # serialize() unless a subclass changes what it returns
+        if plain_serialize:
+            instance = self._contents
+        else:
+            instance = self.serialize()
 
         errors = set()  # make errors a set to avoid duplicates
 
-        for error in validator.iter_errors(self.serialize()):
+        for error in validator.iter_errors(instance):
             errors.add('.'.join(
                 list(map(str, error.path)) + [error.message]
             ))
@@ -94,7 +252,7 @@ class APIObject(Mapping):
     # implement the Mapping protocol:
     # https://docs.python.org/3/library/collections.abc.html
     def __getitem__(self, key):
-        return self._contents[key]
+        return self._hand_out(key)
 
     def __iter__(self):
         return self._contents.__iter__()
@@ -111,15 +269,146 @@ class APIObject(Mapping):
 
     def set(self, key, value):
         self._contents[key] = value
+        if self._sharing is not None:
+            self._sharing.pop(key, None)
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            self._hand_out(key)
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                try:
+                    # read the slot itself, in case a subclass replaces it
+                    # with a property
+                    state[name] = klass.__dict__[name].__get__(self)
+                except AttributeError:
+                    pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     # most users of APIObject also expect the attributes to be available via
     # dot-notation because the previous implementation assigned to __dict__.
     # we should consider removing this if we fix all uses to have properties.
     def __getattr__(self, name):
-        if name != '_contents' and name in self._contents:
-            return self._contents[name]
-        elif hasattr(self.__class__, name):
-            return getattr(self.__class__, name)
+        # the slots only get here when they haven't been set yet, e.g. while
+        # the instance is being copied
+        if name not in APIObject.__slots__:
+            try:
+                contents = object.__getattribute__(self, '_contents')
+            except AttributeError:
+                contents = {}
+            if name in contents:
+                return self._hand_out(name)
+            elif hasattr(self.__class__, name):
+                return getattr(self.__class__, name)
+        raise AttributeError((
+            "'{}' object has no attribute '{}'"
+        ).format(type(self).__name__, name))
+
+
+class SlottedAPIObject(APIObject):
+    """
+    An APIObject that stores each of its fields in a slot instead of a
+    dict, for objects that dbt creates many of, like graph nodes.
+
+    Subclasses list their fields in the FIELDS tuple and must declare
+    __slots__ for any fields and attributes their parents don't have, or
+    an empty __slots__ if there are none. Keys that are not fields are kept
+    in a dict that is only created when needed. Like the keys of an
+    APIObject's contents, fields that were never set are missing from the
+    mapping, and reading them as attributes raises AttributeError unless
+    they are in OPTIONAL_FIELDS, which read as None.
+    """
+    __slots__ = ('_extra',)
+
+    FIELDS = ()
+
+    OPTIONAL_FIELDS = frozenset()
+
+    def __init__(self, **kwargs):
+        # this replaces APIObject.__init__, which stores a dict of contents
+        self._extra = None
+        if self.DEFAULTS:
+            contents = deep_merge(self.DEFAULTS, kwargs)
+        else:
+            # the same as deep_merge({}, kwargs), which copies each level of
+            # nesting more than once
+            contents = copy.deepcopy(kwargs)
+        for key, value in contents.items():
+            self.set(key, value)
+        if not _is_trusted():
+            self.validate()
+
+    def incorporate(self, **kwargs):
+        # __init__ copies its arguments, so there's nothing to share
+        contents, _ = _merge_shared(self._contents, kwargs)
+        return type(self)(**contents)
+
+    def _peek(self, key, default=None):
+        return self.get(key, default)
+
+    @classmethod
+    def _field_set(cls):
+        field_set = cls.__dict__.get('_FIELD_SET')
+        if field_set is None:
+            field_set = frozenset(cls.FIELDS)
+            cls._FIELD_SET = field_set
+        return field_set
+
+    @property
+    def _contents(self):
+        """A new dict of the fields that are set and any other keys. The
+        values are not copied.
+        """
+        contents = {}
+        for name in self.FIELDS:
+            try:
+                contents[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        if self._extra:
+            contents.update(self._extra)
+        return contents
+
+    def __getitem__(self, key):
+        if key in self._field_set():
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._contents)
+
+    def __len__(self):
+        return len(self._contents)
+
+    def set(self, key, value):
+        if key in self._field_set():
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __getattr__(self, name):
+        # this is only called for unknown names and fields that aren't set
+        if name in self.OPTIONAL_FIELDS:
+            return None
+        try:
+            extra = object.__getattribute__(self, '_extra')
+        except AttributeError:
+            # while unpickling, before any slots are set
+            extra = None
+        if extra is not None and name in extra:
+            return extra[name]
         raise AttributeError((
             "'{}' object has no attribute '{}'"
         ).format(type(self).__name__, name))
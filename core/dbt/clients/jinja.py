@@ -7,6 +7,7 @@ import jinja2._compat
 import jinja2.ext
 import jinja2.nodes
 import jinja2.parser
+import jinja2.runtime
 import jinja2.sandbox
 
 import dbt.compat
@@ -33,7 +34,24 @@ class MacroFuzzParser(jinja2.parser.Parser):
         return node
 
 
+class MacroFuzzContext(jinja2.runtime.Context):
+    """A template context that looks up any name it can't find in the dbt
+    context it was created from, which jinja copies into a plain dict. That
+    context is a dbt.context.common.NodeContext, which binds macros as they
+    are first looked up, so they aren't in the copy until then.
+    """
+    def resolve_or_missing(self, key):
+        value = super(MacroFuzzContext, self).resolve_or_missing(key)
+        if value is jinja2.runtime.missing:
+            context = self.parent.get('context')
+            if isinstance(context, dict) and context is not self.parent:
+                value = context.get(key, jinja2.runtime.missing)
+        return value
+
+
 class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
+    context_class = MacroFuzzContext
+
     def _parse(self, source, name, filename):
         return MacroFuzzParser(
             self, source, name,
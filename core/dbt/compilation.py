@@ -1,6 +1,8 @@
 import itertools
+import multiprocessing
 import os
 import json
+import time
 from collections import OrderedDict, defaultdict
 import sqlparse
 
@@ -19,12 +21,13 @@ import dbt.exceptions
 import dbt.flags
 import dbt.loader
 import dbt.config
+from dbt.adapters.factory import get_adapter
 from dbt.contracts.graph.compiled import CompiledNode, CompiledGraph
 
 from dbt.clients.system import write_json
 from dbt.logger import GLOBAL_LOGGER as logger
 
-graph_file_name = 'graph.gpickle'
+graph_file_name = 'graph.bin'
 
 
 def print_compile_stats(stats):
@@ -116,7 +119,7 @@ class Compiler(object):
             'extra_ctes': [],
             'injected_sql': None,
         })
-        compiled_node = CompiledNode(**data)
+        compiled_node = CompiledNode.from_trusted(**data)
 
         context = dbt.context.runtime.generate(
             compiled_node, self.config, manifest)
@@ -159,10 +162,9 @@ class Compiler(object):
 
         return injected_node
 
-    def write_graph_file(self, linker, manifest):
-        filename = graph_file_name
-        graph_path = os.path.join(self.config.target_path, filename)
-        linker.write_graph(graph_path, manifest)
+    def write_graph_file(self, linker):
+        graph_path = os.path.join(self.config.target_path, graph_file_name)
+        linker.write_graph(graph_path)
 
     def link_node(self, linker, node, manifest):
         linker.add_node(node.unique_id)
@@ -196,8 +198,8 @@ class Compiler(object):
                 manifest.macros.items()):
             stats[node.resource_type] += 1
 
-        if write:
-            self.write_graph_file(linker, manifest)
+        if write and dbt.flags.WRITE_GRAPH:
+            self.write_graph_file(linker)
         print_compile_stats(stats)
 
         return linker
@@ -253,3 +255,154 @@ def _node_context(adapter, node):
         "run_started_at": dbt.tracking.active_user.run_started_at,
         "invocation_id": dbt.tracking.active_user.invocation_id,
     }
+
+
+# the config and manifest that compile worker processes compile against, and
+# the event that tells them the pool is closing. They are set while the pool
+# is open, so the workers, including any the pool starts to replace one that
+# died, inherit them instead of having them pickled.
+_COMPILE_WORKER_STATE = {}
+
+
+def _init_compile_worker():
+    # workers have no connections to the warehouse, and their copy of the
+    # relation cache goes stale as soon as nodes start running. Without the
+    # cache, compiling a node that needs to look at the warehouse fails, and
+    # the node is compiled by the thread that runs it instead.
+    dbt.flags.USE_CACHE = False
+    # multiprocessing locks are shared with the parent across the fork, so a
+    # worker that died holding one would deadlock the parent. Give the
+    # worker's adapter its own.
+    connections = get_adapter(_COMPILE_WORKER_STATE['config']).connections
+    connections.lock = multiprocessing.RLock()
+    connections.query_latencies.lock = multiprocessing.Lock()
+
+
+def _compile_ephemeral_parents(adapter, config, node, manifest):
+    """Compile the ephemeral models the node depends on into the manifest, so
+    that their CTEs can be injected into the node.
+    """
+    for unique_id in node.depends_on_nodes:
+        parent = manifest.nodes.get(unique_id)
+        if parent is None or not parent.is_ephemeral_model or \
+                parent.get('compiled'):
+            continue
+        _compile_ephemeral_parents(adapter, config, parent, manifest)
+        manifest.nodes[unique_id] = compile_node(adapter, config, parent,
+                                                 manifest, {})
+
+
+def _precompile_node(unique_id):
+    if _COMPILE_WORKER_STATE['closed'].is_set():
+        return None
+    try:
+        config = _COMPILE_WORKER_STATE['config']
+        manifest = _COMPILE_WORKER_STATE['manifest']
+        adapter = get_adapter(config)
+        node = manifest.nodes[unique_id]
+        _compile_ephemeral_parents(adapter, config, node, manifest)
+        compiled = compile_node(adapter, config, node, manifest, {})
+    except Exception as exc:
+        logger.debug('Could not compile "{}" ahead of time, it will be '
+                     'compiled when it runs: {}'.format(unique_id, exc))
+        return None
+    return compiled.serialize()
+
+
+class CompilePool(object):
+    """Compile nodes in worker processes ahead of when they run.
+
+    Rendering jinja is CPU-bound, so compiling in the threads that run nodes
+    serializes it on the GIL. The pool compiles in separate processes, and
+    the threads only wait on the result. Compiling ahead of time is best
+    effort: any node that fails to compile in a worker, including nodes that
+    query the warehouse while compiling, or that takes longer than `timeout`
+    seconds to come back, is compiled again when it runs.
+
+    :param RuntimeConfig config: The project config.
+    :param Manifest manifest: The manifest to compile against.
+    :param int processes: The number of worker processes.
+    """
+    # how long to wait for a node before compiling it in the caller instead,
+    # so that a worker that died doesn't hang the run
+    timeout = 60
+
+    def __init__(self, config, manifest, processes):
+        self._pending = {}
+        # every result, including those already waited on, for close()
+        self._results = []
+        self._pool = None
+
+        context = dbt.utils.fork_context()
+        if context is None:
+            logger.debug('Cannot fork on this platform, nodes will be '
+                         'compiled when they run')
+            return
+
+        self._closed = context.Event()
+        _COMPILE_WORKER_STATE.update(config=config, manifest=manifest,
+                                     closed=self._closed)
+        try:
+            self._pool = context.Pool(processes,
+                                      initializer=_init_compile_worker)
+        except Exception:
+            _COMPILE_WORKER_STATE.clear()
+            raise
+
+    def submit(self, unique_ids):
+        """Start compiling the given nodes, in order."""
+        if self._pool is None:
+            return
+        for unique_id in unique_ids:
+            result = self._pool.apply_async(_precompile_node, (unique_id,))
+            self._pending[unique_id] = result
+            self._results.append(result)
+
+    def get(self, unique_id):
+        """Wait for the given node to be compiled.
+
+        :param str unique_id: The node's unique ID.
+        :return Optional[CompiledNode]: The compiled node, or None if it
+            was not compiled ahead of time.
+        """
+        pending = self._pending.pop(unique_id, None)
+        if pending is None:
+            return None
+        try:
+            data = pending.get(self.timeout)
+        except multiprocessing.TimeoutError:
+            logger.debug('Timed out waiting for "{}" to compile ahead of '
+                         'time, it will be compiled when it runs'
+                         .format(unique_id))
+            return None
+        except Exception as exc:
+            logger.debug('Could not get "{}" from the compile processes, it '
+                         'will be compiled when it runs: {}'
+                         .format(unique_id, exc))
+            return None
+        if data is None:
+            return None
+        return CompiledNode.from_trusted(**data)
+
+    def close(self):
+        """Stop the workers. The nodes that have not started compiling are
+        skipped, and the workers exit once the nodes in progress are done.
+
+        They are only killed if that takes longer than the timeout, which
+        means a worker died or is stuck. A pool with a dead worker never
+        finishes joining. Each worker has its own adapter locks, so killing
+        it can't leave this process's locks held.
+        """
+        if self._pool is not None:
+            self._closed.set()
+            self._pool.close()
+            deadline = time.time() + self.timeout
+            for result in self._results:
+                result.wait(max(0, deadline - time.time()))
+            if not all(r.ready() for r in self._results):
+                self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            _COMPILE_WORKER_STATE.clear()
+        self._pending.clear()
+        self._results = []
@@ -147,7 +147,8 @@ class Project(object):
                  source_paths, macro_paths, data_paths, test_paths,
                  analysis_paths, docs_paths, target_path, clean_targets,
                  log_path, modules_path, quoting, models, on_run_start,
-                 on_run_end, archive, seeds, dbt_version, packages):
+                 on_run_end, archive, seeds, concurrency, dbt_version,
+                 packages):
         self.project_name = project_name
         self.version = version
         self.project_root = project_root
@@ -168,6 +169,7 @@ class Project(object):
         self.on_run_end = on_run_end
         self.archive = archive
         self.seeds = seeds
+        self.concurrency = concurrency
         self.dbt_version = dbt_version
         self.packages = packages
 
@@ -178,6 +180,7 @@ class Project(object):
         """
         handlers = {
             ('archive',): _list_if_none,
+            ('concurrency',): _dict_if_none,
             ('on-run-start',): _list_if_none_or_string,
             ('on-run-end',): _list_if_none_or_string,
         }
@@ -253,6 +256,7 @@ class Project(object):
         on_run_end = project_dict.get('on-run-end', [])
         archive = project_dict.get('archive', [])
         seeds = project_dict.get('seeds', {})
+        concurrency = project_dict.get('concurrency', {})
         dbt_raw_version = project_dict.get('require-dbt-version', '>=0.0.0')
 
         try:
@@ -283,6 +287,7 @@ class Project(object):
             on_run_end=on_run_end,
             archive=archive,
             seeds=seeds,
+            concurrency=concurrency,
             dbt_version=dbt_version,
             packages=packages
         )
@@ -329,6 +334,7 @@ class Project(object):
             'on-run-end': self.on_run_end,
             'archive': self.archive,
             'seeds': self.seeds,
+            'concurrency': self.concurrency,
             'require-dbt-version': [
                 v.to_version_string() for v in self.dbt_version
             ],
@@ -20,8 +20,8 @@ class RuntimeConfig(Project, Profile):
                  macro_paths, data_paths, test_paths, analysis_paths,
                  docs_paths, target_path, clean_targets, log_path,
                  modules_path, quoting, models, on_run_start, on_run_end,
-                 archive, seeds, dbt_version, profile_name, target_name,
-                 config, threads, credentials, packages, args):
+                 archive, seeds, concurrency, dbt_version, profile_name,
+                 target_name, config, threads, credentials, packages, args):
         # 'vars'
         self.args = args
         self.cli_vars = parse_cli_vars(getattr(args, 'vars', '{}'))
@@ -48,6 +48,7 @@ class RuntimeConfig(Project, Profile):
             on_run_end=on_run_end,
             archive=archive,
             seeds=seeds,
+            concurrency=concurrency,
             dbt_version=dbt_version,
             packages=packages
         )
@@ -96,6 +97,7 @@ class RuntimeConfig(Project, Profile):
             on_run_end=project.on_run_end,
             archive=project.archive,
             seeds=project.seeds,
+            concurrency=project.concurrency,
             dbt_version=project.dbt_version,
             packages=project.packages,
             profile_name=profile.profile_name,
@@ -1,5 +1,8 @@
+import collections
+from collections import Mapping
 import json
 import os
+import threading
 
 from dbt.adapters.factory import get_adapter
 from dbt.compat import basestring
@@ -77,56 +80,126 @@ class DatabaseWrapper(object):
         return self.adapter.commit_if_has_connection()
 
 
-def _add_macro_map(context, package_name, macro_map):
-    """Update an existing context in-place, adding the given macro map to the
-    appropriate package namespace. Adapter packages get inserted into the
-    global namespace.
+class MacroIndex(object):
+    """The macro generators of a manifest, by package and name, so that they
+    can be bound to each node's context without re-examining every macro.
     """
-    key = package_name
-    if package_name in PACKAGES:
-        key = GLOBAL_PROJECT_NAME
-    if key not in context:
-        context[key] = {}
+    def __init__(self, manifest):
+        self.packages = collections.OrderedDict()
+        # the macros in the global project space, which combines the
+        # packages in PACKAGES: the last one in the manifest wins
+        self.global_macros = {}
+        for macro in manifest.macros.values():
+            if macro.resource_type != NodeType.Macro:
+                continue
+            package_name = macro.package_name
+            generators = self.packages.setdefault(package_name, {})
+            generators[macro.name] = macro.generator
+            if package_name in PACKAGES:
+                self.global_macros[macro.name] = macro.generator
+        self.names = frozenset(self.global_macros).union(*(
+            generators for generators in self.packages.values()
+        ))
+
+
+class MacroNamespace(Mapping):
+    """The macros of a package, or of the global project space, bound to a
+    node's context as they are first looked up.
+    """
+    def __init__(self, generators, context):
+        self._generators = generators
+        self._context = context
+        self._bound = {}
 
-    context[key].update(macro_map)
+    def __getitem__(self, name):
+        macro = self._bound.get(name)
+        if macro is None:
+            macro = self._generators[name](self._context)
+            self._bound[name] = macro
+        return macro
 
+    def __contains__(self, name):
+        return name in self._generators
 
-def _add_macros(context, model, manifest):
-    macros_to_add = {'global': [], 'local': []}
+    def __iter__(self):
+        return iter(self._generators)
 
-    for unique_id, macro in manifest.macros.items():
-        if macro.resource_type != NodeType.Macro:
-            continue
-        package_name = macro.package_name
+    def __len__(self):
+        return len(self._generators)
 
-        macro_map = {
-            macro.name: macro.generator(context)
-        }
 
-        # adapter packages are part of the global project space
-        _add_macro_map(context, package_name, macro_map)
+class NodeContext(dict):
+    """The context of a node. Macros are not bound to it up front, as most
+    nodes call only a few of the hundreds of macros in a project: a macro
+    that is looked up and not otherwise in the context is bound then, from
+    the node's package, or else the global project space.
 
-        if package_name == model.package_name:
-            macros_to_add['local'].append(macro_map)
-        elif package_name in PACKAGES:
-            macros_to_add['global'].append(macro_map)
+    Jinja copies the context into its own dict, so the template context
+    class in dbt.clients.jinja looks up names it can't find in the copy in
+    the context's 'context' entry, which is this.
+    """
+    def __init__(self, *args, **kwargs):
+        super(NodeContext, self).__init__(*args, **kwargs)
+        self.macro_namespaces = ()
+
+    def __missing__(self, key):
+        for namespace in self.macro_namespaces:
+            if key in namespace:
+                value = namespace[key]
+                self[key] = value
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return (super(NodeContext, self).__contains__(key) or
+                any(key in n for n in self.macro_namespaces))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
-    # Load global macros before local macros -- local takes precedence
-    unprefixed_macros = macros_to_add['global'] + macros_to_add['local']
-    for macro_map in unprefixed_macros:
-        context.update(macro_map)
+
+def _add_macros(context, model, macro_index):
+    namespaces = {
+        package_name: MacroNamespace(generators, context)
+        for package_name, generators in macro_index.packages.items()
+    }
+    global_namespace = MacroNamespace(macro_index.global_macros, context)
+
+    # adapter packages are part of the global project space
+    for package_name, namespace in namespaces.items():
+        if package_name not in PACKAGES:
+            context[package_name] = namespace
+    context[GLOBAL_PROJECT_NAME] = global_namespace
+
+    # local takes precedence over global
+    local_namespace = namespaces.get(model.package_name)
+    if local_namespace is None:
+        context.macro_namespaces = (global_namespace,)
+    else:
+        context.macro_namespaces = (local_namespace, global_namespace)
+
+    # macros replace what's already in the context, so those can't wait
+    # until they're looked up
+    for key in macro_index.names.intersection(context):
+        for namespace in context.macro_namespaces:
+            if key in namespace:
+                context[key] = namespace[key]
+                break
 
     return context
 
 
 def _add_tracking(context):
     if dbt.tracking.active_user is not None:
-        context = dbt.utils.merge(context, {
+        context.update({
             "run_started_at": dbt.tracking.active_user.run_started_at,
             "invocation_id": dbt.tracking.active_user.invocation_id,
         })
     else:
-        context = dbt.utils.merge(context, {
+        context.update({
             "run_started_at": None,
             "invocation_id": None
         })
@@ -151,12 +224,17 @@ def _add_validation(context):
         'any': validate_any,
     })
 
-    return dbt.utils.merge(
-        context,
-        {'validation': validation_utils})
+    context['validation'] = validation_utils
+    return context
+
+
+# the names of the environment variables that have been read with env_var(),
+# which the parse cache checks for changes
+ENV_VARS_READ = set()
 
 
 def env_var(var, default=None):
+    ENV_VARS_READ.add(var)
     if var in os.environ:
         return os.environ[var]
     elif default is not None:
@@ -190,11 +268,12 @@ def _load_result(sql_results):
 
 def _add_sql_handlers(context):
     sql_results = {}
-    return dbt.utils.merge(context, {
+    context.update({
         '_sql_results': sql_results,
         'store_result': _store_result(sql_results),
         'load_result': _load_result(sql_results),
     })
+    return context
 
 
 def log(msg, info=False):
@@ -349,85 +428,154 @@ def get_datetime_module_context():
     }
 
 
-def generate_base(model, model_dict, config, manifest, source_config,
-                  provider, adapter=None):
-    """Generate the common aspects of the config dict."""
-    if provider is None:
-        raise dbt.exceptions.InternalException(
-            "Invalid provider given to context: {}".format(provider))
+class ContextFactory(object):
+    """Builds the contexts of nodes for a given config, manifest and provider.
 
-    target_name = config.target_name
-    target = config.to_profile_info()
-    del target['credentials']
-    target.update(config.credentials.serialize(with_aliases=True))
-    target['type'] = config.credentials.type
-    target.pop('pass', None)
-    target['name'] = target_name
-
-    adapter = get_adapter(config)
-
-    context = {'env': target}
-
-    pre_hooks = None
-    post_hooks = None
-
-    db_wrapper = DatabaseWrapper(adapter)
-
-    context = dbt.utils.merge(context, {
-        "adapter": db_wrapper,
-        "api": {
-            "Relation": db_wrapper.Relation,
-            "Column": adapter.Column,
-        },
-        "column": adapter.Column,
-        "config": provider.Config(model_dict, source_config),
-        "database": config.credentials.database,
-        "env_var": env_var,
-        "exceptions": dbt.exceptions.wrapped_exports(model),
-        "execute": provider.execute,
-        "flags": dbt.flags,
-        # TODO: Do we have to leave this in?
-        "graph": manifest.to_flat_graph(),
-        "log": log,
-        "model": model_dict,
-        "modules": {
-            "pytz": get_pytz_module_context(),
-            "datetime": get_datetime_module_context(),
-        },
-        "post_hooks": post_hooks,
-        "pre_hooks": pre_hooks,
-        "ref": provider.ref(db_wrapper, model, config, manifest),
-        "return": _return,
-        "schema": config.credentials.schema,
-        "sql": None,
-        "sql_now": adapter.date_function(),
-        "source": provider.source(db_wrapper, model, config, manifest),
-        "fromjson": fromjson,
-        "tojson": tojson,
-        "target": target,
-        "try_or_compiler_error": try_or_compiler_error(model)
-    })
+    Most of the context is the same for every node, so it is built once, and
+    each node's context starts as a shallow copy of it with the node's own
+    values added on top. The macros are listed once as well, and only bound
+    to a node's context when the node looks them up.
 
-    return context
+    Each manifest keeps its own factories, see `get_context_factory`.
+
+    The dicts in the base context can be changed from jinja, e.g. with
+    `target.update(...)`, so each node gets its own copy of them, and one
+    node's changes don't leak into the next node's context.
+    """
+    def __init__(self, config, manifest, provider):
+        self.config = config
+        self.manifest = manifest
+        self.provider = provider
+        self.adapter = get_adapter(config)
+        self.db_wrapper = DatabaseWrapper(self.adapter)
+        self.base = self._build_base()
+        self._macro_index = None
+
+    def matches(self, config, manifest, provider):
+        return (self.config is config and self.manifest is manifest and
+                self.provider is provider)
+
+    def _build_base(self):
+        config = self.config
+        adapter = self.adapter
+
+        target_name = config.target_name
+        target = config.to_profile_info()
+        del target['credentials']
+        target.update(config.credentials.serialize(with_aliases=True))
+        target['type'] = config.credentials.type
+        target.pop('pass', None)
+        target['name'] = target_name
+
+        base = {
+            "env": target,
+            "adapter": self.db_wrapper,
+            "api": {
+                "Relation": self.db_wrapper.Relation,
+                "Column": adapter.Column,
+            },
+            "column": adapter.Column,
+            "database": config.credentials.database,
+            "env_var": env_var,
+            "execute": self.provider.execute,
+            "flags": dbt.flags,
+            # TODO: Do we have to leave this in?
+            "graph": self.manifest.flat_graph(),
+            "log": log,
+            "modules": {
+                "pytz": get_pytz_module_context(),
+                "datetime": get_datetime_module_context(),
+            },
+            "post_hooks": None,
+            "pre_hooks": None,
+            "return": _return,
+            "schema": config.credentials.schema,
+            "sql": None,
+            "sql_now": adapter.date_function(),
+            "fromjson": fromjson,
+            "tojson": tojson,
+            "target": target,
+        }
+        return _add_validation(base)
+
+    @property
+    def macro_index(self):
+        if self._macro_index is None:
+            self._macro_index = MacroIndex(self.manifest)
+        return self._macro_index
+
+    def generate_base(self, model, model_dict, source_config):
+        """Generate the common aspects of the config dict."""
+        provider = self.provider
+        base = self.base
+        context = NodeContext(base)
+        # 'env' and 'target' are the same dict
+        target = dict(base['target'])
+        context.update({
+            "env": target,
+            "target": target,
+            "api": dict(base['api']),
+            "modules": {
+                name: dict(module) for name, module in base['modules'].items()
+            },
+            "validation": dbt.utils.AttrDict(base['validation']),
+            "config": provider.Config(model_dict, source_config),
+            "exceptions": dbt.exceptions.wrapped_exports(model),
+            "model": model_dict,
+            "ref": provider.ref(self.db_wrapper, model, self.config,
+                                self.manifest),
+            "source": provider.source(self.db_wrapper, model, self.config,
+                                      self.manifest),
+            "try_or_compiler_error": try_or_compiler_error(model),
+        })
+        return context
 
+    def modify_generated_context(self, context, model, model_dict):
+        context = _add_tracking(context)
+        context = _add_sql_handlers(context)
+        context = _add_macros(context, model, self.macro_index)
 
-def modify_generated_context(context, model, model_dict, config, manifest):
-    cli_var_overrides = config.cli_vars
+        context["write"] = write(model_dict, self.config.target_path, 'run')
+        context["render"] = render(context, model_dict)
+        context["var"] = Var(model, context=context,
+                             overrides=self.config.cli_vars)
+        context['context'] = context
 
-    context = _add_tracking(context)
-    context = _add_validation(context)
-    context = _add_sql_handlers(context)
+        return context
 
-    # we make a copy of the context for each of these ^^
 
-    context = _add_macros(context, model, manifest)
+_CONTEXT_FACTORY_LOCK = threading.Lock()
 
-    context["write"] = write(model_dict, config.target_path, 'run')
-    context["render"] = render(context, model_dict)
-    context["var"] = Var(model, context=context, overrides=cli_var_overrides)
-    context['context'] = context
 
-    return context
+def get_context_factory(config, manifest, provider):
+    """Get the factory for contexts of the given manifest's nodes. It's kept
+    on the manifest, one for each provider, so it lives as long as the
+    manifest does, and contexts for different manifests, like the internal
+    manifest that adapters execute macros from, don't replace each other's.
+    """
+    with _CONTEXT_FACTORY_LOCK:
+        factory = manifest._context_factories.get(provider)
+        if factory is None or not factory.matches(config, manifest, provider):
+            factory = ContextFactory(config, manifest, provider)
+            manifest._context_factories[provider] = factory
+    return factory
+
+
+def generate_base(model, model_dict, config, manifest, source_config,
+                  provider, adapter=None):
+    """Generate the common aspects of the config dict."""
+    if provider is None:
+        raise dbt.exceptions.InternalException(
+            "Invalid provider given to context: {}".format(provider))
+
+    factory = get_context_factory(config, manifest, provider)
+    return factory.generate_base(model, model_dict, source_config)
+
+
+def modify_generated_context(context, model, model_dict, config, manifest,
+                             provider):
+    factory = get_context_factory(config, manifest, provider)
+    return factory.modify_generated_context(context, model, model_dict)
 
 
 def generate_execute_macro(model, config, manifest, provider):
@@ -443,7 +591,7 @@ def generate_execute_macro(model, config, manifest, provider):
                             provider)
 
     return modify_generated_context(context, model, model_dict, config,
-                                    manifest)
+                                    manifest, provider)
 
 
 def generate_model(model, config, manifest, source_config, provider):
@@ -464,7 +612,7 @@ def generate_model(model, config, manifest, source_config, provider):
     })
 
     return modify_generated_context(context, model, model_dict, config,
-                                    manifest)
+                                    manifest, provider)
 
 
 def generate(model, config, manifest, source_config=None, provider=None):
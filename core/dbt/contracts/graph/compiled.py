@@ -173,54 +173,25 @@ def _inject_ctes_into_sql(sql, ctes):
     return dbt.compat.to_string(parsed)
 
 
+COMPILED_FIELDS = ('compiled', 'compiled_sql', 'extra_ctes_injected',
+                   'extra_ctes', 'injected_sql', 'wrapped_sql')
+
+
 class CompiledNode(ParsedNode):
     SCHEMA = COMPILED_NODE_CONTRACT
+    FIELDS = ParsedNode.FIELDS + COMPILED_FIELDS
+    OPTIONAL_FIELDS = ParsedNode.OPTIONAL_FIELDS | frozenset(COMPILED_FIELDS)
+    __slots__ = COMPILED_FIELDS
 
     def prepend_ctes(self, prepended_ctes):
-        self._contents['extra_ctes_injected'] = True
-        self._contents['extra_ctes'] = prepended_ctes
-        self._contents['injected_sql'] = _inject_ctes_into_sql(
+        self.extra_ctes_injected = True
+        self.extra_ctes = prepended_ctes
+        self.injected_sql = _inject_ctes_into_sql(
             self.compiled_sql,
             prepended_ctes
         )
         self.validate()
 
-    @property
-    def extra_ctes_injected(self):
-        return self._contents.get('extra_ctes_injected')
-
-    @property
-    def extra_ctes(self):
-        return self._contents.get('extra_ctes')
-
-    @property
-    def compiled(self):
-        return self._contents.get('compiled')
-
-    @compiled.setter
-    def compiled(self, value):
-        self._contents['compiled'] = value
-
-    @property
-    def injected_sql(self):
-        return self._contents.get('injected_sql')
-
-    @property
-    def compiled_sql(self):
-        return self._contents.get('compiled_sql')
-
-    @compiled_sql.setter
-    def compiled_sql(self, value):
-        self._contents['compiled_sql'] = value
-
-    @property
-    def wrapped_sql(self):
-        return self._contents.get('wrapped_sql')
-
-    @wrapped_sql.setter
-    def wrapped_sql(self, value):
-        self._contents['wrapped_sql'] = value
-
     def set_cte(self, cte_id, sql):
         """This is the equivalent of what self.extra_ctes[cte_id] = sql would
         do if extra_ctes were an OrderedDict
@@ -1,4 +1,7 @@
+from collections import Mapping
+
 from dbt.api import APIObject
+from dbt.api.object import trusted_construction
 from dbt.contracts.graph.unparsed import UNPARSED_NODE_CONTRACT
 from dbt.contracts.graph.parsed import PARSED_NODE_CONTRACT, \
     PARSED_MACRO_CONTRACT, PARSED_DOCUMENTATION_CONTRACT, \
@@ -140,6 +143,7 @@ PARSED_MANIFEST_CONTRACT = {
 
 class CompileResultNode(CompiledNode):
     SCHEMA = COMPILE_RESULT_NODE_CONTRACT
+    __slots__ = ()
 
 
 def _sort_values(dct):
@@ -164,6 +168,64 @@ def build_edges(nodes):
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
+class _ShallowDictView(Mapping):
+    """A read-only view of a dict of nodes that converts each node to a
+    shallow dict the first time it is read.
+
+    The dicts are cached until the node is replaced in the dict of nodes, or
+    invalidate() is called for it. Code that changes the fields of a node in
+    place must call invalidate().
+    """
+    def __init__(self, nodes):
+        self._nodes = nodes
+        # unique ID -> (the node, its shallow dict)
+        self._cache = {}
+
+    def __getitem__(self, key):
+        node = self._nodes[key]
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is node:
+            return cached[1]
+        result = node.to_shallow_dict()
+        self._cache[key] = (node, result)
+        return result
+
+    def invalidate(self, key):
+        self._cache.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class FlatGraph(Mapping):
+    """A read-only view of the manifest as the 'flat graph' returned by
+    Manifest.to_flat_graph. Nothing is copied until it is read, and reads
+    always reflect the current nodes of the manifest.
+    """
+    def __init__(self, manifest):
+        self._nodes = _ShallowDictView(manifest.nodes)
+        self._contents = {
+            'nodes': self._nodes,
+            'macros': manifest.macros,
+        }
+
+    def invalidate(self, unique_id):
+        """Forget the cached dict of the given node, after it changed."""
+        self._nodes.invalidate(unique_id)
+
+    def __getitem__(self, key):
+        return self._contents[key]
+
+    def __iter__(self):
+        return iter(self._contents)
+
+    def __len__(self):
+        return len(self._contents)
+
+
 class Manifest(APIObject):
     SCHEMA = PARSED_MANIFEST_CONTRACT
     """The manifest for the full graph, after parsing and during compilation.
@@ -186,8 +248,77 @@ class Manifest(APIObject):
         self.generated_at = generated_at
         self.metadata = metadata
         self.disabled = disabled
+        self._flat_graph = None
+        # the ContextFactory of each context provider, see
+        # dbt.context.common.get_context_factory
+        self._context_factories = {}
+        self._build_indexes()
         super(Manifest, self).__init__()
 
+    def _build_indexes(self):
+        """Build the inverted indexes of node IDs by tag, resource type and
+        source name, and of node, macro and doc IDs by name. add_nodes,
+        add_macros and patch_nodes keep them up to date. The index of node IDs
+        by relation is built when it is first needed.
+        """
+        self._ids_by_tag = {}
+        self._ids_by_resource_type = {}
+        self._ids_by_source_name = {}
+        self._node_ids_by_name = {}
+        self._macro_ids_by_name = {}
+        self._doc_ids_by_name = {}
+        self._ids_by_relation = None
+        for unique_id, node in self.nodes.items():
+            self._index_node(unique_id, node)
+            self._index_name(self._node_ids_by_name, unique_id, node)
+        for unique_id, macro in self.macros.items():
+            self._index_name(self._macro_ids_by_name, unique_id, macro)
+        for unique_id, doc in self.docs.items():
+            self._index_doc(unique_id, doc)
+
+    @staticmethod
+    def _index_name(index, unique_id, node):
+        # IDs are kept in insertion order, so that lookups in any package
+        # find the same node a scan of the subgraph would
+        _, _, name = dbt.utils.split_unique_id(unique_id, node)
+        ids = index.setdefault(name, [])
+        if unique_id not in ids:
+            ids.append(unique_id)
+
+    def _index_doc(self, unique_id, doc):
+        parts = unique_id.split('.')
+        if len(parts) != 2:
+            msg = "documentation names cannot contain '.' characters"
+            dbt.exceptions.raise_compiler_error(msg, doc)
+        self._doc_ids_by_name.setdefault(parts[1], []).append(unique_id)
+
+    def _index_keys(self, node):
+        keys = [(self._ids_by_resource_type, node.resource_type)]
+        keys.extend((self._ids_by_tag, tag) for tag in node.tags)
+        if node.resource_type == NodeType.Source:
+            keys.append((self._ids_by_source_name, node.source_name))
+        return keys
+
+    def _index_node(self, unique_id, node):
+        for index, key in self._index_keys(node):
+            index.setdefault(key, set()).add(unique_id)
+
+    def _unindex_node(self, unique_id, node):
+        for index, key in self._index_keys(node):
+            index.get(key, set()).discard(unique_id)
+
+    def get_unique_ids_by_tag(self, tag):
+        """Get the IDs of all nodes with the given tag."""
+        return frozenset(self._ids_by_tag.get(tag, ()))
+
+    def get_unique_ids_by_resource_type(self, resource_type):
+        """Get the IDs of all nodes of the given resource type."""
+        return frozenset(self._ids_by_resource_type.get(resource_type, ()))
+
+    def get_unique_ids_by_source_name(self, source_name):
+        """Get the IDs of all source definitions for the given source."""
+        return frozenset(self._ids_by_source_name.get(source_name, ()))
+
     @staticmethod
     def get_metadata(config):
         project_id = None
@@ -237,29 +368,26 @@ class Manifest(APIObject):
         """
         if subgraph == 'nodes':
             search = self.nodes
+            index = self._node_ids_by_name
         elif subgraph == 'macros':
             search = self.macros
+            index = self._macro_ids_by_name
         else:
             raise NotImplementedError(
                 'subgraph search for {} not implemented'.format(subgraph)
             )
-        return dbt.utils.find_in_subgraph_by_name(
-            search,
-            name,
-            package,
-            nodetype)
+        for unique_id in index.get(name, ()):
+            model = search[unique_id]
+            if dbt.utils.id_matches(unique_id, name, package, nodetype,
+                                    model):
+                return model
+        return None
 
     def find_docs_by_name(self, name, package=None):
-        for unique_id, doc in self.docs.items():
-            parts = unique_id.split('.')
-            if len(parts) != 2:
-                msg = "documentation names cannot contain '.' characters"
-                dbt.exceptions.raise_compiler_error(msg, doc)
-
-            found_package, found_node = parts
-
-            if (name == found_node and package in {None, found_package}):
-                return doc
+        for unique_id in self._doc_ids_by_name.get(name, ()):
+            found_package = unique_id.split('.')[0]
+            if package in {None, found_package}:
+                return self.docs[unique_id]
         return None
 
     def find_macro_by_name(self, name, package):
@@ -315,25 +443,17 @@ class Manifest(APIObject):
 
         return resource_fqns
 
-    def _filter_subgraph(self, subgraph, predicate):
-        """
-        Given a subgraph of the manifest, and a predicate, filter
-        the subgraph using that predicate. Generates a list of nodes.
-        """
-        to_return = []
-
-        for unique_id, item in subgraph.items():
-            if predicate(item):
-                to_return.append(item)
-
-        return to_return
+    @staticmethod
+    def _relation_key(node):
+        if node.resource_type == NodeType.Source:
+            name = node.identifier
+        else:
+            name = node.alias
+        return (node.schema.lower(), name.lower())
 
-    def _model_matches_schema_and_table(self, schema, table, model):
-        if model.resource_type == NodeType.Source:
-            return (model.schema.lower() == schema.lower() and
-                    model.identifier.lower() == table.lower())
-        return (model.schema.lower() == schema.lower() and
-                model.alias.lower() == table.lower())
+    def _index_relation(self, unique_id, node):
+        key = self._relation_key(node)
+        self._ids_by_relation.setdefault(key, []).append(unique_id)
 
     def get_unique_ids_for_schema_and_table(self, schema, table):
         """
@@ -341,11 +461,14 @@ class Manifest(APIObject):
         their unique_ids. A schema and table may have more than one
         match if the relation matches both a source and a seed, for instance.
         """
-        def predicate(model):
-            return self._model_matches_schema_and_table(schema, table, model)
+        # only docs generation needs this, so build the index on first use
+        if self._ids_by_relation is None:
+            self._ids_by_relation = {}
+            for unique_id, node in self.nodes.items():
+                self._index_relation(unique_id, node)
 
-        matching = list(self._filter_subgraph(self.nodes, predicate))
-        return [match.get('unique_id') for match in matching]
+        key = (schema.lower(), table.lower())
+        return list(self._ids_by_relation.get(key, ()))
 
     def add_nodes(self, new_nodes):
         """Add the given dict of new nodes to the manifest."""
@@ -353,6 +476,19 @@ class Manifest(APIObject):
             if unique_id in self.nodes:
                 raise_duplicate_resource_name(node, self.nodes[unique_id])
             self.nodes[unique_id] = node
+            self._invalidate_flat_graph(unique_id)
+            self._index_node(unique_id, node)
+            self._index_name(self._node_ids_by_name, unique_id, node)
+            if self._ids_by_relation is not None:
+                self._index_relation(unique_id, node)
+
+    def add_macros(self, new_macros):
+        """Add the given dict of macros to the manifest, replacing any
+        existing macros with the same IDs.
+        """
+        for unique_id, macro in new_macros.items():
+            self.macros[unique_id] = macro
+            self._index_name(self._macro_ids_by_name, unique_id, macro)
 
     def patch_nodes(self, patches):
         """Patch nodes with the given dict of patches. Note that this consumes
@@ -362,13 +498,16 @@ class Manifest(APIObject):
         # only have the node name in the patch, we have to iterate over all the
         # nodes looking for matching names. We could use _find_by_name if we
         # were ok with doing an O(n*m) search (one nodes scan per patch)
-        for node in self.nodes.values():
+        for unique_id, node in self.nodes.items():
             if node.resource_type != NodeType.Model:
                 continue
             patch = patches.pop(node.name, None)
             if not patch:
                 continue
+            self._unindex_node(unique_id, node)
             node.patch(patch)
+            self._invalidate_flat_graph(unique_id)
+            self._index_node(unique_id, node)
 
         # log debug-level warning about nodes we couldn't find
         if patches:
@@ -396,6 +535,18 @@ class Manifest(APIObject):
             'macros': self.macros,
         }
 
+    def flat_graph(self):
+        """Get a lazy, read-only view of the manifest that looks like the
+        result of to_flat_graph. The same view is returned on every call.
+        """
+        if self._flat_graph is None:
+            self._flat_graph = FlatGraph(self)
+        return self._flat_graph
+
+    def _invalidate_flat_graph(self, unique_id):
+        if self._flat_graph is not None:
+            self._flat_graph.invalidate(unique_id)
+
     def __getattr__(self, name):
         raise AttributeError("'{}' object has no attribute '{}'".format(
             type(self).__name__, name)
@@ -412,11 +563,13 @@ class Manifest(APIObject):
         return frozenset(node.database for node in self.nodes.values())
 
     def deepcopy(self, config=None):
-        return Manifest(
-            nodes={k: v.incorporate() for k, v in self.nodes.items()},
-            macros={k: v.incorporate() for k, v in self.macros.items()},
-            docs={k: v.incorporate() for k, v in self.docs.items()},
-            generated_at=self.generated_at,
-            disabled=[n.incorporate() for n in self.disabled],
-            config=config
-        )
+        # everything in this manifest was validated when it was added
+        with trusted_construction():
+            return Manifest(
+                nodes={k: v.incorporate() for k, v in self.nodes.items()},
+                macros={k: v.incorporate() for k, v in self.macros.items()},
+                docs={k: v.incorporate() for k, v in self.docs.items()},
+                generated_at=self.generated_at,
+                disabled=[n.incorporate() for n in self.disabled],
+                config=config
+            )
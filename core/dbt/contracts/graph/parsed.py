@@ -1,4 +1,4 @@
-from dbt.api import APIObject
+from dbt.api import APIObject, SlottedAPIObject
 from dbt.utils import deep_merge
 from dbt.node_types import NodeType
 
@@ -342,8 +342,11 @@ PARSED_NODE_CONTRACT = deep_merge(
 )
 
 
-class ParsedNode(APIObject):
+class ParsedNode(SlottedAPIObject):
     SCHEMA = PARSED_NODE_CONTRACT
+    FIELDS = tuple(PARSED_NODE_CONTRACT['properties'])
+    OPTIONAL_FIELDS = frozenset(['build_path'])
+    __slots__ = FIELDS + ('agate_table',)
 
     def __init__(self, agate_table=None, **kwargs):
         self.agate_table = agate_table
@@ -384,7 +387,7 @@ class ParsedNode(APIObject):
         return ret
 
     def to_shallow_dict(self):
-        ret = self._contents.copy()
+        ret = self._contents
         ret['agate_table'] = self.agate_table
         return ret
 
@@ -392,58 +395,16 @@ class ParsedNode(APIObject):
         """Given a ParsedNodePatch, add the new information to the node."""
         # explicitly pick out the parts to update so we don't inadvertently
         # step on the model name or anything
-        self._contents.update({
-            'patch_path': patch.original_file_path,
-            'description': patch.description,
-            'columns': patch.columns,
-            'docrefs': patch.docrefs,
-        })
+        self.patch_path = patch.original_file_path
+        self.description = patch.description
+        self.columns = patch.columns
+        self.docrefs = patch.docrefs
         # patches always trigger re-validation
         self.validate()
 
     def get_materialization(self):
         return self.config.get('materialized')
 
-    @property
-    def build_path(self):
-        return self._contents.get('build_path')
-
-    @build_path.setter
-    def build_path(self, value):
-        self._contents['build_path'] = value
-
-    @property
-    def database(self):
-        return self._contents['database']
-
-    @database.setter
-    def database(self, value):
-        self._contents['database'] = value
-
-    @property
-    def schema(self):
-        return self._contents['schema']
-
-    @schema.setter
-    def schema(self, value):
-        self._contents['schema'] = value
-
-    @property
-    def alias(self):
-        return self._contents['alias']
-
-    @alias.setter
-    def alias(self, value):
-        self._contents['alias'] = value
-
-    @property
-    def config(self):
-        return self._contents['config']
-
-    @config.setter
-    def config(self, value):
-        self._contents['config'] = value
-
 
 # The parsed node update is only the 'patch', not the test. The test became a
 # regular parsed node. Note that description and columns must be present, but
@@ -707,12 +668,14 @@ PARSED_SOURCE_DEFINITION_CONTRACT = deep_merge(
 )
 
 
-class ParsedSourceDefinition(APIObject):
+class ParsedSourceDefinition(SlottedAPIObject):
     SCHEMA = PARSED_SOURCE_DEFINITION_CONTRACT
+    FIELDS = tuple(PARSED_SOURCE_DEFINITION_CONTRACT['properties'])
+    __slots__ = FIELDS
     is_ephemeral_model = False
 
     def to_shallow_dict(self):
-        return self._contents.copy()
+        return self._contents
 
     # provide some emtpy/meaningless properties so these look more like
     # ParsedNodes
@@ -33,6 +33,28 @@ ARCHIVE_CONFIG_CONTRACT = {
 }
 
 
+CONCURRENCY_LIMITS_CONTRACT = {
+    'type': 'object',
+    'description': 'A mapping of names to the maximum number of nodes that '
+                   'may run at once',
+    'additionalProperties': {
+        'type': 'integer',
+        'minimum': 1,
+    },
+}
+
+
+CONCURRENCY_CONFIG_CONTRACT = {
+    'type': 'object',
+    'additionalProperties': False,
+    'properties': {
+        'tags': CONCURRENCY_LIMITS_CONTRACT,
+        'schemas': CONCURRENCY_LIMITS_CONTRACT,
+        'materializations': CONCURRENCY_LIMITS_CONTRACT,
+    },
+}
+
+
 PROJECT_CONTRACT = {
     'type': 'object',
     'description': 'The project configuration.',
@@ -142,6 +164,7 @@ PROJECT_CONTRACT = {
             'type': 'object',
             'additionalProperties': True,
         },
+        'concurrency': CONCURRENCY_CONFIG_CONTRACT,
         # we validate the regex separately, using the pattern in dbt.semver
         'require-dbt-version': {
             'type': ['string', 'array'],
@@ -216,7 +216,31 @@ EXECUTION_RESULT_CONTRACT = {
                 'The time elapsed from before_run to after_run (hooks are not '
                 'included)'
             ),
-        }
+        },
+        'concurrency': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'additionalProperties': False,
+                'properties': {
+                    'elapsed': {
+                        'type': 'number',
+                        'description': (
+                            'The time since nodes started running, in seconds'
+                        ),
+                    },
+                    'threads': {
+                        'type': 'integer',
+                        'description': 'The number of threads from then on',
+                    },
+                },
+                'required': ['elapsed', 'threads'],
+            },
+            'description': (
+                'When adaptive threads are enabled, each change to the '
+                'number of threads in use'
+            ),
+        },
     },
     'required': ['results', 'generated_at', 'elapsed_time'],
 }
@@ -226,11 +250,14 @@ class ExecutionResult(APIObject):
     SCHEMA = EXECUTION_RESULT_CONTRACT
 
     def serialize(self):
-        return {
+        result = {
             'results': [r.serialize() for r in self.results],
             'generated_at': self.generated_at,
             'elapsed_time': self.elapsed_time,
         }
+        if 'concurrency' in self._contents:
+            result['concurrency'] = self.concurrency
+        return result
 
 
 SOURCE_FRESHNESS_RESULT_CONTRACT = deep_merge(PARTIAL_RESULT_CONTRACT, {
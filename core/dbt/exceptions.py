@@ -1,6 +1,7 @@
 import sys
 import six
 import functools
+from collections import Mapping
 
 from dbt.compat import builtins
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -670,8 +671,27 @@ def wrapper(model):
     return wrap
 
 
+class WrappedExports(Mapping):
+    """The context exports, wrapped to attach the given model to the
+    exceptions they raise. Each export is only wrapped when it's first used.
+    """
+    def __init__(self, model):
+        self._wrap = wrapper(model)
+        self._wrapped = {}
+
+    def __getitem__(self, name):
+        func = self._wrapped.get(name)
+        if func is None:
+            func = self._wrap(CONTEXT_EXPORTS[name])
+            self._wrapped[name] = func
+        return func
+
+    def __iter__(self):
+        return iter(CONTEXT_EXPORTS)
+
+    def __len__(self):
+        return len(CONTEXT_EXPORTS)
+
+
 def wrapped_exports(model):
-    wrap = wrapper(model)
-    return {
-        name: wrap(export) for name, export in CONTEXT_EXPORTS.items()
-    }
+    return WrappedExports(model)
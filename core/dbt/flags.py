@@ -3,13 +3,18 @@ NON_DESTRUCTIVE = False
 FULL_REFRESH = False
 USE_CACHE = True
 WARN_ERROR = False
+WRITE_GRAPH = True
+PARTIAL_PARSE = False
 
 
 def reset():
-    global STRICT_MODE, NON_DESTRUCTIVE, FULL_REFRESH, USE_CACHE, WARN_ERROR
+    global STRICT_MODE, NON_DESTRUCTIVE, FULL_REFRESH, USE_CACHE, WARN_ERROR, \
+        WRITE_GRAPH, PARTIAL_PARSE
 
     STRICT_MODE = False
     NON_DESTRUCTIVE = False
     FULL_REFRESH = False
     USE_CACHE = True
     WARN_ERROR = False
+    WRITE_GRAPH = True
+    PARTIAL_PARSE = False
@@ -0,0 +1,160 @@
+"""A compact, versioned file format for the dependency graph.
+
+The file stores only node IDs and edges, as a fixed header followed by
+little-endian uint32 arrays and the UTF-8 encoded IDs:
+
+    header          magic, version, node count, edge count
+    id offsets      (nodes + 1) byte offsets into the ID data
+    child offsets   (nodes + 1) offsets into the child indices, so the
+                    children of node i are children[offsets[i]:offsets[i+1]]
+    children        the child index of every edge
+    ID data         the node IDs, concatenated
+
+The file is written to a temporary path and renamed into place, so readers
+never see a partly written file. Readers memory-map the file and decode only
+what they are asked for.
+"""
+import io
+import mmap
+import os
+import struct
+
+from dbt.graph.dag import DAG
+import dbt.exceptions
+
+
+MAGIC = b'DBTGRAPH'
+VERSION = 1
+HEADER = struct.Struct('<8sIII')
+UINT32 = struct.Struct('<I')
+
+
+def _pack_uint32s(values):
+    return struct.pack('<{}I'.format(len(values)), *values)
+
+
+def write_graph(path, graph):
+    """Write the graph to the given path.
+
+    :param str path: The path to write to.
+    :param DAG graph: The graph to write.
+    """
+    nodes = graph.nodes()
+    indices = {node: idx for idx, node in enumerate(nodes)}
+
+    encoded = [node.encode('utf-8') for node in nodes]
+    id_offsets = [0]
+    for data in encoded:
+        id_offsets.append(id_offsets[-1] + len(data))
+
+    child_offsets = [0]
+    children = []
+    for node in nodes:
+        children.extend(indices[c] for c in graph.successors(node))
+        child_offsets.append(len(children))
+
+    tmp_path = path + '.tmp'
+    with io.open(tmp_path, 'wb') as fp:
+        fp.write(HEADER.pack(MAGIC, VERSION, len(nodes), len(children)))
+        fp.write(_pack_uint32s(id_offsets))
+        fp.write(_pack_uint32s(child_offsets))
+        fp.write(_pack_uint32s(children))
+        fp.write(b''.join(encoded))
+    # os.rename won't replace an existing file on windows
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(tmp_path, path)
+
+
+class GraphArtifact(object):
+    """A graph file written by `write_graph`, memory-mapped for reading.
+
+    :param str path: The path to read.
+    :raises RuntimeException: If the file is not a graph file this version
+        of dbt can read.
+    """
+    def __init__(self, path):
+        self.path = path
+        with io.open(path, 'rb') as fp:
+            try:
+                self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap can't map empty files
+                self._map = b''
+
+        if len(self._map) < HEADER.size:
+            self._invalid()
+        magic, version, num_nodes, num_edges = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._invalid()
+
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self._id_offsets = HEADER.size
+        self._child_offsets = self._id_offsets + (num_nodes + 1) * UINT32.size
+        self._children = self._child_offsets + (num_nodes + 1) * UINT32.size
+        self._ids = self._children + num_edges * UINT32.size
+        # the arrays must fit, and so must the ID data they point into
+        if len(self._map) < self._ids or \
+                len(self._map) != self._ids + self._offset(self._id_offsets,
+                                                           num_nodes):
+            self._invalid()
+
+    def _invalid(self):
+        raise dbt.exceptions.RuntimeException(
+            'The graph file at {} is invalid or was written by a different '
+            'version of dbt. Run "dbt compile" to rebuild it.'
+            .format(self.path)
+        )
+
+    def __len__(self):
+        return self.num_nodes
+
+    def _offset(self, start, idx):
+        return UINT32.unpack_from(self._map, start + idx * UINT32.size)[0]
+
+    def _offsets(self, start):
+        count = self.num_nodes + 1
+        return struct.unpack_from('<{}I'.format(count), self._map, start)
+
+    def node_id(self, idx):
+        """Decode the ID of the node at the given index."""
+        begin = self._ids + self._offset(self._id_offsets, idx)
+        end = self._ids + self._offset(self._id_offsets, idx + 1)
+        return self._map[begin:end].decode('utf-8')
+
+    def children(self, idx):
+        """Get the indices of the children of the node at the given index."""
+        begin = self._offset(self._child_offsets, idx)
+        end = self._offset(self._child_offsets, idx + 1)
+        return struct.unpack_from('<{}I'.format(end - begin), self._map,
+                                  self._children + begin * UINT32.size)
+
+    def nodes(self):
+        offsets = self._offsets(self._id_offsets)
+        data = self._map[self._ids:self._ids + offsets[-1]]
+        return [
+            data[begin:end].decode('utf-8')
+            for begin, end in zip(offsets, offsets[1:])
+        ]
+
+    def _all_children(self):
+        offsets = self._offsets(self._child_offsets)
+        children = struct.unpack_from('<{}I'.format(self.num_edges),
+                                      self._map, self._children)
+        return [children[b:e] for b, e in zip(offsets, offsets[1:])]
+
+    def edges(self):
+        nodes = self.nodes()
+        return [
+            (nodes[src], nodes[dst])
+            for src, children in enumerate(self._all_children())
+            for dst in children
+        ]
+
+    def to_dag(self):
+        return DAG.from_adjacency(self.nodes(), self._all_children())
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
@@ -0,0 +1,339 @@
+from array import array
+from collections import deque
+
+import networkx as nx
+
+
+# the array typecode for node indices
+INDEX_TYPECODE = 'i'
+
+
+def reachable(neighbors, sources, max_depth=None):
+    """Return the set of nodes reachable from any of the sources by
+    repeatedly following `neighbors`, not including the sources themselves
+    unless they are reachable from another source. Each node is visited at
+    most once.
+
+    :param Callable[Any, Iterable[Any]] neighbors: A function returning the
+        neighbors of a node, e.g. `graph.successors`.
+    :param Iterable[Any] sources: The nodes to start from.
+    :param Optional[int] max_depth: If set, only follow paths of up to this
+        many edges.
+    """
+    if max_depth is not None:
+        return _reachable_within(neighbors, sources, max_depth)
+
+    seen = set()
+    stack = []
+    for source in sources:
+        stack.extend(neighbors(source))
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.extend(neighbors(node))
+    return seen
+
+
+def _reachable_within(neighbors, sources, max_depth):
+    # a breadth-first search, one level at a time, so that each node is found
+    # at its shortest distance from the sources
+    seen = set()
+    level = list(sources)
+    for _ in range(max_depth):
+        next_level = []
+        for node in level:
+            for neighbor in neighbors(node):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    next_level.append(neighbor)
+        if not next_level:
+            break
+        level = next_level
+    return seen
+
+
+class DAG(object):
+    """A compact directed graph.
+
+    Node IDs are interned to integer indices, and the children and parents of
+    each node are stored as arrays of those indices, so the graph holds a
+    single reference to each ID and no per-edge objects. It implements the
+    parts of the networkx DiGraph API that dbt uses, plus the traversals
+    that dbt needs, and converts to and from networkx for compatibility.
+
+    Removing a node leaves a hole at its index. Indices are never reused, so
+    node IDs may not be None.
+    """
+    def __init__(self):
+        self._ids = []
+        self._indices = {}
+        self._succ = []
+        self._pred = []
+
+    @classmethod
+    def from_networkx(cls, graph):
+        dag = cls()
+        dag.add_nodes_from(graph.nodes())
+        dag.add_edges_from(graph.edges())
+        return dag
+
+    @classmethod
+    def from_adjacency(cls, nodes, children):
+        """Build a graph from a list of unique node IDs and, for each node,
+        the positions in that list of its children.
+        """
+        dag = cls()
+        dag._ids = list(nodes)
+        dag._indices = {node: idx for idx, node in enumerate(dag._ids)}
+        dag._succ = [array(INDEX_TYPECODE, c) for c in children]
+        dag._pred = [array(INDEX_TYPECODE) for _ in dag._ids]
+        for src, node_children in enumerate(dag._succ):
+            for dst in node_children:
+                dag._pred[dst].append(src)
+        return dag
+
+    def to_networkx(self):
+        """Return a copy of this graph as a networkx DiGraph."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes())
+        graph.add_edges_from(self.edges())
+        return graph
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __contains__(self, node):
+        return node in self._indices
+
+    def __iter__(self):
+        return iter(self.nodes())
+
+    def _add_node(self, node):
+        idx = self._indices.get(node)
+        if idx is None:
+            idx = len(self._ids)
+            self._indices[node] = idx
+            self._ids.append(node)
+            self._succ.append(array(INDEX_TYPECODE))
+            self._pred.append(array(INDEX_TYPECODE))
+        return idx
+
+    def _add_edge(self, src, dst):
+        if dst not in self._succ[src]:
+            self._succ[src].append(dst)
+            self._pred[dst].append(src)
+
+    def _to_ids(self, indices):
+        ids = self._ids
+        return [ids[idx] for idx in indices]
+
+    def add_node(self, node):
+        self._add_node(node)
+
+    def add_nodes_from(self, nodes):
+        for node in nodes:
+            self._add_node(node)
+
+    def add_edge(self, src, dst):
+        self._add_edge(self._add_node(src), self._add_node(dst))
+
+    def add_edges_from(self, edges):
+        for src, dst in edges:
+            self.add_edge(src, dst)
+
+    def remove_node(self, node):
+        idx = self._indices.pop(node)
+        for child in self._succ[idx]:
+            self._pred[child].remove(idx)
+        for parent in self._pred[idx]:
+            self._succ[parent].remove(idx)
+        self._ids[idx] = None
+        self._succ[idx] = None
+        self._pred[idx] = None
+
+    def nodes(self):
+        return [node for node in self._ids if node is not None]
+
+    def edges(self):
+        ids = self._ids
+        return [
+            (ids[src], ids[dst])
+            for src, children in enumerate(self._succ)
+            if children is not None
+            for dst in children
+        ]
+
+    def number_of_edges(self):
+        return sum(len(c) for c in self._succ if c is not None)
+
+    def has_edge(self, src, dst):
+        if src not in self._indices or dst not in self._indices:
+            return False
+        return self._indices[dst] in self._succ[self._indices[src]]
+
+    def successors(self, node):
+        return self._to_ids(self._succ[self._indices[node]])
+
+    def predecessors(self, node):
+        return self._to_ids(self._pred[self._indices[node]])
+
+    def in_degree(self, node):
+        return len(self._pred[self._indices[node]])
+
+    def out_degree(self, node):
+        return len(self._succ[self._indices[node]])
+
+    def in_degree_iter(self):
+        for node, parents in zip(self._ids, self._pred):
+            if node is not None:
+                yield node, len(parents)
+
+    def copy(self):
+        graph = DAG()
+        graph._ids = list(self._ids)
+        graph._indices = dict(self._indices)
+        graph._succ = [None if c is None else c[:] for c in self._succ]
+        graph._pred = [None if p is None else p[:] for p in self._pred]
+        return graph
+
+    def _reachable_indices(self, starts, adjacency):
+        seen = set()
+        stack = []
+        for start in starts:
+            stack.extend(adjacency[start])
+        while stack:
+            idx = stack.pop()
+            if idx in seen:
+                continue
+            seen.add(idx)
+            stack.extend(adjacency[idx])
+        return seen
+
+    def descendants(self, node):
+        """Return the set of nodes reachable from the given node."""
+        found = self._reachable_indices([self._indices[node]], self._succ)
+        return set(self._to_ids(found))
+
+    def ancestors(self, node):
+        """Return the set of nodes that can reach the given node."""
+        found = self._reachable_indices([self._indices[node]], self._pred)
+        return set(self._to_ids(found))
+
+    def topological_sort(self):
+        """Return the nodes in an order where every node comes after all of
+        its parents.
+
+        :raises nx.NetworkXUnfeasible: If the graph has a cycle.
+        """
+        remaining = [0 if p is None else len(p) for p in self._pred]
+        ready = deque(
+            idx for idx, node in enumerate(self._ids)
+            if node is not None and remaining[idx] == 0
+        )
+        order = []
+        while ready:
+            idx = ready.popleft()
+            order.append(idx)
+            for child in self._succ[idx]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self):
+            raise nx.NetworkXUnfeasible(
+                'Graph contains a cycle or graph changed during iteration'
+            )
+        return self._to_ids(order)
+
+    def find_cycle(self):
+        """Find a cycle in the graph with an iterative depth-first search that
+        stops at the first back edge, in time linear in the size of the graph.
+
+        :return Optional[List[Any]]: The nodes of the cycle in edge order, or
+            None if the graph is acyclic.
+        """
+        done = set()
+        for root, children in enumerate(self._succ):
+            if children is None or root in done:
+                continue
+            # the current path, as each node's position in it and a stack of
+            # (node, iterator over its children)
+            path = [root]
+            on_path = {root: 0}
+            stack = [(root, iter(children))]
+            while stack:
+                idx, children = stack[-1]
+                for child in children:
+                    if child in on_path:
+                        return self._to_ids(path[on_path[child]:])
+                    if child not in done:
+                        on_path[child] = len(path)
+                        path.append(child)
+                        stack.append((child, iter(self._succ[child])))
+                        break
+                else:
+                    stack.pop()
+                    path.pop()
+                    del on_path[idx]
+                    done.add(idx)
+        return None
+
+    def subgraph(self, nodes):
+        """Return a new graph of the given nodes and the edges between
+        them.
+        """
+        graph = DAG()
+        mapping = {}
+        for node in nodes:
+            idx = self._indices.get(node)
+            if idx is not None and idx not in mapping:
+                mapping[idx] = graph._add_node(node)
+        for idx, new_idx in mapping.items():
+            for child in self._succ[idx]:
+                if child in mapping:
+                    graph._succ[new_idx].append(mapping[child])
+                    graph._pred[mapping[child]].append(new_idx)
+        return graph
+
+    def subset(self, nodes):
+        """Return a new graph of the given nodes, with an edge between two of
+        them wherever there was a path between them in this graph.
+
+        Rather than building the transitive closure of the whole graph, only
+        the nodes that lie on a path between two included nodes are
+        searched. From each included node, the search stops at the first
+        included node along any path, so the new graph has the same
+        reachability between included nodes as the closure without storing
+        every transitive edge.
+
+        :raises KeyError: If any of the nodes is not in the graph.
+        """
+        include = {self._indices[node] for node in nodes}
+
+        graph = DAG()
+        mapping = {}
+        for idx in sorted(include):
+            mapping[idx] = graph._add_node(self._ids[idx])
+
+        # nodes outside this set can't connect two included nodes
+        between = (
+            self._reachable_indices(include, self._succ) &
+            self._reachable_indices(include, self._pred)
+        )
+
+        for idx in include:
+            new_idx = mapping[idx]
+            seen = set()
+            stack = list(self._succ[idx])
+            while stack:
+                child = stack.pop()
+                if child in seen:
+                    continue
+                seen.add(child)
+                if child in include:
+                    graph._add_edge(new_idx, mapping[child])
+                elif child in between:
+                    stack.extend(self._succ[child])
+
+        return graph
@@ -1,9 +1,11 @@
-import networkx as nx
+import re
+
 from dbt.logger import GLOBAL_LOGGER as logger
 
 from dbt.utils import is_enabled, get_materialization, coalesce
 from dbt.node_types import NodeType
 from dbt.contracts.graph.parsed import ParsedNode
+from dbt.graph.dag import reachable
 import dbt.exceptions
 
 SELECTOR_PARENTS = '+'
@@ -12,6 +14,21 @@ SELECTOR_GLOB = '*'
 SELECTOR_CHILDREN_AND_ANCESTORS = '@'
 SELECTOR_DELIMITER = ':'
 
+# "+model" selects all parents, "2+model" selects parents up to two edges
+# away, and likewise for children with "model+" and "model+2"
+PARENTS_PATTERN = re.compile(
+    r'^(?P<depth>\d*)' + re.escape(SELECTOR_PARENTS) + r'(?P<rest>.+)$'
+)
+CHILDREN_PATTERN = re.compile(
+    r'^(?P<rest>.+)' + re.escape(SELECTOR_CHILDREN) + r'(?P<depth>\d*)$'
+)
+
+
+def _parse_depth(depth):
+    if depth:
+        return int(depth)
+    return None
+
 
 class SelectionCriteria(object):
     def __init__(self, node_spec):
@@ -19,19 +36,25 @@ class SelectionCriteria(object):
         self.select_children = False
         self.select_parents = False
         self.select_childrens_parents = False
+        self.parents_depth = None
+        self.children_depth = None
         self.selector_type = SELECTOR_FILTERS.FQN
 
         if node_spec.startswith(SELECTOR_CHILDREN_AND_ANCESTORS):
             self.select_childrens_parents = True
             node_spec = node_spec[1:]
 
-        if node_spec.startswith(SELECTOR_PARENTS):
+        match = PARENTS_PATTERN.match(node_spec)
+        if match is not None:
             self.select_parents = True
-            node_spec = node_spec[1:]
+            self.parents_depth = _parse_depth(match.group('depth'))
+            node_spec = match.group('rest')
 
-        if node_spec.endswith(SELECTOR_CHILDREN):
+        match = CHILDREN_PATTERN.match(node_spec)
+        if match is not None:
             self.select_children = True
-            node_spec = node_spec[:-1]
+            self.children_depth = _parse_depth(match.group('depth'))
+            node_spec = match.group('rest')
 
         if self.select_children and self.select_childrens_parents:
             raise dbt.exceptions.RuntimeException(
@@ -115,6 +138,94 @@ def _node_is_match(qualified_name, package_names, fqn):
     return False
 
 
+class FQNIndex(object):
+    """A trie over the fully qualified names of nodes, so that selectors
+    resolve by walking the parts of the selector instead of testing every
+    node against it. Matching follows `is_selected_node`.
+    """
+    def __init__(self):
+        # each trie node is a tuple of (children by part, IDs ending here)
+        self._root = ({}, [])
+        self._fqns = {}
+        self._by_name = {}
+
+    @classmethod
+    def from_manifest(cls, manifest):
+        index = cls()
+        for unique_id, node in manifest.nodes.items():
+            if node.resource_type != NodeType.Source:
+                index.add(unique_id, node.fqn)
+        return index
+
+    def add(self, unique_id, fqn):
+        fqn = tuple(fqn)
+        trie_node = self._root
+        for part in fqn:
+            trie_node = trie_node[0].setdefault(part, ({}, []))
+        trie_node[1].append(unique_id)
+        self._fqns[unique_id] = fqn
+        if fqn:
+            self._by_name.setdefault(fqn[-1], []).append(unique_id)
+
+    def _descendants(self, trie_node):
+        stack = [trie_node]
+        while stack:
+            children, unique_ids = stack.pop()
+            for unique_id in unique_ids:
+                yield unique_id
+            stack.extend(children.values())
+
+    def by_name(self, name):
+        """Return the IDs of all nodes whose name is the given name."""
+        return list(self._by_name.get(name, ()))
+
+    def search(self, node_selector):
+        """Yield the IDs of all nodes the selector matches, as determined by
+        `is_selected_node`. An ID may be yielded more than once.
+
+        :param List[str] node_selector: The components of the selector.
+        """
+        trie_node = self._root
+        last = len(node_selector) - 1
+        for depth, selector_part in enumerate(node_selector):
+            # a glob selects everything under the prefix so far
+            if selector_part == SELECTOR_GLOB:
+                for unique_id in self._descendants(trie_node):
+                    yield unique_id
+                return
+
+            # the last part may instead be the node name, anywhere below
+            if depth == last:
+                prefix = tuple(node_selector[:depth])
+                for unique_id in self._by_name.get(selector_part, ()):
+                    if self._fqns[unique_id][:depth] == prefix:
+                        yield unique_id
+
+            trie_node = trie_node[0].get(selector_part)
+            if trie_node is None:
+                return
+
+        # the whole selector is a prefix of these nodes' fqns
+        for unique_id in self._descendants(trie_node):
+            yield unique_id
+
+    def match(self, qualified_name, package_names):
+        """Return the set of IDs of the nodes that match the qualified name,
+        as determined by `_node_is_match`.
+        """
+        matched = set()
+        if len(qualified_name) == 1:
+            matched.update(self.by_name(qualified_name[0]))
+
+        if qualified_name[0] in package_names:
+            matched.update(self.search(qualified_name))
+
+        for package_name in package_names:
+            matched.update(self.search([package_name] + qualified_name))
+
+        return matched
+
+
 def warn_if_useless_spec(spec, nodes):
     if len(nodes) > 0:
         return
@@ -130,9 +241,37 @@ class NodeSelector(object):
     def __init__(self, linker, manifest):
         self.linker = linker
         self.manifest = manifest
+        self._fqn_index = None
+        self._package_names = None
+
+    @property
+    def fqn_index(self):
+        if self._fqn_index is None:
+            self._fqn_index = FQNIndex.from_manifest(self.manifest)
+        return self._fqn_index
+
+    @property
+    def package_names(self):
+        if self._package_names is None:
+            self._package_names = set(
+                unique_id.split('.')[1] for unique_id in self.manifest.nodes
+            )
+        return self._package_names
 
     def _node_iterator(self, graph, exclude, include):
-        for node in graph.nodes():
+        if include is None:
+            candidates = graph.nodes()
+        else:
+            candidates = set()
+            for resource_type in include:
+                candidates.update(
+                    self.manifest.get_unique_ids_by_resource_type(
+                        resource_type
+                    )
+                )
+        for node in candidates:
+            if node not in graph:
+                continue
             real_node = self.manifest.nodes[node]
             if include is not None and real_node.resource_type not in include:
                 continue
@@ -158,15 +297,15 @@ class NodeSelector(object):
         :param str qualified_name_selector: The selector or node name
         """
         qualified_name = qualified_name_selector.split(".")
-        package_names = get_package_names(graph)
-        for node, real_node in self.parsed_nodes(graph):
-            if _node_is_match(qualified_name, package_names, real_node.fqn):
+        matched = self.fqn_index.match(qualified_name, self.package_names)
+        for node in matched:
+            if node in graph:
                 yield node
 
     def get_nodes_by_tag(self, graph, tag_name):
         """ yields nodes from graph that have the specified tag """
-        for node, real_node in self.parsed_nodes(graph):
-            if tag_name in real_node.tags:
+        for node in self.manifest.get_unique_ids_by_tag(tag_name):
+            if node in graph:
                 yield node
 
     def get_nodes_by_source(self, graph, source_full_name):
@@ -184,9 +323,18 @@ class NodeSelector(object):
             ).format(source_full_name)
             raise dbt.exceptions.RuntimeException(msg)
 
-        for node, real_node in self.source_nodes(graph):
-            if target_source not in (real_node.source_name, SELECTOR_GLOB):
-                continue
+        if target_source == SELECTOR_GLOB:
+            candidates = self.source_nodes(graph)
+        else:
+            candidates = (
+                (node, self.manifest.nodes[node])
+                for node in self.manifest.get_unique_ids_by_source_name(
+                    target_source
+                )
+                if node in graph
+            )
+
+        for node, real_node in candidates:
             if target_table in (None, real_node.name, SELECTOR_GLOB):
                 yield node
 
@@ -194,26 +342,22 @@ class NodeSelector(object):
         ancestors_for = self.select_children(graph, selected) | selected
         return self.select_parents(graph, ancestors_for) | ancestors_for
 
-    def select_children(self, graph, selected):
-        descendants = set()
-        for node in selected:
-            descendants.update(nx.descendants(graph, node))
-        return descendants
+    def select_children(self, graph, selected, max_depth=None):
+        return reachable(graph.successors, selected, max_depth)
 
-    def select_parents(self, graph, selected):
-        ancestors = set()
-        for node in selected:
-            ancestors.update(nx.ancestors(graph, node))
-        return ancestors
+    def select_parents(self, graph, selected, max_depth=None):
+        return reachable(graph.predecessors, selected, max_depth)
 
     def collect_models(self, graph, selected, spec):
         additional = set()
         if spec.select_childrens_parents:
             additional.update(self.select_childrens_parents(graph, selected))
         if spec.select_parents:
-            additional.update(self.select_parents(graph, selected))
+            additional.update(self.select_parents(graph, selected,
+                                                  spec.parents_depth))
         if spec.select_children:
-            additional.update(self.select_children(graph, selected))
+            additional.update(self.select_children(graph, selected,
+                                                   spec.children_depth))
         return additional
 
     def collect_tests(self, graph, model_nodes):
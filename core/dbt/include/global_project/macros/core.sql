@@ -7,7 +7,11 @@
       {{ write(sql) }}
     {%- endif -%}
 
-    {%- set status, res = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- if name == 'main' -%}
+      {%- set status, res = adapter.execute_main(sql, auto_begin=auto_begin, fetch=fetch_result, unique_id=model['unique_id']) -%}
+    {%- else -%}
+      {%- set status, res = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- endif -%}
     {%- if name is not none -%}
       {{ store_result(name, status=status, agate_table=res) }}
     {%- endif -%}
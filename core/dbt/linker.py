@@ -1,17 +1,13 @@
-import networkx as nx
+import heapq
 from collections import defaultdict
 import threading
 
-import dbt.utils
 from dbt.compat import PriorityQueue
+from dbt.graph.artifact import GraphArtifact, write_graph
+from dbt.graph.dag import DAG
 from dbt.node_types import NodeType
 
 
-GRAPH_SERIALIZE_BLACKLIST = [
-    'agate_table'
-]
-
-
 def from_file(graph_file):
     linker = Linker()
     linker.read_graph(graph_file)
@@ -23,6 +19,81 @@ def is_blocking_dependency(node):
     return node.resource_type == NodeType.Model
 
 
+class SchedulingPolicy(object):
+    # prioritize nodes with the most blocking descendants
+    Descendants = 'descendants'
+    # prioritize nodes with the longest remaining chain of historical runtimes
+    CriticalPath = 'critical-path'
+
+    @classmethod
+    def all(cls):
+        return [cls.Descendants, cls.CriticalPath]
+
+
+def _node_concurrency_keys(node):
+    """Yield the (kind, name) pairs that concurrency limits can be configured
+    on for the given node, where kind is a key of the project's `concurrency`
+    config.
+    """
+    for tag in node.get('tags', []):
+        yield ('tags', tag)
+    yield ('schemas', node.get('schema'))
+    yield ('materializations', node.get('config', {}).get('materialized'))
+
+
+class ReachabilityIndex(object):
+    """An index for looking up the descendants of nodes in a graph that does
+    not change. Node IDs are interned to integers and the adjacency lists are
+    stored as tuples of those integers, so the index holds no references to
+    the graph and is unaffected by later changes to it, such as GraphQueue
+    removing nodes as they finish.
+
+    Descendants are computed lazily, only for the nodes that are asked about,
+    and memoized. A search reuses the memoized descendants of any node it
+    reaches instead of walking below it, so a lookup costs about as much as
+    the number of descendants it returns.
+    """
+    def __init__(self, graph):
+        self._ids = graph.nodes()
+        self._indices = {node: idx for idx, node in enumerate(self._ids)}
+        self._children = [
+            tuple(self._indices[c] for c in graph.successors(node))
+            for node in self._ids
+        ]
+        self._memo = {}
+
+    def _search(self, start):
+        """Find the indices of all descendants of the node with the given
+        index. This visits only the descendants and their edges.
+        """
+        seen = set()
+        stack = list(self._children[start])
+        while stack:
+            idx = stack.pop()
+            if idx in seen:
+                continue
+            seen.add(idx)
+            known = self._memo.get(idx)
+            if known is None:
+                stack.extend(self._children[idx])
+            else:
+                seen.update(known)
+        return seen
+
+    def get_dependent_nodes(self, node):
+        """Return the set of node IDs that are descendants of the given node.
+
+        :param str node: The node ID.
+        :return Set[str]: The IDs of the node's descendants.
+        """
+        start = self._indices[node]
+        found = self._memo.get(start)
+        if found is None:
+            found = frozenset(self._search(start))
+            self._memo[start] = found
+        return {self._ids[idx] for idx in found}
+
+
 class GraphQueue(object):
     """A fancy queue that is backed by the dependency graph.
     Note: this will mutate input!
@@ -31,9 +102,26 @@ class GraphQueue(object):
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
-    def __init__(self, graph, manifest):
+    def __init__(self, graph, manifest, execution_times=None,
+                 concurrency=None):
         self.graph = graph
         self.manifest = manifest
+        # if provided, a mapping of unique IDs to their historical execution
+        # time in seconds, used to prioritize by critical path.
+        self.execution_times = execution_times
+        # if provided, the project's concurrency limits: a dict of
+        # 'tags'/'schemas'/'materializations' to dicts of names to limits.
+        self.concurrency = concurrency or {}
+        # the number of queued or in progress nodes in each concurrency pool,
+        # and the pools each of those nodes holds a slot in
+        self._pool_usage = defaultdict(int)
+        self._node_pools = {}
+        # ready nodes waiting for a slot in a concurrency pool, as a heap of
+        # (score, node) per pool. A node waits on one pool at a time, so a
+        # released slot only wakes the nodes waiting on that pool. They stay
+        # out of the inner queue, so no worker thread ever waits on them.
+        self._waiting = defaultdict(list)
+        self.blocked = set()
         # store the queue as a priority queue.
         self.inner = PriorityQueue()
         # things that have been popped off the queue but not finished
@@ -43,14 +131,25 @@ class GraphQueue(object):
         self.queued = set()
         # this lock controls most things
         self.lock = threading.Lock()
-        # store the 'score' of each node as a number. Lower is higher priority.
+        # descendants in the graph as it is now, before nodes are removed.
+        self.dependents = ReachabilityIndex(self.graph)
+        # store the 'score' of each node. Lower is higher priority.
         self._scores = self._calculate_scores()
+        # the number of parents of each node that are not yet done. A node is
+        # ready to be queued when this hits zero.
+        self._remaining_parents = dict(self.graph.in_degree_iter())
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(self.graph.nodes())
 
     def get_node(self, node_id):
         return self.manifest.nodes[node_id]
 
+    def get_dependent_nodes(self, node_id):
+        """Return the IDs of every node in the queue's original graph that
+        depends on the given node, directly or indirectly.
+        """
+        return self.dependents.get_dependent_nodes(node_id)
+
     def _include_in_cost(self, node_id):
         node = self.get_node(node_id)
         if not is_blocking_dependency(node):
@@ -60,15 +159,51 @@ class GraphQueue(object):
         return True
 
     def _calculate_scores(self):
+        """Calculate the score of each node in the graph. We use this score
+        for the internal priority queue's ordering, so the quality of this
+        metric is important.
+
+        By default, nodes are scored by their number of blocking descendants.
+        If historical execution times are available for any node in the
+        graph, nodes are instead scored by the length of their critical path,
+        with the number of blocking descendants as a tiebreaker.
+
+        This operates on the graph, so it would require a lock if called from
+        outside __init__.
+
+        :return Dict[str, Any]: The score dict, mapping unique IDs to
+            scores. Lower scores are higher priority.
+        """
+        descendant_scores = self._calculate_descendant_scores()
+        if not self.execution_times:
+            return descendant_scores
+
+        known_times = sorted(
+            t for n, t in self.execution_times.items() if n in self.graph
+        )
+        if not known_times:
+            return descendant_scores
+
+        # blocking nodes with no history are assumed to take the median time
+        default_time = known_times[len(known_times) // 2]
+        critical_paths = self._calculate_critical_paths(default_time)
+        return {
+            node: (-1 * critical_paths[node], descendant_scores[node])
+            for node in self.graph.nodes()
+        }
+
+    def _calculate_descendant_scores(self):
         """Calculate the 'value' of each node in the graph based on how many
-        blocking descendants it has. We use this score for the internal
-        priority queue's ordering, so the quality of this metric is important.
+        blocking descendants it has.
 
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
-        We could do this in one pass over the graph instead of len(self.graph)
-        passes but this is easy. For large graphs this may hurt performance.
+        This is done in a single pass over the graph in reverse topological
+        order. Each blocking node is assigned a bit, and each node's set of
+        blocking descendants is the union of its children's sets (plus the
+        children themselves, if they are blocking). Python integers are used
+        as the bitsets, so the union is a cheap bitwise or.
 
         This operates on the graph, so it would require a lock if called from
         outside __init__.
@@ -76,15 +211,57 @@ class GraphQueue(object):
         :return Dict[str, int]: The score dict, mapping unique IDs to integer
             scores. Lower scores are higher priority.
         """
-        scores = {}
+        bits = {}
         for node in self.graph.nodes():
-            score = -1 * len([
-                d for d in nx.descendants(self.graph, node)
-                if self._include_in_cost(d)
-            ])
-            scores[node] = score
+            if self._include_in_cost(node):
+                bits[node] = 1 << len(bits)
+
+        # a node's bitset is only needed until all of its parents have been
+        # visited, so drop it then to keep memory bounded by the frontier.
+        unvisited_parents = dict(self.graph.in_degree_iter())
+        descendants = {}
+        scores = {}
+        for node in reversed(self.graph.topological_sort()):
+            reachable = 0
+            for child in self.graph.successors(node):
+                reachable |= descendants[child] | bits.get(child, 0)
+                unvisited_parents[child] -= 1
+                if unvisited_parents[child] == 0:
+                    del descendants[child]
+            descendants[node] = reachable
+            scores[node] = -1 * bin(reachable).count('1')
         return scores
 
+    def _estimate_execution_time(self, node_id, default_time):
+        """Estimate how long the given node will take to run, based on its
+        historical execution time. Blocking nodes with no history are assumed
+        to take default_time seconds, other nodes with no history are assumed
+        to be free.
+        """
+        if node_id in self.execution_times:
+            return self.execution_times[node_id]
+        elif self._include_in_cost(node_id):
+            return default_time
+        else:
+            return 0
+
+    def _calculate_critical_paths(self, default_time):
+        """Calculate the length in seconds of the longest chain of estimated
+        execution times starting at each node, including the node itself.
+
+        :param float default_time: The estimated execution time of blocking
+            nodes that have no history.
+        :return Dict[str, float]: The critical path length of each node.
+        """
+        paths = {}
+        for node in reversed(self.graph.topological_sort()):
+            longest_child = max(
+                [paths[c] for c in self.graph.successors(node)] or [0]
+            )
+            estimate = self._estimate_execution_time(node, default_time)
+            paths[node] = estimate + longest_child
+        return paths
+
     def get(self, block=True, timeout=None):
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -130,30 +307,128 @@ class GraphQueue(object):
         :param str node: The node ID to check
         :returns bool: If the node is in progress/queued.
         """
-        return node in self.in_progress or node in self.queued
+        return (node in self.in_progress or node in self.queued or
+                node in self.blocked)
 
-    def _find_new_additions(self):
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _get_pools(self, node_id):
+        """Get the concurrency pools that the given node must hold a slot in
+        while it is queued or running.
+
+        :param str node_id: The node ID.
+        :return List[Tuple[str, str]]: The (kind, name) of each pool.
+        """
+        node = self.get_node(node_id)
+        return [
+            (kind, name) for kind, name in _node_concurrency_keys(node)
+            if name in self.concurrency.get(kind, {})
+        ]
+
+    def _has_capacity(self, pool):
+        kind, name = pool
+        return self._pool_usage[pool] < self.concurrency[kind][name]
+
+    def _full_pool(self, pools):
+        """Return the first of the given pools that has no room, or None if
+        they all do.
+        """
+        for pool in pools:
+            if not self._has_capacity(pool):
+                return pool
+        return None
+
+    def _put(self, node):
+        """Put the node on the inner queue.
+
+        Callers must hold the lock.
+        """
+        self.inner.put((self._scores[node], node))
+        self.queued.add(node)
+
+    def _release_pools(self, node):
+        """Release the concurrency pool slots held by the node.
+
+        Callers must hold the lock.
+
+        :return List[Tuple[str, str]]: The released pools.
+        """
+        pools = self._node_pools.pop(node, [])
+        for pool in pools:
+            self._pool_usage[pool] -= 1
+        return pools
+
+    def _wake(self, pools):
+        """Move the nodes waiting on the given pools onto the inner queue, in
+        priority order, while those pools have room. A woken node that is
+        still held back by another of its pools waits on that pool instead.
+
+        A pool only has waiting nodes while it is full, so waking the pools
+        that were just released or added to is enough.
 
         Callers must hold the lock.
         """
-        for node, in_degree in self.graph.in_degree_iter():
-            if not self._already_known(node) and in_degree == 0:
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
+        for pool in pools:
+            waiting = self._waiting[pool]
+            while waiting and self._has_capacity(pool):
+                score, node = heapq.heappop(waiting)
+                node_pools = self._get_pools(node)
+                full = self._full_pool(node_pools)
+                if full is not None:
+                    heapq.heappush(self._waiting[full], (score, node))
+                    continue
+                for node_pool in node_pools:
+                    self._pool_usage[node_pool] += 1
+                self._node_pools[node] = node_pools
+                self.blocked.remove(node)
+                self._put(node)
+
+    def _find_new_additions(self, candidates, released=()):
+        """Find any nodes among the candidates that need to be added to the
+        internal queue and add them.
+
+        If concurrency limits are configured, ready nodes that are in a pool
+        wait on it instead, so that they are released in priority order as
+        pool slots become available.
+
+        Callers must hold the lock.
+
+        :param Iterable[str] candidates: The node IDs that might have become
+            ready.
+        :param Iterable[Tuple[str, str]] released: The pools that slots were
+            just released in.
+        """
+        to_wake = list(released)
+        for node in candidates:
+            if self._remaining_parents[node] == 0 and \
+                    not self._already_known(node):
+                pools = self._get_pools(node) if self.concurrency else None
+                if not pools:
+                    self._put(node)
+                    continue
+                pool = self._full_pool(pools) or pools[0]
+                heapq.heappush(self._waiting[pool], (self._scores[node], node))
+                self.blocked.add(node)
+                if pool not in to_wake:
+                    to_wake.append(pool)
+        self._wake(to_wake)
 
     def mark_done(self, node_id):
         """Given a node's unique ID, mark it as done.
 
+        Only the node's children can become ready as a result, so this costs
+        O(out-degree) rather than a scan of the whole remaining graph.
+
         This method takes the lock.
 
         :param str node_id: The node ID to mark as complete.
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            released = self._release_pools(node_id)
+            children = self.graph.successors(node_id)
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            for child in children:
+                self._remaining_parents[child] -= 1
+            self._find_new_additions(children, released)
             self.inner.task_done()
 
     def _mark_in_progress(self, node_id):
@@ -175,67 +450,92 @@ class GraphQueue(object):
 
 
 def _subset_graph(graph, include_nodes):
-    """Create and return a new graph that is a shallow copy of graph but with
-    only the nodes in include_nodes. Transitive edges across removed nodes are
-    preserved as explicit new edges.
+    """Create and return a new graph with only the nodes in include_nodes.
+    Transitive edges across removed nodes are preserved as explicit new
+    edges.
     """
-    new_graph = nx.algorithms.transitive_closure(graph)
-
     include_nodes = set(include_nodes)
 
-    for node in graph.nodes():
-        if node not in include_nodes:
-            new_graph.remove_node(node)
-
     for node in include_nodes:
-        if node not in new_graph:
+        if node not in graph:
             raise RuntimeError(
                 "Couldn't find model '{}' -- does it exist or is "
                 "it disabled?".format(node)
             )
-    return new_graph
+
+    return graph.subset(include_nodes)
 
 
 class Linker(object):
-    def __init__(self, data=None):
-        if data is None:
-            data = {}
-        self.graph = nx.DiGraph(**data)
+    def __init__(self, graph=None):
+        if graph is None:
+            graph = DAG()
+        self._graph = graph
+        # if the graph was read from a file, the file, until the graph is
+        # needed
+        self._artifact = None
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = self._artifact.to_dag()
+            self._artifact.close()
+            self._artifact = None
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph):
+        self._graph = graph
+        self._artifact = None
 
     def edges(self):
+        if self._graph is None:
+            return self._artifact.edges()
         return self.graph.edges()
 
     def nodes(self):
+        if self._graph is None:
+            return self._artifact.nodes()
         return self.graph.nodes()
 
     def find_cycles(self):
-        # There's a networkx find_cycle function, but there's a bug in the
-        # nx 1.11 release that prevents us from using it. We should use that
-        # function when we upgrade to 2.X. More info:
-        #     https://github.com/networkx/networkx/pull/2473
-        cycles = list(nx.simple_cycles(self.graph))
-
-        if len(cycles) > 0:
-            cycle_nodes = cycles[0]
+        cycle_nodes = self.graph.find_cycle()
+
+        if cycle_nodes is not None:
             cycle_nodes.append(cycle_nodes[0])
             return " --> ".join(cycle_nodes)
 
         return None
 
-    def as_graph_queue(self, manifest, limit_to=None):
+    def as_graph_queue(self, manifest, limit_to=None, execution_times=None,
+                       concurrency=None):
         """Returns a queue over nodes in the graph that tracks progress of
         dependecies.
+
+        If execution_times is given, it should map unique IDs to historical
+        execution times in seconds, and the queue will prioritize nodes on
+        the critical path.
+
+        If concurrency is given, it should be the project's concurrency
+        config, and the queue will not hand out more nodes from each pool at
+        once than its limit.
+        """
+        new_graph = self.get_subset_graph(limit_to)
+        return GraphQueue(new_graph, manifest, execution_times, concurrency)
+
+    def get_subset_graph(self, limit_to=None):
+        """Returns a new graph containing only the given nodes, with edges
+        between any two of them that are connected in the full graph.
         """
         if limit_to is None:
             graph_nodes = self.graph.nodes()
         else:
             graph_nodes = limit_to
 
-        new_graph = _subset_graph(self.graph, graph_nodes)
-        return GraphQueue(new_graph, manifest)
+        return _subset_graph(self.graph, graph_nodes)
 
     def get_dependent_nodes(self, node):
-        return nx.descendants(self.graph, node)
+        return self.graph.descendants(node)
 
     def dependency(self, node1, node2):
         "indicate that node1 depends on node2"
@@ -247,28 +547,21 @@ class Linker(object):
         self.graph.add_node(node)
 
     def remove_node(self, node):
-        children = nx.descendants(self.graph, node)
+        children = self.graph.descendants(node)
         self.graph.remove_node(node)
         return children
 
-    def write_graph(self, outfile, manifest):
-        """Write the graph to a gpickle file. Before doing so, serialize and
-        include all nodes in their corresponding graph entries.
-        """
-        out_graph = _updated_graph(self.graph, manifest)
-        nx.write_gpickle(out_graph, outfile)
+    def to_networkx(self):
+        """Return a copy of the graph as a networkx DiGraph."""
+        return self.graph.to_networkx()
+
+    def write_graph(self, outfile):
+        """Write the graph's nodes and edges to a graph file."""
+        write_graph(outfile, self.graph)
 
     def read_graph(self, infile):
-        self.graph = nx.read_gpickle(infile)
-
-
-def _updated_graph(graph, manifest):
-    graph = graph.copy()
-    for node_id in graph.nodes():
-        # serialize() removes the agate table
-        data = manifest.nodes[node_id].serialize()
-        for key in GRAPH_SERIALIZE_BLACKLIST:
-            if key in data:
-                del data[key]
-        graph.add_node(node_id, data)
-    return graph
+        """Read the graph from a graph file. The file is memory-mapped, and
+        the graph is only built when it is first used.
+        """
+        self._graph = None
+        self._artifact = GraphArtifact(infile)
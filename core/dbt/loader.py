@@ -13,14 +13,20 @@ from dbt.utils import timestring
 from dbt.parser import MacroParser, ModelParser, SeedParser, AnalysisParser, \
     DocumentationParser, DataTestParser, HookParser, ArchiveParser, \
     SchemaParser, ParserUtils
+from dbt.parser.partial import ParseCache, PARSE_CACHE_FILE_NAME
+from dbt.parser.pool import ParsePool
 
 from dbt.contracts.project import ProjectList
 
 
 class GraphLoader(object):
-    def __init__(self, root_project, all_projects):
+    def __init__(self, root_project, all_projects, parse_cache=None,
+                 parse_processes=None):
         self.root_project = root_project
         self.all_projects = all_projects
+        self.parse_cache = parse_cache
+        self.parse_processes = parse_processes
+        self.parse_pool = None
         self.nodes = {}
         self.docs = {}
         self.macros = {}
@@ -32,7 +38,9 @@ class GraphLoader(object):
     def _load_sql_nodes(self, parser_type, resource_type, relative_dirs_attr,
                         **kwargs):
         parser = parser_type(self.root_project, self.all_projects,
-                             self.macro_manifest)
+                             self.macro_manifest,
+                             parse_cache=self.parse_cache,
+                             parse_pool=self.parse_pool)
 
         for project_name, project in self.all_projects.items():
             nodes, disabled = parser.load_and_parse(
@@ -55,7 +63,8 @@ class GraphLoader(object):
 
         # give the macroparser all projects but then only load what we haven't
         # loaded already
-        parser = MacroParser(self.root_project, self.all_projects)
+        parser = MacroParser(self.root_project, self.all_projects,
+                             parse_cache=self.parse_cache)
         for project_name, project in all_projects.items():
             self.macros.update(parser.load_and_parse(
                 package_name=project_name,
@@ -92,7 +101,8 @@ class GraphLoader(object):
         self._load_seeds()
 
     def _load_docs(self):
-        parser = DocumentationParser(self.root_project, self.all_projects)
+        parser = DocumentationParser(self.root_project, self.all_projects,
+                                     parse_cache=self.parse_cache)
         for project_name, project in self.all_projects.items():
             self.docs.update(parser.load_and_parse(
                 package_name=project_name,
@@ -102,7 +112,9 @@ class GraphLoader(object):
 
     def _load_schema_tests(self):
         parser = SchemaParser(self.root_project, self.all_projects,
-                              self.macro_manifest)
+                              self.macro_manifest,
+                              parse_cache=self.parse_cache,
+                              parse_pool=self.parse_pool)
         for project_name, project in self.all_projects.items():
             tests, patches, sources = parser.load_and_parse(
                 package_name=project_name,
@@ -133,12 +145,27 @@ class GraphLoader(object):
 
     def load(self, internal_manifest=None):
         self._load_macros(internal_manifest=internal_manifest)
+        if self.parse_cache is not None:
+            # everything else is rendered with the macros, so they decide
+            # which cached results are still valid
+            self.parse_cache.set_macros(self.macros)
         # make a manifest with just the macros to get the context
         self.macro_manifest = Manifest(macros=self.macros, nodes={}, docs={},
                                        generated_at=timestring(), disabled=[])
-        self._load_nodes()
-        self._load_docs()
-        self._load_schema_tests()
+        # fork the parse processes once the macros are loaded, so they
+        # inherit them
+        if self.parse_processes:
+            self.parse_pool = ParsePool(self.root_project, self.all_projects,
+                                        self.macro_manifest,
+                                        self.parse_processes)
+        try:
+            self._load_nodes()
+            self._load_docs()
+            self._load_schema_tests()
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.close()
+                self.parse_pool = None
 
     def create_manifest(self):
         manifest = Manifest(
@@ -158,19 +185,32 @@ class GraphLoader(object):
         return manifest
 
     @classmethod
-    def _load_from_projects(cls, root_config, projects, internal_manifest):
+    def _load_from_projects(cls, root_config, projects, internal_manifest,
+                            parse_cache=None, parse_processes=None):
         if dbt.flags.STRICT_MODE:
             ProjectList(**projects)
 
-        loader = cls(root_config, projects)
+        loader = cls(root_config, projects, parse_cache=parse_cache,
+                     parse_processes=parse_processes)
         loader.load(internal_manifest=internal_manifest)
         return loader.create_manifest()
 
     @classmethod
     def load_all(cls, root_config, internal_manifest=None):
         projects = load_all_projects(root_config)
+        parse_cache = None
+        if dbt.flags.PARTIAL_PARSE:
+            cache_path = os.path.join(root_config.target_path,
+                                      PARSE_CACHE_FILE_NAME)
+            parse_cache = ParseCache.load(cache_path, projects)
+
+        parse_processes = getattr(root_config.args, 'parse_processes', None)
         manifest = cls._load_from_projects(root_config, projects,
-                                           internal_manifest)
+                                           internal_manifest,
+                                           parse_cache=parse_cache,
+                                           parse_processes=parse_processes)
+        if parse_cache is not None:
+            parse_cache.write(cache_path)
         _check_manifest(manifest, root_config)
         return manifest
 
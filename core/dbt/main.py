@@ -22,8 +22,11 @@ import dbt.task.generate as generate_task
 import dbt.task.serve as serve_task
 import dbt.task.freshness as freshness_task
 import dbt.task.run_operation as run_operation_task
+import dbt.task.simulate as simulate_task
 from dbt.task.rpc_server import RPCServerTask
 from dbt.adapters.factory import reset_adapters
+from dbt.linker import SchedulingPolicy
+from dbt.task.simulate import DEFAULT_THREAD_COUNTS
 
 import dbt.tracking
 import dbt.ui.printer
@@ -206,6 +209,8 @@ def run_from_args(parsed):
 def update_flags(parsed):
     flags.NON_DESTRUCTIVE = getattr(parsed, 'non_destructive', False)
     flags.USE_CACHE = getattr(parsed, 'use_cache', True)
+    flags.WRITE_GRAPH = getattr(parsed, 'write_graph', True)
+    flags.PARTIAL_PARSE = getattr(parsed, 'partial_parse', False)
 
     arg_drop_existing = getattr(parsed, 'drop_existing', False)
     arg_full_refresh = getattr(parsed, 'full_refresh', False)
@@ -273,6 +278,35 @@ def _build_base_subparser():
         dest='use_cache',
         help='If set, bypass the adapter-level cache of database state',
     )
+
+    base_subparser.add_argument(
+        '--no-write-graph',
+        action='store_false',
+        dest='write_graph',
+        help="""
+        If set, don't write the dependency graph file to the target
+        directory. 'dbt simulate' reads this file.
+        """
+    )
+
+    base_subparser.add_argument(
+        '--partial-parse',
+        action='store_true',
+        help="""
+        If set, reuse the results of parsing files that have not changed
+        since the last run, instead of parsing every file in the project.
+        """
+    )
+
+    base_subparser.add_argument(
+        '--parse-processes',
+        type=int,
+        required=False,
+        help="""
+        If specified, parse models and schema.yml files in this many worker
+        processes.
+        """
+    )
     return base_subparser
 
 
@@ -370,6 +404,44 @@ def _build_run_subparser(subparsers, base_subparser):
     return run_sub
 
 
+def _build_simulate_subparser(subparsers, base_subparser):
+    sub = subparsers.add_parser(
+        'simulate',
+        parents=[base_subparser],
+        help="Predict run times for different thread counts from the "
+        "compiled graph and previous run results, without connecting to "
+        "the target database.")
+    sub.add_argument(
+        '--threads',
+        type=int,
+        nargs='+',
+        default=DEFAULT_THREAD_COUNTS,
+        help="""
+        The thread counts to simulate. Default = {}
+        """.format(' '.join(str(t) for t in DEFAULT_THREAD_COUNTS))
+    )
+    sub.add_argument(
+        '--scheduling-policy',
+        choices=SchedulingPolicy.all(),
+        nargs='+',
+        default=SchedulingPolicy.all(),
+        help="""
+        The scheduling policies to simulate. Default = all of them
+        """
+    )
+    sub.add_argument(
+        '--run-results',
+        required=False,
+        nargs='+',
+        help="""
+        The run_results.json files to read previous execution times from.
+        Defaults to the run_results.json in the target directory.
+        """
+    )
+    sub.set_defaults(cls=simulate_task.SimulateTask, which='simulate')
+    return sub
+
+
 def _build_compile_subparser(subparsers, base_subparser):
     sub = subparsers.add_parser(
         'compile',
@@ -457,6 +529,88 @@ def _add_common_arguments(*subparsers):
             """)
 
 
+def _add_scheduling_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--scheduling-policy',
+            choices=SchedulingPolicy.all(),
+            default=SchedulingPolicy.Descendants,
+            help="""
+            How to prioritize nodes that are ready to run. 'descendants'
+            (the default) runs nodes with the most downstream models first.
+            'critical-path' uses execution times from previous runs to run
+            nodes on the longest remaining chain first.
+            """
+        )
+        sub.add_argument(
+            '--run-results',
+            required=False,
+            nargs='+',
+            help="""
+            The run_results.json files to read previous execution times from
+            when using '--scheduling-policy critical-path' or
+            '--adaptive-threads'. Defaults to the run_results.json in the
+            target directory.
+            """
+        )
+
+
+def _add_resume_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--resume',
+            action='store_true',
+            help="""
+            If specified, resume the last interrupted or failed invocation of
+            this command, skipping nodes that already completed successfully.
+            """
+        )
+
+
+def _add_adaptive_threads_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--adaptive-threads',
+            action='store_true',
+            help="""
+            If specified, start at the configured number of threads and
+            adjust it while running based on query latency: back off when
+            the warehouse slows down under load, and grow when it keeps up.
+            Only the main statement of each node is measured, relative to the
+            node's execution time in previous runs (see '--run-results').
+            Nodes with no previous execution time, and nodes whose
+            materialization doesn't run the main statement with the
+            'statement' macro, like partitioned tables on BigQuery, are not
+            measured, and if no node is the number of threads is never
+            adjusted.
+            """
+        )
+        sub.add_argument(
+            '--max-threads',
+            type=int,
+            required=False,
+            help="""
+            The most threads to use with '--adaptive-threads'. Defaults to
+            twice the configured number of threads.
+            """
+        )
+
+
+def _add_compile_processes_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            '--compile-processes',
+            type=int,
+            required=False,
+            help="""
+            If specified, compile nodes ahead of time in this many worker
+            processes, so that compiling does not compete with running
+            queries for the GIL. Nodes that can't be compiled ahead of time
+            are compiled when they run.
+            """
+        )
+
+
 def _build_seed_subparser(subparsers, base_subparser):
     seed_sub = subparsers.add_parser(
         'seed',
@@ -656,15 +810,23 @@ def parse_args(args):
     rpc_sub = _build_rpc_subparser(subs, base_subparser)
     run_sub = _build_run_subparser(subs, base_subparser)
     compile_sub = _build_compile_subparser(subs, base_subparser)
+    simulate_sub = _build_simulate_subparser(subs, base_subparser)
     generate_sub = _build_docs_generate_subparser(docs_subs, base_subparser)
     test_sub = _build_test_subparser(subs, base_subparser)
     # --threads, --no-version-check
     _add_common_arguments(run_sub, compile_sub, generate_sub, test_sub,
                           rpc_sub)
     # --models, --exclude
-    _add_selection_arguments(run_sub, compile_sub, generate_sub, test_sub)
+    _add_selection_arguments(run_sub, compile_sub, generate_sub, test_sub,
+                             simulate_sub)
     # --full-refresh, --non-destructive
     _add_table_mutability_arguments(run_sub, compile_sub)
+    # --scheduling-policy, --run-results
+    _add_scheduling_arguments(run_sub, compile_sub, test_sub)
+    # --resume
+    _add_resume_arguments(run_sub, test_sub)
+    _add_adaptive_threads_arguments(run_sub, test_sub)
+    _add_compile_processes_arguments(run_sub, compile_sub, test_sub)
 
     _build_seed_subparser(subs, base_subparser)
     _build_docs_serve_subparser(docs_subs, base_subparser)
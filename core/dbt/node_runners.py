@@ -64,6 +64,8 @@ class BaseRunner(object):
 
         self.skip = False
         self.skip_cause = None
+        # if set, a CompilePool that may have compiled the node already
+        self.compile_pool = None
 
     def run_with_hooks(self, manifest):
         if self.skip:
@@ -85,7 +87,7 @@ class BaseRunner(object):
         execution_time = time.time() - start_time
         thread_id = threading.current_thread().name
         timing = [t.serialize() for t in timing_info]
-        return RunModelResult(
+        return RunModelResult.from_trusted(
             node=node,
             error=error,
             skip=skip,
@@ -279,7 +281,8 @@ class BaseRunner(object):
                     self.num_nodes
                 )
 
-        node_result = RunModelResult(self.node, skip=True, error=error)
+        node_result = RunModelResult.from_trusted(self.node, skip=True,
+                                                  error=error)
         return node_result
 
     def do_skip(self, cause=None):
@@ -295,9 +298,13 @@ class CompileRunner(BaseRunner):
         pass
 
     def execute(self, compiled_node, manifest):
-        return RunModelResult(compiled_node)
+        return RunModelResult.from_trusted(compiled_node)
 
     def compile(self, manifest):
+        if self.compile_pool is not None:
+            compiled = self.compile_pool.get(self.node.unique_id)
+            if compiled is not None:
+                return compiled
         return compile_node(self.adapter, self.config, self.node, manifest, {})
 
 
@@ -352,7 +359,7 @@ class ModelRunner(CompileRunner):
 
         result = context['load_result']('main')
 
-        return RunModelResult(model, status=result.status)
+        return RunModelResult.from_trusted(model, status=result.status)
 
 
 class FreshnessRunner(BaseRunner):
@@ -400,7 +407,7 @@ class FreshnessRunner(BaseRunner):
         timing = [t.serialize() for t in timing_info]
         if status is not None:
             status = status.lower()
-        return PartialResult(
+        return PartialResult.from_trusted(
             node=node,
             status=status,
             error=error,
@@ -482,7 +489,7 @@ class TestRunner(CompileRunner):
 
     def execute(self, test, manifest):
         status = self.execute_test(test)
-        return RunModelResult(test, status=status)
+        return RunModelResult.from_trusted(test, status=status)
 
     def after_execute(self, result):
         self.print_result_line(result)
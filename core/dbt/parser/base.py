@@ -16,9 +16,10 @@ from dbt.parser.source_config import SourceConfig
 
 
 class BaseParser(object):
-    def __init__(self, root_project_config, all_projects):
+    def __init__(self, root_project_config, all_projects, parse_cache=None):
         self.root_project_config = root_project_config
         self.all_projects = all_projects
+        self.parse_cache = parse_cache
 
     @property
     def default_schema(self):
@@ -51,12 +52,15 @@ class BaseParser(object):
 
 
 class MacrosKnownParser(BaseParser):
-    def __init__(self, root_project_config, all_projects, macro_manifest):
+    def __init__(self, root_project_config, all_projects, macro_manifest,
+                 parse_cache=None, parse_pool=None):
         super(MacrosKnownParser, self).__init__(
             root_project_config=root_project_config,
-            all_projects=all_projects
+            all_projects=all_projects,
+            parse_cache=parse_cache
         )
         self.macro_manifest = macro_manifest
+        self.parse_pool = parse_pool
         self._get_schema_func = None
         self._get_alias_func = None
 
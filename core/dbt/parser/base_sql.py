@@ -8,7 +8,9 @@ import dbt.utils
 import dbt.flags
 
 from dbt.contracts.graph.unparsed import UnparsedNode
+from dbt.contracts.graph.parsed import ParsedNode
 from dbt.parser.base import MacrosKnownParser
+from dbt.parser.partial import ParseCache, checksum
 
 
 class BaseSqlParser(MacrosKnownParser):
@@ -74,9 +76,57 @@ class BaseSqlParser(MacrosKnownParser):
                                   node.name)
 
         project = self.all_projects.get(package_name)
+        if self.parse_cache is None:
+            return unique_id, self.parse_node(node, unique_id, project,
+                                              tags=tags)
+
+        file_checksum = checksum(node_dict, tags)
+        cached = self.parse_cache.get(ParseCache.NODE, unique_id,
+                                      file_checksum)
+        if cached is not None:
+            return unique_id, ParsedNode.from_trusted(**cached)
+
         node_parsed = self.parse_node(node, unique_id, project, tags=tags)
+        self.parse_cache.set(ParseCache.NODE, unique_id, file_checksum,
+                             node_parsed.serialize())
         return unique_id, node_parsed
 
+    def _parse_sql_nodes_in_pool(self, nodes, tags):
+        """Parse the nodes that aren't in the parse cache in the parse pool.
+        Returns the unique ID and ParsedNode of each node, in order.
+        """
+        results = [None] * len(nodes)
+        missed = []
+        for idx, node_dict in enumerate(nodes):
+            unique_id = self.get_path(node_dict['resource_type'],
+                                      node_dict['package_name'],
+                                      node_dict['name'])
+            file_checksum = None
+            if self.parse_cache is not None:
+                file_checksum = checksum(node_dict, tags)
+                cached = self.parse_cache.get(ParseCache.NODE, unique_id,
+                                              file_checksum)
+                if cached is not None:
+                    results[idx] = unique_id, ParsedNode.from_trusted(**cached)
+                    continue
+            missed.append((idx, file_checksum))
+
+        parsed = self.parse_pool.parse_sql_nodes(
+            type(self), [nodes[idx] for idx, _ in missed], tags
+        )
+        for (idx, file_checksum), result in zip(missed, parsed):
+            if result is None:
+                results[idx] = self.parse_sql_node(nodes[idx], tags)
+                continue
+
+            unique_id, node_data = result
+            if self.parse_cache is not None:
+                self.parse_cache.set(ParseCache.NODE, unique_id,
+                                     file_checksum, node_data)
+            results[idx] = unique_id, ParsedNode.from_trusted(**node_data)
+
+        return results
+
     def parse_sql_nodes(self, nodes, tags=None):
         if tags is None:
             tags = []
@@ -84,8 +134,12 @@ class BaseSqlParser(MacrosKnownParser):
         to_return = {}
         disabled = []
 
-        for n in nodes:
-            node_path, node_parsed = self.parse_sql_node(n, tags)
+        if self.parse_pool is None:
+            parsed = (self.parse_sql_node(n, tags) for n in nodes)
+        else:
+            parsed = self._parse_sql_nodes_in_pool(list(nodes), tags)
+
+        for node_path, node_parsed in parsed:
 
             # Ignore disabled nodes
             if not node_parsed.config['enabled']:
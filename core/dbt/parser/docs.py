@@ -1,6 +1,7 @@
 import dbt.exceptions
 from dbt.node_types import NodeType
 from dbt.parser.base import BaseParser
+from dbt.parser.partial import ParseCache, checksum
 from dbt.contracts.graph.unparsed import UnparsedDocumentationFile
 from dbt.contracts.graph.parsed import ParsedDocumentation
 
@@ -75,10 +76,25 @@ class DocumentationParser(BaseParser):
             )
             yield ParsedDocumentation(**merged)
 
+    def _parse_cached(self, docfile):
+        if self.parse_cache is None:
+            return self.parse(docfile)
+
+        key = '{}.{}'.format(docfile.package_name, docfile.original_file_path)
+        file_checksum = checksum(docfile.serialize())
+        cached = self.parse_cache.get(ParseCache.DOCS, key, file_checksum)
+        if cached is not None:
+            return [ParsedDocumentation.from_trusted(**d) for d in cached]
+
+        parsed = list(self.parse(docfile))
+        self.parse_cache.set(ParseCache.DOCS, key, file_checksum,
+                             [d.serialize() for d in parsed])
+        return parsed
+
     def load_and_parse(self, package_name, root_dir, relative_dirs):
         to_return = {}
         for docfile in self.load_file(package_name, root_dir, relative_dirs):
-                for parsed in self.parse(docfile):
+                for parsed in self._parse_cached(docfile):
                     if parsed.unique_id in to_return:
                         dbt.exceptions.raise_duplicate_resource_name(
                             to_return[parsed.unique_id], parsed
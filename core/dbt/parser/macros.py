@@ -11,6 +11,7 @@ import dbt.clients.system
 import dbt.contracts.project
 
 from dbt.parser.base import BaseParser
+from dbt.parser.partial import ParseCache, checksum
 from dbt.node_types import NodeType
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.contracts.graph.unparsed import UnparsedMacro
@@ -100,12 +101,31 @@ class MacroParser(BaseParser):
                 file_match.get('relative_path')
             )
 
-            result.update(
-                self.parse_macro_file(
-                    original_file_path,
-                    file_contents,
-                    root_dir,
-                    package_name,
-                    resource_type))
+            if self.parse_cache is None:
+                result.update(
+                    self.parse_macro_file(
+                        original_file_path,
+                        file_contents,
+                        root_dir,
+                        package_name,
+                        resource_type))
+                continue
+
+            key = '{}.{}'.format(package_name, original_file_path)
+            file_checksum = checksum(file_contents, root_dir, resource_type)
+            cached = self.parse_cache.get(ParseCache.MACRO, key,
+                                          file_checksum)
+            if cached is not None:
+                for macro in cached:
+                    parsed = ParsedMacro.from_trusted(**macro)
+                    result[parsed.unique_id] = parsed
+                continue
+
+            parsed = self.parse_macro_file(original_file_path, file_contents,
+                                           root_dir, package_name,
+                                           resource_type)
+            self.parse_cache.set(ParseCache.MACRO, key, file_checksum,
+                                 [m.serialize() for m in parsed.values()])
+            result.update(parsed)
 
         return result
@@ -0,0 +1,153 @@
+import json
+import os
+
+import dbt.clients.system
+import dbt.context.common
+import dbt.flags
+import dbt.utils
+
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.version import __version__ as dbt_version
+
+
+PARSE_CACHE_FILE_NAME = 'partial_parse.json'
+
+
+def checksum(*parts):
+    """Hash the given json-serializable values."""
+    return dbt.utils.md5(json.dumps(parts, sort_keys=True,
+                                    cls=dbt.utils.JSONEncoder))
+
+
+def config_checksum(all_projects):
+    """Hash everything about the configuration that can change the result of
+    rendering a file at parse time: every project's config and vars, the cli
+    vars, the profile and target, and the flags.
+    """
+    return checksum(
+        {name: project.serialize() for name, project in all_projects.items()},
+        dbt.flags.STRICT_MODE,
+        dbt.flags.NON_DESTRUCTIVE,
+        dbt.flags.FULL_REFRESH,
+    )
+
+
+def macros_checksum(macros):
+    return checksum(sorted(
+        (unique_id, macro.original_file_path, macro.raw_sql)
+        for unique_id, macro in macros.items()
+    ))
+
+
+def read_env_vars(names):
+    return {name: os.environ.get(name) for name in names}
+
+
+class ParseCache(object):
+    """The results of parsing each file, keyed by a checksum of the file's
+    contents, so that files that have not changed since the last run do not
+    have to be parsed again.
+
+    Macro and documentation files are parsed without a context, so their
+    results only depend on the file itself. Every other file is rendered,
+    and the result can depend on any macro, on the configuration, and on
+    any environment variable read with env_var(). Those results are only
+    reused if none of those have changed. dbt doesn't record which macros
+    a node calls while it's parsed, so a change to any macro invalidates
+    all of them.
+
+    Entries are moved to a new cache as they are used or added, so files
+    that no longer exist are dropped from the cache when it is written.
+    """
+    MACRO = 'macro'
+    DOCS = 'docs'
+    NODE = 'node'
+    SCHEMA = 'schema'
+    RENDERED = (NODE, SCHEMA)
+
+    def __init__(self, config_checksum, entries=None, env_vars=None,
+                 macros_checksum=None):
+        self.config_checksum = config_checksum
+        self.macros_checksum = macros_checksum
+        self.env_vars = set(env_vars or ())
+        self.entries = entries or {}
+        self.new_entries = {}
+
+    @classmethod
+    def load(cls, path, all_projects):
+        """Load the cache at the given path, dropping any results that the
+        current configuration and environment invalidate.
+
+        This starts a new parse, so it also forgets the environment variables
+        read before it, which a long-running process may have recorded while
+        parsing another project.
+        """
+        dbt.context.common.ENV_VARS_READ.clear()
+        current = config_checksum(all_projects)
+        if not os.path.exists(path):
+            return cls(current)
+
+        try:
+            data = json.loads(dbt.clients.system.load_file_contents(path))
+        except ValueError:
+            logger.debug('Ignoring invalid parse cache at {}'.format(path))
+            return cls(current)
+
+        if data.get('dbt_version') != dbt_version:
+            return cls(current)
+
+        entries = data.get('entries', {})
+        env_vars = data.get('env_vars', {})
+        changed = (data.get('config_checksum') != current or
+                   read_env_vars(env_vars) != env_vars)
+        if changed:
+            logger.debug('Configuration changed, re-parsing all nodes')
+            for kind in cls.RENDERED:
+                entries.pop(kind, None)
+            env_vars = {}
+
+        return cls(current, entries=entries, env_vars=env_vars,
+                   macros_checksum=data.get('macros_checksum'))
+
+    def set_macros(self, macros):
+        """Record the loaded macros, dropping the results of rendering nodes
+        if any macro has changed.
+        """
+        current = macros_checksum(macros)
+        if current != self.macros_checksum:
+            logger.debug('Macros changed, re-parsing all nodes')
+            for kind in self.RENDERED:
+                self.entries.pop(kind, None)
+            self.macros_checksum = current
+
+    def get(self, kind, key, file_checksum):
+        """Return the cached result for the given file, or None if it has not
+        been parsed before or has changed since.
+        """
+        entry = self.entries.get(kind, {}).pop(key, None)
+        if entry is None or entry['checksum'] != file_checksum:
+            return None
+        self.new_entries.setdefault(kind, {})[key] = entry
+        return entry['result']
+
+    def set(self, kind, key, file_checksum, result):
+        """Cache the result of parsing the given file. It must be
+        json-serializable and not be changed afterwards.
+        """
+        self.new_entries.setdefault(kind, {})[key] = {
+            'checksum': file_checksum,
+            'result': result,
+        }
+
+    def serialize(self):
+        env_vars = self.env_vars | dbt.context.common.ENV_VARS_READ
+        return {
+            'dbt_version': dbt_version,
+            'config_checksum': self.config_checksum,
+            'macros_checksum': self.macros_checksum,
+            'env_vars': read_env_vars(env_vars),
+            'entries': self.new_entries,
+        }
+
+    def write(self, path):
+        dbt.clients.system.write_json(path, self.serialize())
@@ -0,0 +1,155 @@
+import dbt.clients.yaml_helper
+import dbt.context.common
+import dbt.exceptions
+import dbt.utils
+
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.parser.schemas import SchemaParser
+
+
+# the projects and macros that parse worker processes parse against. They are
+# set while the workers fork, so the workers inherit them instead of having
+# them pickled.
+_PARSE_WORKER_STATE = {}
+
+# the number of chunks to split the files into for each worker, so that a
+# worker that gets slow files doesn't hold up the others for long
+CHUNKS_PER_PROCESS = 4
+
+
+def _parse_chunk(parse, items):
+    """Parse the items with the given function. The result of an item is None
+    if it could not be parsed, in which case it's parsed again in the main
+    process to report the error.
+
+    Also return the names of any environment variables read while parsing,
+    as the parse cache has to check them for changes.
+    """
+    env_vars_read = set(dbt.context.common.ENV_VARS_READ)
+    results = []
+    for item in items:
+        try:
+            results.append(parse(*item))
+        except Exception as exc:
+            logger.debug('Could not parse in a worker process, it will be '
+                         'parsed again: {}'.format(exc))
+            results.append(None)
+    env_vars_read = dbt.context.common.ENV_VARS_READ - env_vars_read
+    return results, env_vars_read
+
+
+def _parse_sql_node(parser, node_dict, tags):
+    unique_id, node = parser.parse_sql_node(node_dict, tags)
+    return unique_id, node.serialize()
+
+
+def _parse_sql_chunk(chunk, parser_type, tags):
+    parser = parser_type(_PARSE_WORKER_STATE['root_project'],
+                         _PARSE_WORKER_STATE['all_projects'],
+                         _PARSE_WORKER_STATE['macro_manifest'])
+    items = [(parser, node_dict, tags) for node_dict in chunk]
+    return _parse_chunk(_parse_sql_node, items)
+
+
+def _parse_schema_file(parser, path, test_path, file_contents, package_name,
+                       root_dir):
+    try:
+        test_yml = dbt.clients.yaml_helper.load_yaml_text(file_contents)
+    except dbt.exceptions.ValidationException:
+        test_yml = None
+    if test_yml is None:
+        # let the main process skip the file, and log why
+        return None
+    results = parser.parse_schema_yml(path, test_yml, package_name, root_dir)
+    return [(result_type, node.serialize()) for result_type, node in results]
+
+
+def _parse_schema_chunk(chunk):
+    parser = SchemaParser(_PARSE_WORKER_STATE['root_project'],
+                          _PARSE_WORKER_STATE['all_projects'],
+                          _PARSE_WORKER_STATE['macro_manifest'])
+    items = [(parser,) + tuple(schema_file) for schema_file in chunk]
+    return _parse_chunk(_parse_schema_file, items)
+
+
+class ParsePool(object):
+    """Parse files in worker processes.
+
+    Rendering jinja is CPU-bound, and once the macros are loaded each file can
+    be parsed on its own, so the files are split into chunks and parsed in
+    separate processes. The workers are forked once the macros are loaded,
+    and inherit the projects and the macro manifest from the main process.
+    The results come back in the order of the files, so they are merged
+    exactly as if they had been parsed one after another.
+
+    Parsing in a worker is best effort: a file that fails to parse is parsed
+    again in the main process, so that errors are reported as usual.
+
+    :param RuntimeConfig root_project: The root project config.
+    :param Dict[str, RuntimeConfig] all_projects: Every project by name.
+    :param Manifest macro_manifest: A manifest of the loaded macros.
+    :param int processes: The number of worker processes.
+    """
+    def __init__(self, root_project, all_projects, macro_manifest,
+                 processes):
+        self.processes = processes
+        self._pool = None
+
+        context = dbt.utils.fork_context()
+        if context is None:
+            logger.debug('Cannot fork on this platform, files will be parsed '
+                         'in one process')
+            return
+
+        _PARSE_WORKER_STATE.update(root_project=root_project,
+                                   all_projects=all_projects,
+                                   macro_manifest=macro_manifest)
+        try:
+            self._pool = context.Pool(processes)
+        finally:
+            _PARSE_WORKER_STATE.clear()
+
+    def _chunks(self, items):
+        num_chunks = self.processes * CHUNKS_PER_PROCESS
+        size = max(1, (len(items) + num_chunks - 1) // num_chunks)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _map(self, func, chunks, *args):
+        if self._pool is None or not chunks:
+            return [None] * sum(len(c) for c in chunks)
+
+        pending = [
+            self._pool.apply_async(func, (chunk,) + args) for chunk in chunks
+        ]
+        results = []
+        for chunk_result in pending:
+            chunk_results, env_vars_read = chunk_result.get()
+            dbt.context.common.ENV_VARS_READ.update(env_vars_read)
+            results.extend(chunk_results)
+        return results
+
+    def parse_sql_nodes(self, parser_type, nodes, tags):
+        """Parse the given nodes with a parser of the given type.
+
+        :return List[Optional[Tuple[str, dict]]]: The unique ID and the
+            serialized ParsedNode of each node, or None if it was not parsed.
+        """
+        return self._map(_parse_sql_chunk, self._chunks(list(nodes)),
+                         parser_type, tags)
+
+    def parse_schema_files(self, schema_files):
+        """Parse the given schema.yml files, each given as a tuple of its
+        path, its path relative to the searched directory, its contents, its
+        package name and its project root.
+
+        :return List[Optional[List[Tuple[str, dict]]]]: The result type and
+            serialized node of each result of each file, or None if it was
+            not parsed.
+        """
+        return self._map(_parse_schema_chunk, self._chunks(list(schema_files)))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
@@ -19,8 +19,10 @@ from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import get_pseudo_test_path
 from dbt.contracts.graph.unparsed import UnparsedNode, UnparsedNodeUpdate, \
     UnparsedSourceDefinition
-from dbt.contracts.graph.parsed import ParsedNodePatch, ParsedSourceDefinition
+from dbt.contracts.graph.parsed import ParsedNode, ParsedNodePatch, \
+    ParsedSourceDefinition
 from dbt.parser.base import MacrosKnownParser
+from dbt.parser.partial import ParseCache, checksum
 from dbt.config.renderer import ConfigRenderer
 
 
@@ -498,16 +500,26 @@ class SchemaSourceParser(SchemaBaseTestParser):
 
 
 class SchemaParser(object):
-    def __init__(self, root_project_config, all_projects, macro_manifest):
+    # the type of node for each type of result
+    RESULT_TYPES = {
+        'patch': ParsedNodePatch,
+        'test': ParsedNode,
+        'source': ParsedSourceDefinition,
+    }
+
+    def __init__(self, root_project_config, all_projects, macro_manifest,
+                 parse_cache=None, parse_pool=None):
         self.root_project_config = root_project_config
         self.all_projects = all_projects
         self.macro_manifest = macro_manifest
+        self.parse_cache = parse_cache
+        self.parse_pool = parse_pool
 
     @classmethod
-    def find_schema_yml(cls, package_name, root_dir, relative_dirs):
-        """This is common to both v1 and v2 - look through the relative_dirs
-        under root_dir for .yml files yield pairs of filepath and loaded yaml
-        contents.
+    def find_schema_files(cls, package_name, root_dir, relative_dirs):
+        """Look through the relative_dirs under root_dir for .yml files and
+        yield the filepath, the path relative to the searched directory and
+        the contents of each one.
         """
         extension = "[!.#~]*.yml"
 
@@ -524,15 +536,28 @@ class SchemaParser(object):
             original_file_path = os.path.join(file_match.get('searched_path'),
                                               test_path)
 
-            try:
-                test_yml = dbt.clients.yaml_helper.load_yaml_text(
-                    file_contents
-                )
-            except dbt.exceptions.ValidationException as e:
-                test_yml = None
-                logger.info("Error reading {}:{} - Skipping\n{}".format(
-                            package_name, test_path, e))
+            yield original_file_path, test_path, file_contents
 
+    @classmethod
+    def load_schema_yml(cls, package_name, test_path, file_contents):
+        try:
+            return dbt.clients.yaml_helper.load_yaml_text(file_contents)
+        except dbt.exceptions.ValidationException as e:
+            logger.info("Error reading {}:{} - Skipping\n{}".format(
+                        package_name, test_path, e))
+            return None
+
+    @classmethod
+    def find_schema_yml(cls, package_name, root_dir, relative_dirs):
+        """This is common to both v1 and v2 - look through the relative_dirs
+        under root_dir for .yml files yield pairs of filepath and loaded yaml
+        contents.
+        """
+        iterator = cls.find_schema_files(package_name, root_dir,
+                                         relative_dirs)
+        for original_file_path, test_path, file_contents in iterator:
+            test_yml = cls.load_schema_yml(package_name, test_path,
+                                           file_contents)
             if test_yml is None:
                 continue
 
@@ -567,6 +592,110 @@ class SchemaParser(object):
             )
         return version
 
+    def parse_schema_yml(self, path, test_yml, package_name, root_dir):
+        """Check the version of a loaded schema.yml file and parse it into a
+        list of (result type, node) pairs.
+        """
+        version = self._parse_format_version(path, test_yml)
+        if version != 2:
+            dbt.exceptions.raise_invalid_schema_yml_version(
+                path,
+                'version {} is not supported'.format(version)
+            )
+
+        return list(self.parse_schema(path, test_yml, package_name, root_dir))
+
+    def _load_results(self, serialized):
+        return [
+            (result_type, self.RESULT_TYPES[result_type].from_trusted(**node))
+            for result_type, node in serialized
+        ]
+
+    @staticmethod
+    def _cache_key(path, file_contents, package_name, root_dir):
+        key = '{}.{}'.format(package_name, path)
+        return key, checksum(file_contents, root_dir)
+
+    def _parse_schema_file(self, path, test_path, file_contents, package_name,
+                           root_dir):
+        if self.parse_cache is not None:
+            key, file_checksum = self._cache_key(path, file_contents,
+                                                 package_name, root_dir)
+            cached = self.parse_cache.get(ParseCache.SCHEMA, key,
+                                          file_checksum)
+            if cached is not None:
+                return self._load_results(cached)
+
+        test_yml = self.load_schema_yml(package_name, test_path,
+                                        file_contents)
+        if test_yml is None:
+            # don't cache invalid yaml, so the error is logged on every run
+            return []
+
+        results = self.parse_schema_yml(path, test_yml, package_name,
+                                        root_dir)
+        if self.parse_cache is not None:
+            self.parse_cache.set(ParseCache.SCHEMA, key, file_checksum, [
+                (result_type, node.serialize())
+                for result_type, node in results
+            ])
+        return results
+
+    def _parse_schema_files_in_pool(self, schema_files):
+        """Parse the schema files that aren't in the parse cache in the parse
+        pool. Returns the results of each file, in order.
+        """
+        results = [None] * len(schema_files)
+        missed = []
+        for idx, schema_file in enumerate(schema_files):
+            path, _, file_contents, package_name, root_dir = schema_file
+            if self.parse_cache is not None:
+                key, file_checksum = self._cache_key(path, file_contents,
+                                                     package_name, root_dir)
+                cached = self.parse_cache.get(ParseCache.SCHEMA, key,
+                                              file_checksum)
+                if cached is not None:
+                    results[idx] = self._load_results(cached)
+                    continue
+            missed.append(idx)
+
+        parsed = self.parse_pool.parse_schema_files(
+            [schema_files[idx] for idx in missed]
+        )
+        for idx, result in zip(missed, parsed):
+            if result is None:
+                results[idx] = self._parse_schema_file(*schema_files[idx])
+                continue
+
+            path, _, file_contents, package_name, root_dir = schema_files[idx]
+            if self.parse_cache is not None:
+                key, file_checksum = self._cache_key(path, file_contents,
+                                                     package_name, root_dir)
+                self.parse_cache.set(ParseCache.SCHEMA, key, file_checksum,
+                                     result)
+            results[idx] = self._load_results(result)
+
+        return results
+
+    def _parse_schema_files(self, package_name, root_dir, relative_dirs):
+        if self.parse_cache is None and self.parse_pool is None:
+            return (
+                self.parse_schema_yml(path, test_yml, package_name, root_dir)
+                for path, test_yml in self.find_schema_yml(
+                    package_name, root_dir, relative_dirs
+                )
+            )
+
+        schema_files = [
+            (path, test_path, file_contents, package_name, root_dir)
+            for path, test_path, file_contents in self.find_schema_files(
+                package_name, root_dir, relative_dirs
+            )
+        ]
+        if self.parse_pool is None:
+            return (self._parse_schema_file(*f) for f in schema_files)
+        return self._parse_schema_files_in_pool(schema_files)
+
     def load_and_parse(self, package_name, root_dir, relative_dirs):
         if dbt.flags.STRICT_MODE:
             dbt.contracts.project.ProjectList(**self.all_projects)
@@ -574,17 +703,10 @@ class SchemaParser(object):
         node_patches = {}  # model name -> dict
         new_sources = {}  # source unique ID -> ParsedSourceDefinition
 
-        iterator = self.find_schema_yml(package_name, root_dir, relative_dirs)
-
-        for path, test_yml in iterator:
-            version = self._parse_format_version(path, test_yml)
-            if version != 2:
-                dbt.exceptions.raise_invalid_schema_yml_version(
-                    path,
-                    'version {} is not supported'.format(version)
-                )
+        iterator = self._parse_schema_files(package_name, root_dir,
+                                            relative_dirs)
 
-            results = self.parse_schema(path, test_yml, package_name, root_dir)
+        for results in iterator:
             for result_type, node in results:
                 if result_type == 'patch':
                     node_patches[node.name] = node
@@ -238,7 +238,7 @@ class ParserUtils(object):
         """
         manifest = manifest.deepcopy(config=current_project)
         # it's ok for macros to silently override a local project macro name
-        manifest.macros.update(macros)
+        manifest.add_macros(macros)
 
         if node.unique_id in manifest.nodes:
             # this should be _impossible_ due to the fact that rpc calls get
@@ -246,7 +246,7 @@ class ParserUtils(object):
             raise dbt.exceptions.raise_duplicate_resource_name(
                 manifest.nodes[node.unique_id], node
             )
-        manifest.nodes[node.unique_id] = node
+        manifest.add_nodes({node.unique_id: node})
         cls.process_sources_for_node(manifest, current_project, node)
         cls.process_refs_for_node(manifest, current_project, node)
         cls.process_docs_for_node(manifest, current_project, node)
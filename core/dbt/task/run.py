@@ -12,7 +12,6 @@ from dbt.hooks import get_hook_dict
 
 from dbt.compilation import compile_node
 from dbt.task.compile import CompileTask, RemoteCompileTask
-from dbt.utils import get_nodes_by_tags
 
 
 class RunTask(CompileTask):
@@ -24,10 +23,16 @@ class RunTask(CompileTask):
 
     def run_hooks(self, adapter, hook_type, extra_context):
 
-        nodes = self.manifest.nodes.values()
-        hooks = get_nodes_by_tags(nodes, {hook_type}, NodeType.Operation)
+        hooks = [
+            self.manifest.nodes[unique_id]
+            for unique_id in self.manifest.get_unique_ids_by_tag(hook_type)
+        ]
 
-        ordered_hooks = sorted(hooks, key=lambda h: h.get('index', len(hooks)))
+        # the index only orders hooks within a project, so break ties by ID to
+        # keep the order stable
+        ordered_hooks = sorted(
+            hooks, key=lambda h: (h.get('index', len(hooks)), h.unique_id)
+        )
 
         # on-run-* hooks should run outside of a transaction. This happens
         # b/c psycopg2 automatically begins a transaction when a connection
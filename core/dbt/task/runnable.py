@@ -1,6 +1,9 @@
 import base64
+import io
+import json
 import os
 import re
+import threading
 import time
 from abc import abstractmethod
 from multiprocessing.dummy import Pool as ThreadPool
@@ -11,11 +14,13 @@ from dbt.task.base import ConfiguredTask
 from dbt.adapters.factory import get_adapter
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.compat import to_unicode
-from dbt.compilation import compile_manifest
+from dbt.compilation import compile_manifest, CompilePool
 from dbt.contracts.graph.manifest import CompileResultNode
-from dbt.contracts.results import ExecutionResult
+from dbt.contracts.results import ExecutionResult, RunModelResult
+from dbt.linker import SchedulingPolicy
 from dbt.loader import GraphLoader
 
+import dbt.clients.system
 import dbt.exceptions
 import dbt.ui.printer
 import dbt.utils
@@ -24,6 +29,217 @@ import dbt.graph.selector
 
 RESULT_FILE_NAME = 'run_results.json'
 MANIFEST_FILE_NAME = 'manifest.json'
+CHECKPOINT_FILE_NAME = '{}_results.checkpoint'
+
+
+def load_execution_times(paths):
+    """Load historical execution times from the given run_results.json files.
+    Only nodes that ran successfully are included. If a node appears in more
+    than one file, its execution times are averaged. Missing files are
+    ignored.
+
+    :param List[str] paths: The paths to run_results.json files.
+    :return Dict[str, float]: A mapping of unique IDs to execution times, in
+        seconds.
+    """
+    totals = {}
+    for path in paths:
+        if not dbt.clients.system.path_exists(path):
+            logger.debug('No run results found at {}'.format(path))
+            continue
+        contents = dbt.clients.system.load_file_contents(path)
+        for result in json.loads(contents).get('results', []):
+            if result.get('error') is not None or result.get('skip'):
+                continue
+            unique_id = result['node']['unique_id']
+            execution_time = result.get('execution_time', 0)
+            total, count = totals.get(unique_id, (0, 0))
+            totals[unique_id] = (total + execution_time, count + 1)
+
+    return {
+        unique_id: float(total) / count
+        for unique_id, (total, count) in totals.items()
+    }
+
+
+class ResultCheckpoint(object):
+    """An append-only record of the results of a run, written one JSON object
+    per line as each node finishes, so that an interrupted run can be
+    resumed.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._fp = None
+
+    def open(self, resume=False):
+        """Open the checkpoint for writing. Unless resuming, any existing
+        checkpoint is truncated.
+        """
+        dbt.clients.system.make_directory(os.path.dirname(self.path))
+        mode = 'a' if resume else 'w'
+        self._fp = io.open(self.path, mode, encoding='utf-8')
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def remove(self):
+        self.close()
+        if dbt.clients.system.path_exists(self.path):
+            dbt.clients.system.remove_file(self.path)
+
+    def write(self, result):
+        if self._fp is None:
+            return
+        line = json.dumps(result.serialize(), cls=dbt.utils.JSONEncoder)
+        self._fp.write(to_unicode(line) + u'\n')
+        # flush every line: the whole point is to survive a crash
+        self._fp.flush()
+
+    def load_succeeded(self):
+        """Load the results of every node that succeeded according to the
+        checkpoint. A truncated last line, left by a crash mid-write, is
+        ignored.
+
+        :return List[RunModelResult]: The successful results.
+        """
+        if not dbt.clients.system.path_exists(self.path):
+            return []
+
+        results = []
+        contents = dbt.clients.system.load_file_contents(self.path)
+        for line in contents.splitlines():
+            try:
+                data = json.loads(line)
+            except ValueError:
+                logger.debug('Ignoring invalid checkpoint line in {}'
+                             .format(self.path))
+                continue
+            if data.get('error') is not None or data.get('skip') or \
+                    data.get('fail'):
+                continue
+            results.append(RunModelResult(
+                node=CompileResultNode(**data['node']),
+                error=None,
+                skip=False,
+                status=data.get('status'),
+                failed=data.get('fail'),
+                thread_id=data.get('thread_id'),
+                timing=data.get('timing'),
+                execution_time=data.get('execution_time', 0),
+            ))
+        return results
+
+
+class AdaptiveConcurrency(object):
+    """Limit the number of nodes that run at once, adjusting the limit as
+    queries run based on their latency.
+
+    The latency of each node's main statement is recorded, divided by that
+    node's historical execution time, and grouped into windows. Different
+    windows run different models, so comparing raw latencies would mistake a
+    window of slow models for queueing; the relative latencies only rise when
+    every model gets slower. The median relative latency of the fastest
+    window seen since the limit last backed off is the baseline. When a
+    window's median goes past `tolerance` times the baseline, the warehouse
+    is assumed to be queueing our queries and the limit backs off, and that
+    window's median becomes the new baseline, so the limit only keeps backing
+    off while latency keeps rising. When latency is near the baseline and
+    nodes had to wait for a slot, the limit grows by one.
+
+    Nodes with no historical execution time, and nodes whose materialization
+    doesn't run its main statement with the `statement` macro, are left out.
+    If no node can be measured, the limit stays where it started.
+
+    :param int initial: The limit to start at.
+    :param int maximum: The largest the limit may grow to.
+    :param QueryLatencies latencies: Where query latencies are recorded.
+    :param Dict[str, float] execution_times: The historical execution time
+        of each node, in seconds, as returned by `load_execution_times`.
+    """
+    MINIMUM = 1
+    WINDOW_SIZE = 10
+    TOLERANCE = 1.5
+    GROWTH_THRESHOLD = 1.2
+    BACKOFF = 0.75
+
+    def __init__(self, initial, maximum, latencies, execution_times):
+        self.limit = initial
+        self.maximum = max(initial, maximum)
+        self.latencies = latencies
+        self.execution_times = execution_times
+        self.active = 0
+        self.baseline = None
+        self.condition = threading.Condition()
+        self._samples = []
+        self._waited = False
+        self._started_at = time.time()
+        # (seconds since the start, limit) every time the limit changes
+        self.history = [(0.0, initial)]
+
+    def acquire(self):
+        """Wait for a slot to run a node in."""
+        with self.condition:
+            while self.active >= self.limit:
+                self._waited = True
+                self.condition.wait()
+            self.active += 1
+
+    def release(self):
+        """Give back a node's slot and, if enough queries have run, adjust
+        the limit.
+        """
+        with self.condition:
+            self.active -= 1
+            self._samples.extend(self._normalize(self.latencies.drain()))
+            if len(self._samples) >= self.WINDOW_SIZE:
+                self._adjust(self._samples)
+                self._samples = []
+                self._waited = False
+            self.condition.notify_all()
+
+    def _normalize(self, latencies):
+        for unique_id, seconds in latencies:
+            execution_time = self.execution_times.get(unique_id)
+            if execution_time:
+                yield seconds / execution_time
+
+    def _adjust(self, samples):
+        samples = sorted(samples)
+        current = samples[len(samples) // 2]
+        if self.baseline is None or current < self.baseline:
+            self.baseline = current
+        if self.baseline <= 0:
+            return
+
+        baseline = self.baseline
+        ratio = float(current) / baseline
+        if ratio > self.TOLERANCE:
+            limit = min(self.limit - 1, int(self.limit * self.BACKOFF))
+            limit = max(self.MINIMUM, limit)
+            # judge the lower limit against the latency it starts at, or the
+            # limit could never recover from latency that rose for good
+            self.baseline = current
+        elif ratio < self.GROWTH_THRESHOLD and self._waited:
+            limit = min(self.maximum, self.limit + 1)
+        else:
+            return
+
+        if limit != self.limit:
+            logger.debug(
+                'Adjusting concurrency from {} to {} threads (median '
+                'relative query latency {:0.2f}, baseline {:0.2f})'
+                .format(self.limit, limit, current, baseline)
+            )
+            self.limit = limit
+            self.history.append((time.time() - self._started_at, limit))
+
+    def serialize(self):
+        return [
+            {'elapsed': elapsed, 'threads': threads}
+            for elapsed, threads in self.history
+        ]
 
 
 def load_manifest(config):
@@ -59,17 +275,74 @@ class GraphRunnableTask(ManifestTask):
         self.node_results = []
         self._skipped_children = {}
         self._raise_next_tick = None
+        self.checkpoint = None
+        self.adaptive_concurrency = None
+        self.compile_pool = None
 
     def select_nodes(self):
         selector = dbt.graph.selector.NodeSelector(self.linker, self.manifest)
         selected_nodes = selector.select(self.build_query())
         return selected_nodes
 
+    def load_execution_times(self):
+        """Load the historical execution times of the nodes from the
+        requested run_results.json files, or from the last run's results.
+        """
+        paths = getattr(self.args, 'run_results', None)
+        if not paths:
+            paths = [self.result_path()]
+        return load_execution_times(paths)
+
+    def get_execution_times(self):
+        """Get the historical execution times to schedule by, or None if the
+        critical-path scheduling policy was not requested.
+        """
+        policy = getattr(self.args, 'scheduling_policy', None)
+        if policy != SchedulingPolicy.CriticalPath:
+            return None
+        return self.load_execution_times()
+
+    def checkpoint_path(self):
+        command = getattr(self.args, 'which', 'run')
+        return os.path.join(self.config.target_path,
+                            CHECKPOINT_FILE_NAME.format(command))
+
+    def is_resuming(self):
+        return getattr(self.args, 'resume', False)
+
+    def load_resumed_results(self, selected_nodes):
+        """Load the successful results of the interrupted run that we are
+        resuming, if any, limited to the selected nodes.
+        """
+        if not self.is_resuming():
+            return []
+        results = [
+            r for r in self.checkpoint.load_succeeded()
+            if r.node.unique_id in selected_nodes
+        ]
+        logger.info('Resuming: {} nodes already completed successfully'
+                    .format(len(results)))
+        return results
+
     def _runtime_initialize(self):
         super(GraphRunnableTask, self)._runtime_initialize()
+        self.checkpoint = ResultCheckpoint(self.checkpoint_path())
         selected_nodes = self.select_nodes()
-        self.job_queue = self.linker.as_graph_queue(self.manifest,
-                                                    selected_nodes)
+
+        # nodes that already succeeded are dropped from the graph queue. The
+        # subgraph keeps the ordering between the remaining nodes, so this is
+        # the same as marking them done before starting.
+        self.node_results = self.load_resumed_results(selected_nodes)
+        selected_nodes = selected_nodes.difference(
+            r.node.unique_id for r in self.node_results
+        )
+
+        self.job_queue = self.linker.as_graph_queue(
+            self.manifest,
+            selected_nodes,
+            execution_times=self.get_execution_times(),
+            concurrency=self.config.concurrency
+        )
 
         # we use this a couple times. order does not matter.
         self._flattened_nodes = [
@@ -105,7 +378,9 @@ class GraphRunnableTask(ManifestTask):
             num_nodes = self.num_nodes
 
         cls = self.get_runner_type()
-        return cls(self.config, adapter, node, run_count, num_nodes)
+        runner = cls(self.config, adapter, node, run_count, num_nodes)
+        runner.compile_pool = self.compile_pool
+        return runner
 
     def call_runner(self, runner):
         # TODO: create+enforce an actual contracts for what `result` is instead
@@ -140,14 +415,20 @@ class GraphRunnableTask(ManifestTask):
     def run_queue(self, pool):
         """Given a pool, submit jobs from the queue to the pool.
         """
+        adaptive = self.adaptive_concurrency
+
         def callback(result):
             """Note: mark_done, at a minimum, must happen here or dbt will
             deadlock during ephemeral result error handling!
             """
             self._handle_result(result)
             self.job_queue.mark_done(result.node.unique_id)
+            if adaptive is not None:
+                adaptive.release()
 
         while not self.job_queue.empty():
+            if adaptive is not None:
+                adaptive.acquire()
             node = self.job_queue.get()
             self._raise_set_error()
             runner = self.get_runner(node)
@@ -174,8 +455,9 @@ class GraphRunnableTask(ManifestTask):
         is_ephemeral = result.node.is_ephemeral_model
         if not is_ephemeral:
             self.node_results.append(result)
+            self.checkpoint.write(result)
 
-        node = CompileResultNode(**result.node)
+        node = CompileResultNode.from_trusted(**result.node)
         node_id = node.unique_id
         self.manifest.nodes[node_id] = node
 
@@ -186,16 +468,54 @@ class GraphRunnableTask(ManifestTask):
                 cause = None
             self._mark_dependent_errors(node_id, result, cause)
 
+    def get_max_threads(self):
+        """Get the largest number of threads that adaptive concurrency may
+        use, or None if it was not requested.
+        """
+        if not getattr(self.args, 'adaptive_threads', False):
+            return None
+        max_threads = getattr(self.args, 'max_threads', None)
+        if max_threads is None:
+            max_threads = self.config.threads * 2
+        return max(self.config.threads, max_threads)
+
     def execute_nodes(self):
         num_threads = self.config.threads
         target_name = self.config.target_name
+        max_threads = self.get_max_threads()
 
-        text = "Concurrency: {} threads (target='{}')"
-        concurrency_line = text.format(num_threads, target_name)
+        if max_threads is None:
+            text = "Concurrency: {} threads (target='{}')"
+            concurrency_line = text.format(num_threads, target_name)
+        else:
+            text = "Concurrency: adaptive, {} to {} threads (target='{}')"
+            concurrency_line = text.format(num_threads, max_threads,
+                                           target_name)
+            adapter = get_adapter(self.config)
+            execution_times = self.load_execution_times()
+            if not execution_times:
+                logger.info('No run results found to compare query latency '
+                            'against; concurrency will stay at {} threads'
+                            .format(num_threads))
+            self.adaptive_concurrency = AdaptiveConcurrency(
+                num_threads, max_threads, adapter.connections.query_latencies,
+                execution_times
+            )
+            num_threads = max_threads
         dbt.ui.printer.print_timestamped_line(concurrency_line)
         dbt.ui.printer.print_timestamped_line("")
 
+        # fork the compile processes before starting any threads
+        compile_processes = getattr(self.args, 'compile_processes', None)
+        if compile_processes:
+            self.compile_pool = CompilePool(self.config, self.manifest,
+                                            compile_processes)
+            # compile in dependency order, so the nodes that run first are
+            # compiled first
+            self.compile_pool.submit(self.job_queue.graph.topological_sort())
+
         pool = ThreadPool(num_threads)
+        self.checkpoint.open(resume=self.is_resuming())
         try:
             self.run_queue(pool)
 
@@ -224,13 +544,20 @@ class GraphRunnableTask(ManifestTask):
 
             raise
 
+        finally:
+            self.checkpoint.close()
+            if self.compile_pool is not None:
+                self.compile_pool.close()
+
         pool.close()
         pool.join()
 
         return self.node_results
 
     def _mark_dependent_errors(self, node_id, result, cause):
-        for dep_node_id in self.linker.get_dependent_nodes(node_id):
+        # only nodes in this run can be skipped, so use the queue's graph
+        # rather than walking the linker's full graph
+        for dep_node_id in self.job_queue.get_dependent_nodes(node_id):
             self._skipped_children[dep_node_id] = cause
 
     def before_hooks(self, adapter):
@@ -283,6 +610,10 @@ class GraphRunnableTask(ManifestTask):
         result = self.execute_with_hooks(selected_uids)
 
         result.write(self.result_path())
+        # keep the checkpoint around if anything failed, so that the run can
+        # be resumed after fixing it.
+        if self.interpret_results(result.results):
+            self.checkpoint.remove()
 
         self.task_end_messages(result.results)
         return result.results
@@ -325,10 +656,14 @@ class GraphRunnableTask(ManifestTask):
             adapter.create_schema(database, schema)
 
     def get_result(self, results, elapsed_time, generated_at):
+        kwargs = {}
+        if self.adaptive_concurrency is not None:
+            kwargs['concurrency'] = self.adaptive_concurrency.serialize()
         return ExecutionResult(
             results=results,
             elapsed_time=elapsed_time,
-            generated_at=generated_at
+            generated_at=generated_at,
+            **kwargs
         )
 
     def task_end_messages(self, results):
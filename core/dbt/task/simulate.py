@@ -0,0 +1,241 @@
+import heapq
+import json
+import os
+
+from dbt.compat import QueueEmpty
+from dbt.compilation import graph_file_name
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedNode, ParsedSourceDefinition
+from dbt.linker import from_file, is_blocking_dependency, SchedulingPolicy
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.node_types import NodeType
+from dbt.task.base import ProjectOnlyTask
+from dbt.task.runnable import load_execution_times, RESULT_FILE_NAME, \
+    MANIFEST_FILE_NAME
+from dbt.utils import timestring
+import dbt.clients.system
+import dbt.exceptions
+import dbt.graph.selector
+
+
+DEFAULT_THREAD_COUNTS = [1, 2, 4, 8, 16]
+
+
+def manifest_from_json(contents):
+    """Build a Manifest from the nodes in a manifest.json. It has just enough
+    for node selection and the GraphQueue.
+    """
+    parsed = {}
+    for unique_id, data in contents.get('nodes', {}).items():
+        if data.get('resource_type') == NodeType.Source:
+            parsed[unique_id] = ParsedSourceDefinition(**data)
+        else:
+            parsed[unique_id] = ParsedNode(**data)
+    generated_at = contents.get('generated_at') or timestring()
+    return Manifest(nodes=parsed, macros={}, docs={},
+                    generated_at=generated_at, disabled=[])
+
+
+class ScheduleSimulation(object):
+    def __init__(self, policy, threads, makespan, busy_time):
+        self.policy = policy
+        self.threads = threads
+        self.makespan = makespan
+        self.busy_time = busy_time
+
+    @property
+    def utilization(self):
+        if self.makespan == 0:
+            return 0.0
+        return self.busy_time / (self.threads * self.makespan)
+
+
+def simulate_schedule(queue, durations, threads):
+    """Simulate running the given GraphQueue with the given number of
+    threads, the same way GraphRunnableTask.run_queue hands out nodes: as
+    soon as a worker is free, it takes the highest priority node that is
+    ready.
+
+    :param GraphQueue queue: The queue to simulate. It will be exhausted.
+    :param Dict[str, float] durations: The time each node takes, in seconds.
+    :param int threads: The number of worker threads.
+    :return Tuple[float, float]: The makespan and the total time workers were
+        busy, in seconds.
+    """
+    now = 0.0
+    busy_time = 0.0
+    # (finish time, start order, unique ID) of each node that is running
+    running = []
+    started = 0
+    while True:
+        while len(running) < threads:
+            try:
+                node = queue.get(block=False)
+            except QueueEmpty:
+                break
+            duration = durations[node.unique_id]
+            busy_time += duration
+            heapq.heappush(running, (now + duration, started, node.unique_id))
+            started += 1
+
+        if not running:
+            break
+
+        now, _, unique_id = heapq.heappop(running)
+        queue.mark_done(unique_id)
+
+    return now, busy_time
+
+
+def find_critical_path(graph, durations):
+    """Find the chain of nodes in the graph with the longest total duration.
+    No number of threads can finish faster than this.
+
+    :return Tuple[float, List[str]]: The length of the critical path in
+        seconds, and its nodes in execution order.
+    """
+    lengths = {}
+    next_node = {}
+    for node in reversed(graph.topological_sort()):
+        best = None
+        for child in graph.successors(node):
+            if best is None or lengths[child] > lengths[best]:
+                best = child
+        next_node[node] = best
+        lengths[node] = durations[node]
+        if best is not None:
+            lengths[node] += lengths[best]
+
+    if not lengths:
+        return 0.0, []
+
+    node = max(lengths, key=lambda n: lengths[n])
+    length = lengths[node]
+    path = []
+    while node is not None:
+        path.append(node)
+        node = next_node[node]
+    return length, path
+
+
+class SimulateTask(ProjectOnlyTask):
+    """Predict how long `dbt run` will take with different thread counts and
+    scheduling policies, using the graph written by the last compile and the
+    execution times of previous runs. This never connects to the warehouse.
+    """
+    def graph_path(self):
+        return os.path.join(self.config.target_path, graph_file_name)
+
+    def manifest_path(self):
+        return os.path.join(self.config.target_path, MANIFEST_FILE_NAME)
+
+    def build_query(self):
+        return {
+            "include": self.args.models,
+            "exclude": self.args.exclude,
+            "resource_types": [NodeType.Model],
+            "tags": [],
+        }
+
+    def _check_exists(self, path, description):
+        if not dbt.clients.system.path_exists(path):
+            raise dbt.exceptions.RuntimeException(
+                'No {} found at {}. Run "dbt compile" first.'
+                .format(description, path)
+            )
+
+    def _load_graph(self):
+        path = self.graph_path()
+        self._check_exists(path, 'graph file')
+        return from_file(path)
+
+    def _load_manifest(self):
+        path = self.manifest_path()
+        self._check_exists(path, 'manifest')
+        contents = dbt.clients.system.load_file_contents(path)
+        return manifest_from_json(json.loads(contents))
+
+    def estimate_durations(self, manifest, selected, execution_times):
+        """Estimate how long each selected node takes to run. Models with no
+        history are assumed to take the median known time, other nodes with
+        no history are assumed to be free.
+        """
+        known = sorted(
+            execution_times[n] for n in selected if n in execution_times
+        )
+        default_time = known[len(known) // 2] if known else 1.0
+
+        durations = {}
+        for unique_id in selected:
+            node = manifest.nodes[unique_id]
+            if unique_id in execution_times:
+                durations[unique_id] = execution_times[unique_id]
+            elif is_blocking_dependency(node) and not node.is_ephemeral:
+                durations[unique_id] = default_time
+            else:
+                durations[unique_id] = 0.0
+        return durations, len(known)
+
+    def simulate(self, linker, manifest, selected, durations, execution_times,
+                 policy, threads):
+        if policy != SchedulingPolicy.CriticalPath:
+            execution_times = None
+        queue = linker.as_graph_queue(manifest, selected,
+                                      execution_times=execution_times,
+                                      concurrency=self.config.concurrency)
+        makespan, busy_time = simulate_schedule(queue, durations, threads)
+        return ScheduleSimulation(policy, threads, makespan, busy_time)
+
+    def run(self):
+        linker = self._load_graph()
+        manifest = self._load_manifest()
+        selector = dbt.graph.selector.NodeSelector(linker, manifest)
+        selected = selector.select(self.build_query())
+
+        if not selected:
+            logger.warning("WARNING: Nothing to do. Try checking your model "
+                           "configs and model specification args")
+            return []
+
+        paths = self.args.run_results
+        if not paths:
+            paths = [os.path.join(self.config.target_path, RESULT_FILE_NAME)]
+        execution_times = load_execution_times(paths)
+        durations, num_known = self.estimate_durations(
+            manifest, selected, execution_times
+        )
+
+        logger.info('Simulating {} nodes, {} with execution history'
+                    .format(len(selected), num_known))
+
+        thread_counts = sorted(set(self.args.threads))
+        results = []
+        for policy in self.args.scheduling_policy:
+            for threads in thread_counts:
+                results.append(self.simulate(
+                    linker, manifest, selected, durations, execution_times,
+                    policy, threads
+                ))
+
+        self.print_results(results)
+
+        subgraph = linker.get_subset_graph(selected)
+        length, path = find_critical_path(subgraph, durations)
+        logger.info('')
+        logger.info('Critical path: {:0.2f}s over {} nodes'
+                    .format(length, len(path)))
+        for unique_id in path:
+            duration = durations[unique_id]
+            logger.info('  {:>10.2f}s  {}'.format(duration, unique_id))
+        return results
+
+    def print_results(self, results):
+        logger.info('')
+        logger.info('{:<15} {:>8} {:>12} {:>12}'.format(
+            'policy', 'threads', 'makespan', 'utilization'
+        ))
+        for result in results:
+            logger.info('{:<15} {:>8} {:>11.2f}s {:>11.1f}%'.format(
+                result.policy, result.threads, result.makespan,
+                result.utilization * 100
+            ))
@@ -5,6 +5,7 @@ import functools
 import hashlib
 import itertools
 import json
+import multiprocessing
 import os
 
 import dbt.exceptions
@@ -63,12 +64,9 @@ def compiler_warning(model, msg, resource_type='model'):
     )
 
 
-def id_matches(unique_id, target_name, target_package, nodetypes, model):
-    """Return True if the unique ID matches the given name, package, and type.
-
-    If package is None, any package is allowed.
-    nodetypes should be a container of NodeTypes that implements the 'in'
-    operator.
+def split_unique_id(unique_id, model):
+    """Split the unique ID of the given model into its resource type, package
+    name and node name, raising a compiler error if it is malformed.
     """
     node_type = model.get('resource_type', 'node')
     node_parts = unique_id.split('.', 2)
@@ -87,6 +85,19 @@ def id_matches(unique_id, target_name, target_package, nodetypes, model):
             msg = "{} names cannot contain '.' characters".format(node_type)
             dbt.exceptions.raise_compiler_error(msg, model)
 
+    return resource_type, package_name, node_name
+
+
+def id_matches(unique_id, target_name, target_package, nodetypes, model):
+    """Return True if the unique ID matches the given name, package, and type.
+
+    If package is None, any package is allowed.
+    nodetypes should be a container of NodeTypes that implements the 'in'
+    operator.
+    """
+    resource_type, package_name, node_name = split_unique_id(unique_id,
+                                                             model)
+
     if resource_type not in nodetypes:
         return False
 
@@ -314,15 +325,6 @@ def get_pseudo_hook_path(hook_name):
     return os.path.join(*path_parts)
 
 
-def get_nodes_by_tags(nodes, match_tags, resource_type):
-    matched_nodes = []
-    for node in nodes:
-        node_tags = node.get('tags', [])
-        if len(set(node_tags) & match_tags):
-            matched_nodes.append(node)
-    return matched_nodes
-
-
 def md5(string):
     return hashlib.md5(string.encode('utf-8')).hexdigest()
 
@@ -480,3 +482,18 @@ def translate_aliases(kwargs, aliases):
         result[canonical_key] = value
 
     return result
+
+
+def fork_context():
+    """Get a multiprocessing context that forks, or None if this platform
+    can't fork.
+    """
+    if os.name != 'posix':
+        return None
+    get_context = getattr(multiprocessing, 'get_context', None)
+    if get_context is None:
+        # python 2 always forks on posix
+        return multiprocessing
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return get_context('fork')
@@ -90,20 +90,20 @@ class BigQueryRelation(BaseRelation):
 
     @property
     def database(self):
-        return self.path.get('database')
+        return self.get_path_part('database')
 
     @property
     def project(self):
-        return self.path.get('database')
+        return self.get_path_part('database')
 
     @property
     def schema(self):
-        return self.path.get('schema')
+        return self.get_path_part('schema')
 
     @property
     def dataset(self):
-        return self.path.get('schema')
+        return self.get_path_part('schema')
 
     @property
     def identifier(self):
-        return self.path.get('identifier')
+        return self.get_path_part('identifier')
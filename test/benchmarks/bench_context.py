@@ -0,0 +1,89 @@
+"""Benchmark building the compilation context of every node, sharing one
+ContextFactory as dbt now does, and building a new one for each node as dbt
+used to rebuild the invariant parts of the context.
+"""
+import sys
+
+from dbt.contracts.graph.parsed import ParsedMacro
+import dbt.context.common
+import dbt.context.runtime
+
+from test.unit.utils import config_from_parts_or_dicts
+
+from .utils import parsed_manifest, timed, report
+
+
+SIZES = (1000, 5000)
+NUM_MACROS = 300
+
+
+def bench_config():
+    project = {
+        'name': 'bench',
+        'version': '0.1',
+        'profile': 'bench',
+        'project-root': '/usr/src/app',
+    }
+    profile = {
+        'outputs': {
+            'test': {
+                'type': 'postgres',
+                'dbname': 'postgres',
+                'user': 'root',
+                'host': 'thishostshouldnotexist',
+                'pass': 'password',
+                'port': 5432,
+                'schema': 'analytics',
+            },
+        },
+        'target': 'test',
+    }
+    return config_from_parts_or_dicts(project, profile)
+
+
+def add_macros(manifest):
+    for idx in range(NUM_MACROS):
+        package = 'dbt' if idx % 2 else 'bench'
+        name = 'macro_{}'.format(idx)
+        manifest.macros['macro.{}.{}'.format(package, name)] = ParsedMacro(
+            name=name,
+            resource_type='macro',
+            unique_id='macro.{}.{}'.format(package, name),
+            package_name=package,
+            depends_on={'macros': []},
+            original_file_path='macros.sql',
+            root_path='/usr/src/app',
+            tags=[],
+            path='macros.sql',
+            raw_sql='{% macro ' + name + '() %}select 1{% endmacro %}',
+        )
+
+
+def generate_all(config, manifest, fresh_factory):
+    for node in manifest.nodes.values():
+        if fresh_factory:
+            manifest._context_factories.clear()
+        dbt.context.runtime.generate(node, config, manifest)
+
+
+def bench_context(size):
+    config = bench_config()
+    manifest = parsed_manifest(size)
+    add_macros(manifest)
+
+    _, elapsed = timed(generate_all, config, manifest, True)
+    report('new context factory per node', size, elapsed,
+           per_node_us=int(elapsed / size * 1e6))
+    _, elapsed = timed(generate_all, config, manifest, False)
+    report('shared context factory', size, elapsed,
+           per_node_us=int(elapsed / size * 1e6))
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_context(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,66 @@
+"""Benchmark Linker.find_cycles on dense synthetic DAGs, with and without a
+cycle.
+"""
+import sys
+
+import networkx as nx
+
+from .utils import synthetic_project, timed, report
+
+
+SIZES = (1000, 10000, 50000)
+MAX_PARENTS = 20
+# simple_cycles is slow on dense graphs even without cycles, and enumerates
+# every cycle, which blows up once there is one: only run it on small graphs
+MAX_LEGACY_SIZE = 1000
+MAX_LEGACY_CYCLIC_SIZE = 30
+
+
+def legacy_find_cycle(graph):
+    """The original implementation of Linker.find_cycles"""
+    cycles = list(nx.simple_cycles(graph))
+    if cycles:
+        return cycles[0]
+    return None
+
+
+def close_cycle(linker):
+    """Add an edge from a late node back to an early one."""
+    nodes = sorted(linker.nodes(), key=lambda n: int(n.rsplit('_', 1)[1]))
+    early, late = nodes[len(nodes) // 10], nodes[-1]
+    if nx.has_path(linker.to_networkx(), early, late):
+        linker.dependency(early, late)
+    else:
+        linker.dependency(early, nodes[len(nodes) // 10 + 1])
+        linker.dependency(nodes[len(nodes) // 10 + 1], early)
+
+
+def bench_find_cycles(size):
+    linker, _ = synthetic_project(size, max_parents=MAX_PARENTS)
+    edges = len(linker.graph.edges())
+    result, elapsed = timed(linker.find_cycles)
+    assert result is None
+    report('find_cycles (acyclic)', size, elapsed, edges=edges)
+    if size <= MAX_LEGACY_SIZE:
+        result, elapsed = timed(legacy_find_cycle, linker.to_networkx())
+        assert result is None
+        report('legacy find_cycles (acyclic)', size, elapsed)
+
+    close_cycle(linker)
+    result, elapsed = timed(linker.find_cycles)
+    assert result is not None
+    report('find_cycles (cyclic)', size, elapsed,
+           length=len(result.split(' --> ')) - 1)
+    if size <= MAX_LEGACY_CYCLIC_SIZE:
+        result, elapsed = timed(legacy_find_cycle, linker.to_networkx())
+        report('legacy find_cycles (cyclic)', size, elapsed)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or (MAX_LEGACY_CYCLIC_SIZE,) + SIZES
+    for size in sizes:
+        bench_find_cycles(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,77 @@
+"""Compare the memory use and speed of the compact DAG against a networkx
+DiGraph of the same synthetic project.
+"""
+import random
+import sys
+import tracemalloc
+
+import networkx as nx
+
+from dbt.graph.dag import DAG
+
+from .utils import synthetic_project, timed, report
+
+
+SIZES = (1000, 20000, 50000)
+
+
+def measure(func, *args):
+    """Call func and return its result, the elapsed seconds and the memory
+    it allocated that is still live, in MB.
+    """
+    tracemalloc.start()
+    try:
+        result, elapsed = timed(func, *args)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, float(size) / (1024 * 1024)
+
+
+def build_networkx(nodes, edges):
+    graph = nx.DiGraph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    return graph
+
+
+def build_dag(nodes, edges):
+    graph = DAG()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+    return graph
+
+
+def bench_graph(name, build, size, nodes, edges, selected):
+    graph, elapsed, memory = measure(build, nodes, edges)
+    report('{} build'.format(name), size, elapsed,
+           mb='{:0.1f}'.format(memory))
+    _, elapsed = timed(graph.copy)
+    report('{} copy'.format(name), size, elapsed)
+    _, elapsed = timed(graph.subgraph, selected)
+    report('{} subgraph'.format(name), size, elapsed)
+    # the first node is a root with most of the graph downstream of it
+    if isinstance(graph, DAG):
+        _, elapsed = timed(graph.topological_sort)
+        descendants, desc_elapsed = timed(graph.descendants, nodes[0])
+    else:
+        _, elapsed = timed(nx.topological_sort, graph)
+        descendants, desc_elapsed = timed(nx.descendants, graph, nodes[0])
+    report('{} topological_sort'.format(name), size, elapsed)
+    report('{} descendants'.format(name), size, desc_elapsed,
+           found=len(descendants))
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        linker, _ = synthetic_project(size)
+        nodes = linker.nodes()
+        edges = linker.edges()
+        selected = random.Random(size).sample(nodes, size // 2)
+        bench_graph('networkx', build_networkx, size, nodes, edges, selected)
+        bench_graph('DAG', build_dag, size, nodes, edges, selected)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
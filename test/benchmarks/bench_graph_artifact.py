@@ -0,0 +1,72 @@
+"""Compare writing and reading the graph file against the gpickle it
+replaced, which embedded a serialized payload for every node.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import networkx as nx
+
+from dbt.linker import from_file
+
+from .utils import synthetic_project, timed, report
+
+
+SIZES = (1000, 20000, 50000)
+
+
+def fake_payload(unique_id):
+    """Roughly the size and shape of a serialized ParsedNode"""
+    name = unique_id.rsplit('.', 1)[1]
+    return {
+        'unique_id': unique_id,
+        'name': name,
+        'raw_sql': 'select * from {{ ref("upstream") }}\n' * 20,
+        'config': {'materialized': 'view', 'tags': [], 'vars': {}},
+        'columns': {'id': {'name': 'id', 'description': 'x' * 200}},
+        'fqn': ['bench', name],
+        'path': '{}.sql'.format(name),
+    }
+
+
+def legacy_write(linker, path):
+    """The original Linker.write_graph"""
+    graph = linker.to_networkx()
+    for node_id in graph.nodes():
+        graph.add_node(node_id, fake_payload(node_id))
+    nx.write_gpickle(graph, path)
+
+
+def bench_artifact(size, tempdir):
+    linker, _ = synthetic_project(size)
+
+    path = os.path.join(tempdir, 'graph.bin')
+    _, elapsed = timed(linker.write_graph, path)
+    report('write graph.bin', size, elapsed,
+           kb=os.path.getsize(path) // 1024)
+    loaded, elapsed = timed(from_file, path)
+    report('from_file', size, elapsed)
+    _, elapsed = timed(lambda: loaded.graph)
+    report('first use of the loaded graph', size, elapsed)
+
+    path = os.path.join(tempdir, 'graph.gpickle')
+    _, elapsed = timed(legacy_write, linker, path)
+    report('legacy write graph.gpickle', size, elapsed,
+           kb=os.path.getsize(path) // 1024)
+    _, elapsed = timed(nx.read_gpickle, path)
+    report('legacy read graph.gpickle', size, elapsed)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    tempdir = tempfile.mkdtemp()
+    try:
+        for size in sizes:
+            bench_artifact(size, tempdir)
+    finally:
+        shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,51 @@
+"""Benchmark the cost of the "graph" entry of the compilation context, which
+is built once for every node that is compiled.
+"""
+import sys
+
+from .utils import parsed_manifest, timed, report
+
+
+SIZES = (500, 1000, 2000)
+
+
+def build_contexts(manifest, get_graph, lookup=None, scan=False):
+    """Build the graph context for every node, as compiling every node does,
+    optionally reading one node from it, or looping over all of them, like a
+    macro would.
+    """
+    for unique_id in manifest.nodes:
+        graph = get_graph(manifest)
+        if lookup is not None:
+            graph['nodes'][lookup]['name']
+        if scan:
+            for node in graph['nodes'].values():
+                node['name']
+
+
+def bench_graph_context(size):
+    manifest, elapsed = timed(parsed_manifest, size)
+    report('build manifest', size, elapsed)
+    some_node = next(iter(manifest.nodes))
+
+    _, elapsed = timed(build_contexts, manifest,
+                       lambda m: m.to_flat_graph())
+    report('legacy to_flat_graph per node', size, elapsed)
+    _, elapsed = timed(build_contexts, manifest, lambda m: m.flat_graph())
+    report('flat_graph view per node', size, elapsed)
+    _, elapsed = timed(build_contexts, manifest, lambda m: m.flat_graph(),
+                       lookup=some_node)
+    report('flat_graph view per node, one read', size, elapsed)
+    _, elapsed = timed(build_contexts, manifest, lambda m: m.flat_graph(),
+                       scan=True)
+    report('flat_graph view per node, read all', size, elapsed)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_graph_context(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,55 @@
+"""Benchmark GraphQueue construction on synthetic DAGs."""
+import random
+import sys
+
+from dbt.linker import GraphQueue, _subset_graph
+
+from .utils import synthetic_project, timed, report
+
+
+SIZES = (1000, 10000, 50000)
+# the per-node descendants approach is quadratic, don't run it on big graphs
+MAX_LEGACY_SIZE = 1000
+
+
+def legacy_scores(queue):
+    """The original per-node implementation of _calculate_scores"""
+    return {
+        node: -1 * len([
+            d for d in queue.graph.descendants(node)
+            if queue._include_in_cost(d)
+        ])
+        for node in queue.graph.nodes()
+    }
+
+
+def bench_graph_queue_construction(size):
+    linker, manifest = synthetic_project(size)
+    graph = linker.graph.copy()
+    queue, elapsed = timed(GraphQueue, graph, manifest)
+    report('GraphQueue.__init__', size, elapsed,
+           queued=len(queue.queued))
+    if size <= MAX_LEGACY_SIZE:
+        scores, elapsed = timed(legacy_scores, queue)
+        assert scores == queue._scores
+        report('legacy _calculate_scores', size, elapsed)
+
+
+def bench_subset_graph(size, num_selected):
+    linker, _ = synthetic_project(size)
+    selected = random.Random(size).sample(linker.nodes(), num_selected)
+    subset, elapsed = timed(_subset_graph, linker.graph, selected)
+    report('_subset_graph ({} selected)'.format(num_selected), size, elapsed,
+           edges=len(subset.edges()))
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_graph_queue_construction(size)
+        bench_subset_graph(size, 5)
+        bench_subset_graph(size, size // 2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""Benchmark constructing ParsedNodes and CompiledNodes: validated against a
+new schema validator each time as dbt used to, validated against the cached
+validator, and on the trusted path that skips validation.
+"""
+import sys
+
+from dbt.api.object import _VALIDATORS
+from dbt.contracts.graph.compiled import CompiledNode
+from dbt.contracts.graph.parsed import ParsedNode
+
+from .utils import parsed_node, timed, report
+
+
+SIZES = (1000, 5000)
+
+
+def node_data(size):
+    parsed = []
+    compiled = []
+    for idx in range(size):
+        data = parsed_node('bench', 'model_{}'.format(idx)).serialize()
+        parsed.append(data)
+        data = dict(data)
+        data.update({
+            'compiled': True,
+            'compiled_sql': data['raw_sql'],
+            'extra_ctes_injected': True,
+            'extra_ctes': [],
+            'injected_sql': data['raw_sql'],
+        })
+        compiled.append(data)
+    return parsed, compiled
+
+
+def construct_all(cls, datas, mode):
+    for data in datas:
+        if mode == 'uncached':
+            _VALIDATORS.clear()
+        if mode == 'trusted':
+            cls.from_trusted(**data)
+        else:
+            cls(**data)
+
+
+def bench_node_construction(size):
+    parsed, compiled = node_data(size)
+    for cls, datas in ((ParsedNode, parsed), (CompiledNode, compiled)):
+        for mode in ('uncached', 'cached', 'trusted'):
+            _, elapsed = timed(construct_all, cls, datas, mode)
+            report('{} {}'.format(cls.__name__, mode), size, elapsed,
+                   nodes_per_s=int(size / elapsed))
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_node_construction(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
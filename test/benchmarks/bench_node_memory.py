@@ -0,0 +1,95 @@
+"""Report the resident memory used by a manifest of realistic ParsedNodes,
+next to the same manifest of nodes that keep their fields in a dict, like
+ParsedNode did before it used slots.
+
+Each manifest is built in its own process, so that memory freed by one does
+not hide the memory used by the next. Run it on its own, so that memory used
+by other benchmarks does not affect the numbers.
+"""
+import gc
+import multiprocessing
+import os
+import resource
+import sys
+
+from dbt.api import APIObject
+from dbt.contracts.graph.parsed import ParsedNode, PARSED_NODE_CONTRACT
+
+from .utils import parsed_manifest, timed, report
+
+
+SIZES = (20000,)
+
+
+class DictNode(APIObject):
+    """A ParsedNode that keeps its fields in a dict"""
+    SCHEMA = PARSED_NODE_CONTRACT
+
+    def __init__(self, agate_table=None, **kwargs):
+        self.agate_table = agate_table
+        kwargs.setdefault('columns', {})
+        kwargs.setdefault('description', '')
+        super(DictNode, self).__init__(**kwargs)
+
+    @property
+    def depends_on_nodes(self):
+        return self.depends_on['nodes']
+
+
+def resident_bytes():
+    """The current resident set size of this process, or the peak on
+    platforms without /proc.
+    """
+    try:
+        with open('/proc/self/statm') as fp:
+            pages = int(fp.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError):
+        rusage = resource.getrusage(resource.RUSAGE_SELF)
+        if sys.platform == 'darwin':
+            return rusage.ru_maxrss
+        return rusage.ru_maxrss * 1024
+
+
+def _measure(size, node_class, results):
+    gc.collect()
+    before = resident_bytes()
+    manifest, elapsed = timed(parsed_manifest, size, node_class=node_class)
+    gc.collect()
+    results.put((len(manifest.nodes), elapsed, resident_bytes() - before))
+
+
+def measure(size, node_class):
+    """Build a manifest of size nodes of node_class in a new process, and
+    return the number of nodes, the seconds it took and the bytes it used.
+    """
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_measure,
+                                      args=(size, node_class, results))
+    process.start()
+    # the result is small enough to sit in the queue until it is read
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError('Measuring {} failed'.format(node_class.__name__))
+    return results.get()
+
+
+def bench_node_memory(size):
+    used = {}
+    for name, node_class in (('dict', DictNode), ('slotted', ParsedNode)):
+        count, elapsed, used[name] = measure(size, node_class)
+        report('manifest resident memory ({})'.format(name), count, elapsed,
+               total_mb='{:.1f}'.format(used[name] / 1024.0 / 1024.0),
+               per_node_bytes=used[name] // size)
+    print('slotted nodes use {:.1%} less memory'
+          .format(1 - float(used['slotted']) / used['dict']))
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_node_memory(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
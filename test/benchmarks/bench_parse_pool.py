@@ -0,0 +1,56 @@
+"""Benchmark loading a project that is written to a temporary directory,
+parsing every file in one process and in a pool of worker processes.
+"""
+import multiprocessing
+import shutil
+import sys
+import tempfile
+
+import mock
+
+from dbt.loader import GraphLoader
+
+from .bench_partial_parse import write_project, project_config
+from .utils import timed, report
+
+
+SIZES = (2000,)
+
+
+def load(root, processes):
+    config = project_config(root)
+    config.args.parse_processes = processes
+    return GraphLoader.load_all(config)
+
+
+def bench_parse_pool(size):
+    root = tempfile.mkdtemp()
+    try:
+        write_project(root, size)
+        serial, elapsed = timed(load, root, None)
+        report('one process', size, elapsed)
+
+        # always check at least two processes against one
+        processes = 2
+        while processes <= max(2, multiprocessing.cpu_count()):
+            manifest, elapsed = timed(load, root, processes)
+            report('{} processes'.format(processes), size, elapsed)
+            assert list(manifest.nodes) == list(serial.nodes)
+            for unique_id, node in serial.nodes.items():
+                assert node.serialize() == \
+                    manifest.nodes[unique_id].serialize()
+            processes *= 2
+    finally:
+        shutil.rmtree(root)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    # parsing acquires a connection, but never uses it
+    with mock.patch('dbt.adapters.postgres.connections.psycopg2'):
+        for size in sizes:
+            bench_parse_pool(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
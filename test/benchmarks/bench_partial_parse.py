@@ -0,0 +1,151 @@
+"""Benchmark loading a project that is written to a temporary directory:
+parsing every file, and parsing again with the parse cache from the last
+run when nothing has changed, when one model has changed and when a macro
+has changed.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import mock
+
+import dbt.flags
+from dbt.config import Profile
+from dbt.loader import GraphLoader
+
+from test.unit.utils import config_from_parts_or_dicts
+
+from .bench_context import bench_config
+from .utils import timed, report
+
+
+SIZES = (500, 2000)
+MODELS_PER_DIR = 50
+
+MODEL_SQL = '''
+{{{{ config(materialized='table', tags=['{dir}']) }}}}
+
+select id, {{{{ cents_to_dollars('amount') }}}} as amount
+from {parent}
+'''
+
+SCHEMA_YML = '''
+version: 2
+models:
+'''
+
+SCHEMA_MODEL_YML = '''
+  - name: {name}
+    description: "{{{{ doc('{name}') }}}}"
+    columns:
+      - name: id
+        tests:
+          - unique
+          - not_null
+'''
+
+MACRO_SQL = '''
+{% macro cents_to_dollars(column) %}
+    ({{ column }} / 100)::numeric(16, 2)
+{% endmacro %}
+'''
+
+
+def write_file(path, contents):
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w') as fp:
+        fp.write(contents)
+
+
+def write_project(root, size):
+    for idx in range(size):
+        directory = 'dir_{}'.format(idx // MODELS_PER_DIR)
+        name = 'model_{}'.format(idx)
+        if idx % MODELS_PER_DIR:
+            parent = "{{{{ ref('model_{}') }}}}".format(idx - 1)
+        else:
+            parent = 'raw.events'
+        write_file(
+            os.path.join(root, 'models', directory, name + '.sql'),
+            MODEL_SQL.format(dir=directory, parent=parent)
+        )
+        write_file(
+            os.path.join(root, 'models', directory, name + '.md'),
+            '{{% docs {} %}}A model.{{% enddocs %}}'.format(name)
+        )
+
+    for start in range(0, size, MODELS_PER_DIR):
+        directory = 'dir_{}'.format(start // MODELS_PER_DIR)
+        schema = SCHEMA_YML + ''.join(
+            SCHEMA_MODEL_YML.format(name='model_{}'.format(idx))
+            for idx in range(start, min(start + MODELS_PER_DIR, size))
+        )
+        write_file(os.path.join(root, 'models', directory, 'schema.yml'),
+                   schema)
+
+    write_file(os.path.join(root, 'macros', 'cents.sql'), MACRO_SQL)
+
+
+def project_config(root):
+    config = bench_config()
+    project = config.to_project_config()
+    project['project-root'] = root
+    project['target-path'] = os.path.join(root, 'target')
+    return config_from_parts_or_dicts(project,
+                                      Profile(**config.to_profile_info()))
+
+
+def load(root):
+    return GraphLoader.load_all(project_config(root))
+
+
+def append(path, contents):
+    with open(path, 'a') as fp:
+        fp.write(contents)
+
+
+def bench_partial_parse(size):
+    root = tempfile.mkdtemp()
+    try:
+        write_project(root, size)
+
+        dbt.flags.PARTIAL_PARSE = False
+        _, elapsed = timed(load, root)
+        report('no parse cache', size, elapsed)
+
+        dbt.flags.PARTIAL_PARSE = True
+        cold, elapsed = timed(load, root)
+        report('empty parse cache', size, elapsed)
+        warm, elapsed = timed(load, root)
+        report('nothing changed', size, elapsed)
+        assert sorted(cold.nodes) == sorted(warm.nodes)
+        for unique_id, node in cold.nodes.items():
+            assert node.serialize() == warm.nodes[unique_id].serialize()
+
+        append(os.path.join(root, 'models', 'dir_0', 'model_1.sql'),
+               '\nwhere id > 0\n')
+        _, elapsed = timed(load, root)
+        report('one model changed', size, elapsed)
+
+        append(os.path.join(root, 'macros', 'cents.sql'),
+               '{% macro unused() %}{% endmacro %}')
+        _, elapsed = timed(load, root)
+        report('macro changed', size, elapsed)
+    finally:
+        dbt.flags.PARTIAL_PARSE = False
+        shutil.rmtree(root)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    # parsing acquires a connection, but never uses it
+    with mock.patch('dbt.adapters.postgres.connections.psycopg2'):
+        for size in sizes:
+            bench_partial_parse(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
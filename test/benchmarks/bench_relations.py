@@ -0,0 +1,75 @@
+"""Benchmark the relation operations that the table materialization does for
+each model: building the target, intermediate and backup relations,
+rendering them, and renaming them in the relation cache. Relations that
+share unchanged values on incorporate() are compared with relations that
+copy all of their contents, as dbt used to.
+"""
+import sys
+
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.cache import RelationsCache
+from dbt.logger import log_cache_events
+from dbt.utils import deep_merge
+
+from .utils import timed, report
+
+
+SIZES = (1000, 2000)
+
+
+class CopyingRelation(BaseRelation):
+    def incorporate(self, **kwargs):
+        return type(self)(**deep_merge(self._contents, kwargs))
+
+
+def materialize(relation_cls, cache, name):
+    target = relation_cls.create(database='dbt', schema='analytics',
+                                 identifier=name, type='table')
+    intermediate = target.incorporate(
+        path={'identifier': name + '__dbt_tmp'},
+        table_name=name + '__dbt_tmp',
+    )
+    backup = target.incorporate(
+        path={'identifier': name + '__dbt_backup'},
+        table_name=name + '__dbt_backup',
+        type='table',
+    )
+    rendered = [
+        str(intermediate.include(database=False, schema=False)),
+        str(target.quote(identifier=False)),
+        str(backup),
+        str(target.information_schema_only()),
+    ]
+    cache.add(target)
+    cache.add(intermediate)
+    cache.rename(target, backup)
+    cache.rename(intermediate, target)
+    cache.drop(backup)
+    return rendered
+
+
+def materialize_all(relation_cls, size):
+    cache = RelationsCache()
+    for idx in range(size):
+        materialize(relation_cls, cache, 'model_{}'.format(idx))
+    return cache
+
+
+def bench_relations(size):
+    for relation_cls, name in ((CopyingRelation, 'copying incorporate'),
+                               (BaseRelation, 'sharing incorporate')):
+        _, elapsed = timed(materialize_all, relation_cls, size)
+        report(name, size, elapsed,
+               per_model_us=int(elapsed / size * 1e6))
+
+
+def main(argv):
+    # as in a dbt run without --log-cache-events
+    log_cache_events(False)
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_relations(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,48 @@
+"""Stress the GraphQueue with many threads and no-op runners, and measure
+the scheduling overhead per node.
+
+This mirrors GraphRunnableTask.run_queue: the main thread pulls nodes off the
+queue and submits them to a thread pool, and the pool callback marks them as
+done.
+"""
+import sys
+from multiprocessing.dummy import Pool as ThreadPool
+
+from .utils import synthetic_project, timed, report
+
+
+SIZES = (1000, 10000, 50000)
+THREADS = 64
+
+
+def run_queue(queue, pool):
+    def noop(node_id):
+        return node_id
+
+    while not queue.empty():
+        node = queue.get()
+        pool.apply_async(noop, args=(node.unique_id,),
+                         callback=queue.mark_done)
+    queue.join()
+
+
+def bench_scheduler_overhead(size, threads):
+    linker, manifest = synthetic_project(size)
+    queue = linker.as_graph_queue(manifest)
+    pool = ThreadPool(threads)
+    _, elapsed = timed(run_queue, queue, pool)
+    pool.close()
+    pool.join()
+    per_node = '{:.1f}us'.format(elapsed / size * 1e6)
+    report('run_queue ({} threads)'.format(threads), size, elapsed,
+           per_node=per_node)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_scheduler_overhead(size, THREADS)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,97 @@
+"""Benchmark resolving qualified-name selectors against a large project,
+using the FQN trie and the original per-node matching.
+"""
+import sys
+
+from dbt.graph.selector import NodeSelector, SelectionCriteria, \
+    get_package_names, _node_is_match
+
+from .utils import FakeManifest, FakeNode, timed, report
+
+
+SIZES = (1000, 20000)
+PACKAGES = ('bench', 'dep_a', 'dep_b', 'dep_c')
+DIRECTORIES = ('staging', 'marts', 'base', 'intermediate')
+SPECS = (
+    'model_123',
+    'bench.model_456',
+    'staging.*',
+    'bench.marts.*',
+    'dep_a.*',
+    'base.sub_3',
+    'missing_model',
+    '*',
+)
+
+
+def fqn_project(size):
+    """A manifest of nodes spread across packages and nested directories."""
+    nodes = {}
+    for idx in range(size):
+        package = PACKAGES[idx % len(PACKAGES)]
+        name = 'model_{}'.format(idx)
+        unique_id = 'model.{}.{}'.format(package, name)
+        node = FakeNode(unique_id)
+        node.fqn = [
+            package,
+            DIRECTORIES[idx % len(DIRECTORIES)],
+            'sub_{}'.format(idx % 7),
+            name,
+        ]
+        nodes[unique_id] = node
+    return nodes, FakeManifest(nodes)
+
+
+def legacy_select(graph, manifest, spec):
+    """The original NodeSelector.get_nodes_by_qualified_name"""
+    qualified_name = spec.split('.')
+    package_names = get_package_names(graph)
+    return set(
+        node for node in graph.nodes()
+        if _node_is_match(qualified_name, package_names,
+                          manifest.nodes[node].fqn)
+    )
+
+
+class NodeSet(object):
+    """Just enough of a graph for selection by name"""
+    def __init__(self, nodes):
+        self._nodes = nodes
+
+    def nodes(self):
+        return list(self._nodes)
+
+    def __contains__(self, node):
+        return node in self._nodes
+
+
+def bench_selector(size):
+    nodes, manifest = fqn_project(size)
+    graph = NodeSet(nodes)
+    selector = NodeSelector(None, manifest)
+
+    _, elapsed = timed(lambda: selector.fqn_index)
+    report('build fqn index', size, elapsed)
+
+    legacy_total = total = 0.0
+    for spec in SPECS:
+        value = SelectionCriteria(spec).selector_value
+        expected, elapsed = timed(legacy_select, graph, manifest, value)
+        legacy_total += elapsed
+        found, elapsed = timed(
+            lambda: set(selector.get_nodes_by_qualified_name(graph, value))
+        )
+        total += elapsed
+        assert found == expected, spec
+    report('legacy select {} specs'.format(len(SPECS)), size, legacy_total)
+    report('fqn index select {} specs'.format(len(SPECS)), size, total)
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or SIZES
+    for size in sizes:
+        bench_selector(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
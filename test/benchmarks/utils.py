@@ -0,0 +1,123 @@
+"""Benchmark utility functions.
+
+Benchmarks are not part of the test suite. Run them directly, for example:
+
+    python -m test.benchmarks.bench_graph_queue
+"""
+import random
+import time
+
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedNode
+from dbt.linker import Linker
+from dbt.node_types import NodeType
+from dbt.utils import timestring
+
+
+class FakeNode(object):
+    """A minimal stand-in for a ParsedNode, as far as the graph code cares."""
+    def __init__(self, unique_id, resource_type=NodeType.Model,
+                 materialization='view'):
+        self.unique_id = unique_id
+        self.resource_type = resource_type
+        self.materialization = materialization
+
+    def get_materialization(self):
+        return self.materialization
+
+
+class FakeManifest(object):
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+
+def synthetic_project(num_nodes, max_parents=3, seed=0):
+    """Build a random DAG that looks roughly like a dbt project: every node
+    depends on up to `max_parents` nodes that were created before it, with a
+    bias towards recent nodes so that there are long dependency chains.
+
+    :return Tuple[Linker, FakeManifest]: The linker and a manifest of fake
+        nodes.
+    """
+    rand = random.Random(seed)
+    linker = Linker()
+    nodes = {}
+    unique_ids = []
+    for idx in range(num_nodes):
+        unique_id = 'model.bench.model_{}'.format(idx)
+        materialization = 'ephemeral' if rand.random() < 0.1 else 'view'
+        nodes[unique_id] = FakeNode(unique_id,
+                                    materialization=materialization)
+        linker.add_node(unique_id)
+        # about one node in twenty is a root, like a model over a source
+        if unique_ids and rand.random() > 0.05:
+            num_parents = rand.randint(1, max_parents)
+            window = unique_ids[-200:]
+            for parent in rand.sample(window, min(num_parents, len(window))):
+                linker.dependency(unique_id, parent)
+        unique_ids.append(unique_id)
+    return linker, FakeManifest(nodes)
+
+
+def parsed_node(package, name, depends_on=(), node_class=ParsedNode):
+    """A realistic ParsedNode, or node_class, for a model"""
+    return node_class(
+        name=name,
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        resource_type=NodeType.Model,
+        unique_id='model.{}.{}'.format(package, name),
+        fqn=[package, 'staging', name],
+        empty=False,
+        package_name=package,
+        refs=[[d.rsplit('.', 1)[1]] for d in depends_on],
+        sources=[],
+        depends_on={'nodes': list(depends_on), 'macros': []},
+        config={
+            'enabled': True,
+            'materialized': 'view',
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        },
+        tags=[],
+        path='staging/{}.sql'.format(name),
+        original_file_path='models/staging/{}.sql'.format(name),
+        root_path='/usr/src/app',
+        raw_sql='select * from {{ ref("upstream") }}\n' * 20,
+        description='',
+        columns={},
+    )
+
+
+def parsed_manifest(num_nodes, seed=0, node_class=ParsedNode):
+    """Build a Manifest of realistic ParsedNodes, or node_class instances,
+    with the same dependencies as synthetic_project.
+    """
+    linker, _ = synthetic_project(num_nodes, seed=seed)
+    nodes = {}
+    for unique_id in linker.nodes():
+        name = unique_id.rsplit('.', 1)[1]
+        parents = sorted(linker.graph.predecessors(unique_id))
+        nodes[unique_id] = parsed_node('bench', name, parents, node_class)
+    return Manifest(nodes=nodes, macros={}, docs={},
+                    generated_at=timestring(), disabled=[])
+
+
+def timed(func, *args, **kwargs):
+    """Call func and return a tuple of its result and the elapsed seconds."""
+    start = time.time()
+    result = func(*args, **kwargs)
+    return result, time.time() - start
+
+
+def report(name, size, elapsed, **extra):
+    line = '{:<40} {:>7} nodes {:>10.3f}s'.format(name, size, elapsed)
+    for key, value in sorted(extra.items()):
+        line += '  {}={}'.format(key, value)
+    print(line)
@@ -0,0 +1,197 @@
+import copy
+import pickle
+import unittest
+
+import dbt.flags
+from dbt.api.object import APIObject, SlottedAPIObject, \
+    trusted_construction, _get_validator
+from dbt.exceptions import JSONValidationException
+
+
+class Thing(APIObject):
+    SCHEMA = {
+        'type': 'object',
+        'properties': {
+            'name': {'type': 'string'},
+        },
+        'required': ['name'],
+    }
+
+
+class SerializedThing(Thing):
+    def serialize(self):
+        result = super(SerializedThing, self).serialize()
+        result['name'] = 1
+        return result
+
+
+class NestedThing(APIObject):
+    DEFAULTS = {'policy': {'a': True, 'b': True}}
+
+
+class InitThing(NestedThing):
+    def __init__(self, **kwargs):
+        kwargs.setdefault('count', 0)
+        super(InitThing, self).__init__(**kwargs)
+
+
+class SlottedThing(SlottedAPIObject):
+    SCHEMA = Thing.SCHEMA
+    FIELDS = ('name', 'size', 'color')
+    OPTIONAL_FIELDS = frozenset(['color'])
+    __slots__ = FIELDS
+
+
+class APIObjectTest(unittest.TestCase):
+    def setUp(self):
+        self.strict_mode = dbt.flags.STRICT_MODE
+        dbt.flags.STRICT_MODE = False
+
+    def tearDown(self):
+        dbt.flags.STRICT_MODE = self.strict_mode
+
+    def test_validator_cached(self):
+        first = _get_validator(Thing)
+        self.assertIs(_get_validator(Thing), first)
+        self.assertTrue(first[2])
+        self.assertFalse(_get_validator(SerializedThing)[2])
+
+    def test_validates(self):
+        self.assertEqual(Thing(name='a').name, 'a')
+        with self.assertRaises(JSONValidationException):
+            Thing(name=1)
+        with self.assertRaises(JSONValidationException):
+            Thing(name='a').incorporate(name=1)
+
+    def test_validates_serialized(self):
+        # the result of an overridden serialize() is what gets validated
+        with self.assertRaises(JSONValidationException):
+            SerializedThing(name='a')
+
+    def test_trusted_skips_validation(self):
+        self.assertEqual(Thing.from_trusted(name=1).name, 1)
+        with trusted_construction():
+            thing = Thing(name=1)
+            self.assertEqual(thing.incorporate(name=2).name, 2)
+        # only inside the block
+        with self.assertRaises(JSONValidationException):
+            thing.incorporate(name=3)
+
+    def test_trusted_validates_in_strict_mode(self):
+        dbt.flags.STRICT_MODE = True
+        with self.assertRaises(JSONValidationException):
+            Thing.from_trusted(name=1)
+
+
+class IncorporateTest(unittest.TestCase):
+    def test_merges(self):
+        thing = NestedThing(name='a', tags=['x'])
+        new = thing.incorporate(policy={'b': False}, tags=['y'], name='b')
+        self.assertEqual(new.serialize(), {
+            'name': 'b',
+            'policy': {'a': True, 'b': False},
+            'tags': ['y', 'x'],
+        })
+        self.assertEqual(thing.serialize(), {
+            'name': 'a',
+            'policy': {'a': True, 'b': True},
+            'tags': ['x'],
+        })
+
+    def test_shares_unchanged_values(self):
+        thing = NestedThing(name='a', info={'x': {'y': 1}})
+        new = thing.incorporate(policy={'a': False})
+        self.assertIs(new._peek('info'), thing._peek('info'))
+        self.assertIsNot(new._peek('policy'), thing._peek('policy'))
+
+    def test_changing_new_instance(self):
+        thing = NestedThing(name='a', info={'x': {'y': 1}})
+        new = thing.incorporate(name='b')
+        new.info['x']['y'] = 2
+        self.assertEqual(thing.info, {'x': {'y': 1}})
+        self.assertEqual(new['info'], {'x': {'y': 2}})
+
+    def test_changing_original(self):
+        thing = NestedThing(name='a', info={'x': {'y': 1}})
+        new = thing.incorporate(name='b')
+        thing['info']['x']['y'] = 2
+        self.assertEqual(new.info, {'x': {'y': 1}})
+
+    def test_changing_value_handed_out_before(self):
+        thing = NestedThing(name='a', info={'x': {'y': 1}})
+        info = thing.info
+        new = thing.incorporate(name='b')
+        info['x']['y'] = 2
+        self.assertEqual(thing.info, {'x': {'y': 2}})
+        self.assertEqual(new.info, {'x': {'y': 1}})
+
+    def test_changing_set_value(self):
+        info = {'x': 1}
+        thing = NestedThing(name='a')
+        thing.set('info', info)
+        new = thing.incorporate(name='b')
+        info['x'] = 2
+        self.assertEqual(new.info, {'x': 1})
+
+    def test_copies_arguments(self):
+        info = {'x': {'y': 1}}
+        new = NestedThing(name='a').incorporate(info=info)
+        info['x']['y'] = 2
+        self.assertEqual(new.info, {'x': {'y': 1}})
+
+    def test_subclass_init(self):
+        thing = InitThing(name='a', info={'x': 1})
+        new = thing.incorporate(name='b')
+        self.assertEqual(new.count, 0)
+        self.assertIsNot(new._peek('info'), thing._peek('info'))
+
+    def test_validates(self):
+        with self.assertRaises(JSONValidationException):
+            Thing(name='a').incorporate(name=1)
+
+
+class SlottedAPIObjectTest(unittest.TestCase):
+    def test_mapping(self):
+        thing = SlottedThing(name='a', size={'x': 1}, other=[1])
+        self.assertFalse(hasattr(thing, '__dict__'))
+        self.assertEqual(dict(thing), {'name': 'a', 'size': {'x': 1},
+                                       'other': [1]})
+        self.assertEqual(thing.serialize(), dict(thing))
+        self.assertEqual(thing['other'], [1])
+        self.assertEqual(thing.other, [1])
+        self.assertNotIn('color', thing)
+        self.assertIsNone(thing.get('color'))
+        with self.assertRaises(KeyError):
+            thing['color']
+
+    def test_attributes(self):
+        thing = SlottedThing(name='a')
+        self.assertIsNone(thing.color)
+        with self.assertRaises(AttributeError):
+            thing.size
+        thing.size = 2
+        thing.set('color', 'red')
+        self.assertEqual(thing['size'], 2)
+        self.assertEqual(thing.color, 'red')
+        self.assertEqual(len(thing), 3)
+        with self.assertRaises(AttributeError):
+            thing.weight = 3
+
+    def test_copies_arguments(self):
+        size = {'x': 1}
+        thing = SlottedThing(name='a', size=size)
+        size['x'] = 2
+        self.assertEqual(thing.size, {'x': 1})
+        self.assertEqual(thing.incorporate(color='red').size, {'x': 1})
+
+    def test_validates(self):
+        with self.assertRaises(JSONValidationException):
+            SlottedThing(name=1)
+
+    def test_copy_and_pickle(self):
+        thing = SlottedThing(name='a', size=1, other=[1])
+        for copied in (copy.deepcopy(thing), copy.copy(thing),
+                       pickle.loads(pickle.dumps(thing)),
+                       pickle.loads(pickle.dumps(thing, 0))):
+            self.assertEqual(copied, thing)
+            self.assertEqual(copied.other, [1])
@@ -1,12 +1,15 @@
+import mock
 import unittest
 
 import os
 
+import dbt.exceptions
 import dbt.flags
 import dbt.compilation
 from collections import OrderedDict
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.compiled import CompiledNode
+from dbt.contracts.graph.parsed import ParsedNode
 
 class CompilerTest(unittest.TestCase):
 
@@ -458,3 +461,134 @@ class CompilerTest(unittest.TestCase):
                          .get('model.root.ephemeral_level_two')
                          .get('extra_ctes_injected')),
             True)
+
+
+def _fake_compile_node(adapter, config, node, manifest, extra_context):
+    if 'run_query' in node.raw_sql:
+        raise dbt.exceptions.RuntimeException('no connection')
+    if 'crash' in node.raw_sql:
+        os._exit(1)
+    parents = ' '.join(
+        manifest.nodes[p].get('compiled_sql') or 'uncompiled'
+        for p in node.depends_on_nodes
+    )
+    data = node.serialize()
+    data.update({
+        'compiled': True,
+        'compiled_sql': node.raw_sql,
+        'extra_ctes_injected': True,
+        'extra_ctes': [],
+        'injected_sql': '{} {}'.format(parents, node.raw_sql).strip(),
+    })
+    return CompiledNode(**data)
+
+
+class CompilePoolTest(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(dbt.compilation, 'compile_node',
+                              _fake_compile_node),
+            mock.patch.object(dbt.compilation, 'get_adapter'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.manifest = Manifest(
+            macros={},
+            nodes={
+                'model.root.ephemeral': self._make_node(
+                    'ephemeral', 'select 1', [], 'ephemeral'
+                ),
+                'model.root.view': self._make_node(
+                    'view', 'select 2', ['model.root.ephemeral'], 'view'
+                ),
+                'model.root.introspective': self._make_node(
+                    'introspective', 'run_query', [], 'view'
+                ),
+                'model.root.crash': self._make_node(
+                    'crash', 'crash', [], 'view'
+                ),
+            },
+            docs={},
+            generated_at='2018-02-14T09:15:13Z',
+            disabled=[]
+        )
+        self.pool = dbt.compilation.CompilePool(mock.MagicMock(),
+                                                self.manifest, 2)
+        self.addCleanup(self.pool.close)
+
+    def _make_node(self, name, raw_sql, depends_on, materialized):
+        return ParsedNode(
+            name=name,
+            database='dbt',
+            schema='analytics',
+            alias=name,
+            resource_type='model',
+            unique_id='model.root.{}'.format(name),
+            fqn=['root', name],
+            empty=False,
+            package_name='root',
+            root_path='/usr/src/app',
+            refs=[],
+            sources=[],
+            depends_on={'nodes': depends_on, 'macros': []},
+            config={
+                'enabled': True,
+                'materialized': materialized,
+                'persist_docs': {},
+                'post-hook': [],
+                'pre-hook': [],
+                'vars': {},
+                'quoting': {},
+                'column_types': {},
+                'tags': [],
+            },
+            tags=[],
+            path='{}.sql'.format(name),
+            original_file_path='{}.sql'.format(name),
+            raw_sql=raw_sql,
+        )
+
+    def test_compiles_ahead(self):
+        self.pool.submit(['model.root.view', 'model.root.introspective'])
+
+        # the worker compiled the ephemeral parent first
+        view = self.pool.get('model.root.view')
+        self.assertIsInstance(view, CompiledNode)
+        self.assertEqual(view.injected_sql, 'select 1 select 2')
+        # the parent manifest is untouched
+        self.assertNotIn('compiled',
+                         self.manifest.nodes['model.root.ephemeral'])
+
+        # failures are left for the runner to compile
+        self.assertIsNone(self.pool.get('model.root.introspective'))
+        # as are nodes that were never submitted, or already collected
+        self.assertIsNone(self.pool.get('model.root.ephemeral'))
+        self.assertIsNone(self.pool.get('model.root.view'))
+
+    def test_worker_died(self):
+        self.pool.timeout = 1
+        self.pool.submit(['model.root.crash', 'model.root.view'])
+        # the dead worker's node times out, and the pool keeps going
+        self.assertIsNone(self.pool.get('model.root.crash'))
+        self.assertIsInstance(self.pool.get('model.root.view'),
+                              CompiledNode)
+
+    def test_worker_has_own_locks(self):
+        connections = dbt.compilation.get_adapter.return_value.connections
+        lock = connections.lock
+        latencies_lock = connections.query_latencies.lock
+        dbt.compilation._init_compile_worker()
+        self.assertIsNot(connections.lock, lock)
+        self.assertIsNot(connections.query_latencies.lock, latencies_lock)
+        dbt.flags.USE_CACHE = True
+
+    def test_close_skips_queued_nodes(self):
+        closed = dbt.compilation._COMPILE_WORKER_STATE['closed']
+        closed.set()
+        self.assertIsNone(
+            dbt.compilation._precompile_node('model.root.view')
+        )
+        self.pool.close()
+        self.assertEqual(dbt.compilation._COMPILE_WORKER_STATE, {})
@@ -1,8 +1,14 @@
 import mock
 import unittest
 
-from dbt.contracts.graph.parsed import ParsedNode
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedNode, ParsedMacro
 from dbt.context.common import Var
+from dbt.utils import timestring
+import dbt.clients.jinja
+import dbt.context.common
+import dbt.context.parser
+import dbt.context.runtime
 import dbt.exceptions
 
 class TestVar(unittest.TestCase):
@@ -55,3 +61,157 @@ class TestVar(unittest.TestCase):
         var.assert_var_defined('foo', 'bar')
         with self.assertRaises(dbt.exceptions.CompilationException):
             var.assert_var_defined('foo', None)
+
+
+class TestContextFactory(unittest.TestCase):
+    def setUp(self):
+        self.patcher = mock.patch('dbt.context.common.get_adapter')
+        self.get_adapter = self.patcher.start()
+        self.config = mock.MagicMock(cli_vars={}, target_path='target',
+                                     project_name='root')
+        self.macros = {
+            'macro.root.helper': self._macro('root', 'helper'),
+            'macro.dbt.builtin': self._macro('dbt', 'builtin'),
+        }
+        self.manifest = Manifest(nodes={}, macros=self.macros, docs={},
+                                 generated_at=timestring(), disabled=[])
+        self.model = ParsedNode(
+            alias='model_one',
+            name='model_one',
+            database='dbt',
+            schema='analytics',
+            resource_type='model',
+            unique_id='model.root.model_one',
+            fqn=['root', 'model_one'],
+            empty=False,
+            package_name='root',
+            original_file_path='model_one.sql',
+            root_path='/usr/src/app',
+            refs=[],
+            sources=[],
+            depends_on={
+                'nodes': [],
+                'macros': []
+            },
+            config={
+                'enabled': True,
+                'materialized': 'view',
+                'persist_docs': {},
+                'post-hook': [],
+                'pre-hook': [],
+                'vars': {},
+                'quoting': {},
+                'column_types': {},
+                'tags': [],
+            },
+            tags=[],
+            path='model_one.sql',
+            raw_sql='',
+            description='',
+            columns={}
+        )
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def _macro(self, package, name):
+        return ParsedMacro(
+            name=name,
+            resource_type='macro',
+            unique_id='macro.{}.{}'.format(package, name),
+            package_name=package,
+            depends_on={'macros': []},
+            original_file_path='macros.sql',
+            root_path='',
+            tags=[],
+            path='macros.sql',
+            raw_sql='{% macro ' + name + '() %}' + name + '{% endmacro %}',
+        )
+
+    def test_factory_is_reused(self):
+        factory = dbt.context.common.get_context_factory(
+            self.config, self.manifest, dbt.context.runtime
+        )
+        self.assertIs(
+            dbt.context.common.get_context_factory(
+                self.config, self.manifest, dbt.context.runtime
+            ),
+            factory
+        )
+        self.assertIsNot(
+            dbt.context.common.get_context_factory(
+                self.config, self.manifest, dbt.context.parser
+            ),
+            factory
+        )
+        self.assertEqual(self.get_adapter.call_count, 2)
+
+    def test_contexts_share_only_the_base(self):
+        other_model = self.model.incorporate(name='model_two',
+                                             alias='model_two')
+        first = dbt.context.runtime.generate(self.model, self.config,
+                                             self.manifest)
+        second = dbt.context.runtime.generate(other_model, self.config,
+                                              self.manifest)
+
+        self.assertIs(first['env_var'], second['env_var'])
+        self.assertIs(first['graph'], self.manifest.flat_graph())
+        self.assertEqual(first['model']['name'], 'model_one')
+        self.assertEqual(second['model']['name'], 'model_two')
+        self.assertIsNot(first['_sql_results'], second['_sql_results'])
+        self.assertIs(first['context'], first)
+
+        self.assertEqual(first['helper'](), 'helper')
+        self.assertEqual(first['root']['helper'](), 'helper')
+        self.assertEqual(first['dbt']['builtin'](), 'builtin')
+        self.assertEqual(first['builtin'](), 'builtin')
+        self.assertIsNot(first['root'], second['root'])
+
+        factory = dbt.context.common.get_context_factory(
+            self.config, self.manifest, dbt.context.runtime
+        )
+        for key in ('model', 'context', 'root', 'helper', '_sql_results'):
+            self.assertNotIn(key, factory.base)
+
+    def test_changes_do_not_leak_between_contexts(self):
+        first = dbt.context.runtime.generate(self.model, self.config,
+                                             self.manifest)
+        first['target'].update({'schema': 'changed'})
+        first['api']['Column'] = None
+        first['modules']['datetime']['date'] = None
+        first['validation']['any'] = None
+
+        second = dbt.context.runtime.generate(self.model, self.config,
+                                              self.manifest)
+        self.assertNotIn('schema', second['target'])
+        self.assertIs(second['env'], second['target'])
+        self.assertIsNotNone(second['api']['Column'])
+        self.assertIsNotNone(second['modules']['datetime']['date'])
+        self.assertIsNotNone(second['validation']['any'])
+
+    def test_macros_bound_when_looked_up(self):
+        context = dbt.context.runtime.generate(self.model, self.config,
+                                               self.manifest)
+        self.assertNotIn('helper', dict(context))
+        self.assertIn('helper', context)
+        self.assertIn('builtin', context['dbt'])
+        self.assertEqual(
+            dbt.clients.jinja.get_rendered(
+                '{{ helper() }} {{ builtin() }} {{ dbt.builtin() }}', context
+            ),
+            'helper builtin builtin'
+        )
+        self.assertIn('helper', dict(context))
+
+    def test_factory_per_manifest(self):
+        other = Manifest(nodes={}, macros=self.macros, docs={},
+                         generated_at=timestring(), disabled=[])
+        for _ in range(3):
+            for manifest in (self.manifest, other):
+                dbt.context.runtime.generate(self.model, self.config,
+                                             manifest)
+        self.assertEqual(self.get_adapter.call_count, 2)
+        self.assertIsNot(
+            self.manifest._context_factories[dbt.context.runtime],
+            other._context_factories[dbt.context.runtime]
+        )
@@ -0,0 +1,138 @@
+import random
+import unittest
+
+import networkx as nx
+
+from dbt.graph.dag import DAG, reachable
+
+
+def _random_dag(seed, num_nodes=80, max_parents=3):
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    nodes = ['n{}'.format(i) for i in range(num_nodes)]
+    for idx, node in enumerate(nodes):
+        graph.add_node(node)
+        for parent in rand.sample(nodes[:idx], min(idx, max_parents)):
+            graph.add_edge(parent, node)
+    return graph
+
+
+class DAGTest(unittest.TestCase):
+    def setUp(self):
+        self.nx_graph = _random_dag(1234)
+        self.dag = DAG.from_networkx(self.nx_graph)
+
+    def assertSameGraph(self, dag, nx_graph):
+        self.assertEqual(set(dag.nodes()), set(nx_graph.nodes()))
+        self.assertEqual(set(dag.edges()), set(nx_graph.edges()))
+        self.assertEqual(len(dag), len(nx_graph))
+        self.assertEqual(dag.number_of_edges(), nx_graph.number_of_edges())
+
+    def test_basics(self):
+        dag = DAG()
+        dag.add_edge('a', 'b')
+        dag.add_edge('a', 'b')
+        dag.add_node('c')
+        dag.add_node('a')
+        self.assertEqual(dag.nodes(), ['a', 'b', 'c'])
+        self.assertEqual(dag.edges(), [('a', 'b')])
+        self.assertTrue(dag.has_edge('a', 'b'))
+        self.assertFalse(dag.has_edge('b', 'a'))
+        self.assertFalse(dag.has_edge('a', 'z'))
+        self.assertIn('c', dag)
+        self.assertNotIn('z', dag)
+        self.assertEqual(dict(dag.in_degree_iter()), {'a': 0, 'b': 1, 'c': 0})
+        self.assertEqual(dag.out_degree('a'), 1)
+        self.assertEqual(dag.in_degree('b'), 1)
+
+    def test_networkx_round_trip(self):
+        self.assertSameGraph(self.dag, self.nx_graph)
+        self.assertSameGraph(self.dag, self.dag.to_networkx())
+
+    def test_traversals_match_networkx(self):
+        for node in self.nx_graph.nodes():
+            self.assertEqual(set(self.dag.successors(node)),
+                             set(self.nx_graph.successors(node)))
+            self.assertEqual(set(self.dag.predecessors(node)),
+                             set(self.nx_graph.predecessors(node)))
+            self.assertEqual(self.dag.descendants(node),
+                             nx.descendants(self.nx_graph, node))
+            self.assertEqual(self.dag.ancestors(node),
+                             nx.ancestors(self.nx_graph, node))
+
+    def test_reachable(self):
+        sources = ['n3', 'n10', 'n40']
+        expected = set()
+        for source in sources:
+            expected |= nx.descendants(self.nx_graph, source)
+        self.assertEqual(reachable(self.dag.successors, sources), expected)
+        self.assertEqual(reachable(self.nx_graph.successors, sources),
+                         expected)
+
+    def test_reachable_within_depth(self):
+        sources = ['n3', 'n10', 'n40']
+        for depth in range(4):
+            expected = set()
+            for source in sources:
+                lengths = nx.single_source_shortest_path_length(
+                    self.nx_graph, source, cutoff=depth
+                )
+                expected.update(n for n, d in lengths.items() if d > 0)
+            self.assertEqual(
+                reachable(self.dag.successors, sources, max_depth=depth),
+                expected
+            )
+
+    def test_topological_sort(self):
+        order = self.dag.topological_sort()
+        self.assertEqual(len(order), len(self.nx_graph))
+        position = {node: idx for idx, node in enumerate(order)}
+        for parent, child in self.nx_graph.edges():
+            self.assertLess(position[parent], position[child])
+
+        self.dag.add_edge('n50', 'n0')
+        with self.assertRaises(nx.NetworkXUnfeasible):
+            self.dag.topological_sort()
+
+    def test_remove_node(self):
+        for node in ['n5', 'n20', 'n79']:
+            self.dag.remove_node(node)
+            self.nx_graph.remove_node(node)
+        self.assertSameGraph(self.dag, self.nx_graph)
+        self.assertEqual(len(self.dag.topological_sort()), len(self.dag))
+        with self.assertRaises(KeyError):
+            self.dag.remove_node('n5')
+
+    def test_copy_is_independent(self):
+        copied = self.dag.copy()
+        copied.remove_node('n0')
+        copied.add_edge('n1', 'new')
+        self.assertSameGraph(self.dag, self.nx_graph)
+        self.assertNotIn('n0', copied)
+        self.assertIn('new', copied)
+
+    def test_subgraph(self):
+        nodes = ['n{}'.format(i) for i in range(0, 80, 3)]
+        self.assertSameGraph(self.dag.subgraph(nodes + ['missing']),
+                             self.nx_graph.subgraph(nodes))
+
+    def test_subset_preserves_reachability(self):
+        rand = random.Random(4321)
+        closure = nx.algorithms.transitive_closure(self.nx_graph)
+        for size in (1, 5, 20, 80):
+            selected = set(rand.sample(self.nx_graph.nodes(), size))
+            subset = self.dag.subset(selected)
+            self.assertEqual(set(subset.nodes()), selected)
+            for node in selected:
+                self.assertEqual(subset.descendants(node),
+                                 nx.descendants(closure, node) & selected)
+        with self.assertRaises(KeyError):
+            self.dag.subset(['missing'])
+
+    def test_find_cycle(self):
+        self.assertIsNone(self.dag.find_cycle())
+        self.dag.add_edge('n60', 'n2')
+        cycle = self.dag.find_cycle()
+        self.assertIsNotNone(cycle)
+        for parent, child in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertTrue(self.dag.has_edge(parent, child))
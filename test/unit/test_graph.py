@@ -28,7 +28,7 @@ from .utils import config_from_parts_or_dicts
 class GraphTest(unittest.TestCase):
 
     def tearDown(self):
-        self.write_gpickle_patcher.stop()
+        self.write_graph_patcher.stop()
         self.load_projects_patcher.stop()
         self.find_matching_patcher.stop()
         self.load_file_contents_patcher.stop()
@@ -38,17 +38,19 @@ class GraphTest(unittest.TestCase):
         dbt.flags.STRICT_MODE = True
         self.graph_result = None
 
-        self.write_gpickle_patcher = patch('networkx.write_gpickle')
+        self.write_graph_patcher = patch(
+            'dbt.compilation.Compiler.write_graph_file'
+        )
         self.load_projects_patcher = patch('dbt.loader._load_projects')
         self.find_matching_patcher = patch('dbt.clients.system.find_matching')
         self.load_file_contents_patcher = patch('dbt.clients.system.load_file_contents')
         self.get_adapter_patcher = patch('dbt.context.parser.get_adapter')
         self.factory = self.get_adapter_patcher.start()
 
-        def mock_write_gpickle(graph, outfile):
-            self.graph_result = graph
-        self.mock_write_gpickle = self.write_gpickle_patcher.start()
-        self.mock_write_gpickle.side_effect = mock_write_gpickle
+        def mock_write_graph_file(linker):
+            self.graph_result = linker.graph
+        self.mock_write_graph_file = self.write_graph_patcher.start()
+        self.mock_write_graph_file.side_effect = mock_write_graph_file
 
         self.profile = {
             'outputs': {
@@ -190,8 +192,6 @@ class GraphTest(unittest.TestCase):
             "model_four": "table"
         }
 
-        nodes = linker.graph.node
-
         for model, expected in expected_materialization.items():
             key = 'model.test_models_compile.{}'.format(model)
             actual = manifest.nodes[key].get('config', {}) \
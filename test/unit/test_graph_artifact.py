@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import mock
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import dbt.exceptions
+from dbt.compilation import Compiler, graph_file_name
+from dbt.graph.artifact import GraphArtifact, HEADER, write_graph
+from dbt.graph.dag import DAG
+from dbt.linker import Linker, from_file
+
+
+class GraphArtifactTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'graph.bin')
+        rand = random.Random(42)
+        self.graph = DAG()
+        nodes = ['model.root.n{}'.format(i) for i in range(100)]
+        for idx, node in enumerate(nodes):
+            self.graph.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 3)):
+                self.graph.add_edge(parent, node)
+        # and something that isn't ascii
+        self.graph.add_edge(nodes[0], u'model.root.caf\xe9')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_round_trip(self):
+        write_graph(self.path, self.graph)
+        artifact = GraphArtifact(self.path)
+        self.assertEqual(len(artifact), len(self.graph))
+        self.assertEqual(artifact.nodes(), self.graph.nodes())
+        self.assertEqual(artifact.edges(), self.graph.edges())
+        self.assertEqual(artifact.node_id(len(artifact) - 1),
+                         u'model.root.caf\xe9')
+        children = [artifact.node_id(c) for c in artifact.children(0)]
+        self.assertEqual(children, self.graph.successors('model.root.n0'))
+
+        dag = artifact.to_dag()
+        self.assertEqual(dag.edges(), self.graph.edges())
+        for node in self.graph.nodes():
+            self.assertEqual(set(dag.predecessors(node)),
+                             set(self.graph.predecessors(node)))
+        artifact.close()
+
+    def test_empty_graph(self):
+        write_graph(self.path, DAG())
+        linker = from_file(self.path)
+        self.assertEqual(linker.nodes(), [])
+        self.assertEqual(len(linker.graph), 0)
+
+    def test_linker_loads_lazily(self):
+        Linker(self.graph).write_graph(self.path)
+        linker = from_file(self.path)
+        self.assertIsNone(linker._graph)
+        self.assertEqual(linker.nodes(), self.graph.nodes())
+        self.assertEqual(linker.edges(), self.graph.edges())
+        self.assertIsNone(linker._graph)
+
+        self.assertEqual(linker.graph.edges(), self.graph.edges())
+        self.assertIsNone(linker._artifact)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as fp:
+            fp.write(b'\x80\x02cnetworkx')
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            from_file(self.path)
+
+        open(self.path, 'wb').close()
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            from_file(self.path)
+
+    def test_truncated_file(self):
+        write_graph(self.path, self.graph)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+        with open(self.path, 'rb') as fp:
+            data = fp.read()
+
+        # cut off in the arrays, and in the ID data
+        for size in (HEADER.size + 4, len(data) - 1):
+            with open(self.path, 'wb') as fp:
+                fp.write(data[:size])
+            with self.assertRaises(dbt.exceptions.RuntimeException):
+                from_file(self.path)
+
+    def test_compiler_writes_graph_file(self):
+        config = mock.MagicMock(target_path=self.tempdir)
+        Compiler(config).write_graph_file(Linker(self.graph))
+
+        written = from_file(os.path.join(self.tempdir, graph_file_name))
+        self.assertEqual(written.nodes(), self.graph.nodes())
+        self.assertEqual(written.edges(), self.graph.edges())
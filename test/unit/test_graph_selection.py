@@ -5,6 +5,7 @@ import os
 import string
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
+from dbt.node_types import NodeType
 
 import networkx as nx
 
@@ -18,11 +19,15 @@ class BaseGraphSelectionTest(unittest.TestCase):
     def setUp(self):
         self.package_graph = self.create_graph()
         nodes = {
-            node: mock.MagicMock(fqn=node.split('.')[1:], tags=[])
+            node: mock.MagicMock(fqn=node.split('.')[1:], tags=[],
+                                 resource_type=NodeType.Model)
             for node in self.package_graph
         }
         self.add_tags(nodes)
         self.manifest = mock.MagicMock(nodes=nodes)
+        self.manifest.get_unique_ids_by_tag.side_effect = lambda tag: {
+            unique_id for unique_id, node in nodes.items() if tag in node.tags
+        }
         self.linker = mock.MagicMock(graph=self.package_graph)
         self.selector = graph_selector.NodeSelector(self.linker, self.manifest)
 
@@ -127,6 +132,28 @@ class GraphSelectionTest(BaseGraphSelectionTest):
             set(['m.X.a', 'm.X.c', 'm.Y.f', 'm.X.g'])
         )
 
+    def test__select_children_within_depth(self):
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['X.a+1'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.X.c'])
+        )
+
+    def test__select_parents_within_depth(self):
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['1+X.e'],
+            [],
+            set(['m.Y.b', 'm.X.e'])
+        )
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['2+X.e+1'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.X.e'])
+        )
+
     def parse_spec_and_assert(self, spec, parents, children, filter_type, filter_value, childrens_parents):
         parsed = graph_selector.SelectionCriteria(spec)
         self.assertEqual(parsed.select_parents, parents)
@@ -154,6 +181,22 @@ class GraphSelectionTest(BaseGraphSelectionTest):
         self.parse_spec_and_assert('@a.b', False, False, 'fqn', 'a.b', True)
         self.invalid_spec('@a.b+')
 
+    def test__spec_parsing_depth(self):
+        parsed = graph_selector.SelectionCriteria('2+a+3')
+        self.assertEqual(parsed.parents_depth, 2)
+        self.assertEqual(parsed.children_depth, 3)
+        self.assertEqual(parsed.selector_value, 'a')
+
+        parsed = graph_selector.SelectionCriteria('+tag:a+')
+        self.assertIsNone(parsed.parents_depth)
+        self.assertIsNone(parsed.children_depth)
+        self.assertEqual(parsed.selector_type, 'tag')
+
+        self.parse_spec_and_assert('10+a', True, False, 'fqn', 'a', False)
+        self.parse_spec_and_assert('a+10', False, True, 'fqn', 'a', False)
+        self.parse_spec_and_assert('1a+', False, True, 'fqn', '1a', False)
+        self.parse_spec_and_assert('12+', False, True, 'fqn', '12', False)
+
         self.parse_spec_and_assert('a.b.*', False, False, 'fqn', 'a.b.*', False)
         self.parse_spec_and_assert('+a.b.*', True, False, 'fqn', 'a.b.*', False)
         self.parse_spec_and_assert('a.b.*+', False, True, 'fqn', 'a.b.*', False)
@@ -202,3 +245,44 @@ class GraphSelectionTest(BaseGraphSelectionTest):
         self.assert_is_selected_node(('X', 'a'), ('X', 'b'), False)
         self.assert_is_selected_node(('X', 'a'), ('X', 'a', 'b'), False)
         self.assert_is_selected_node(('X', 'a'), ('Y', '*'), False)
+
+    def test__fqn_index_search(self):
+        fqns = [
+            ('X', 'a'),
+            ('X', 'a', 'b', 'c'),
+            ('X', 'staging', 'a'),
+            ('Y', 'staging', 'b'),
+        ]
+        index = graph_selector.FQNIndex()
+        for fqn in fqns:
+            index.add('.'.join(fqn), fqn)
+
+        selectors = [
+            ('a',), ('*',), ('X', '*'), ('X', 'a'), ('X', 'a', 'b'),
+            ('X', 'a', 'a'), ('X', 'staging'), ('staging', '*'),
+            ('X', 'a', 'b', 'c'), ('X', 'b'), ('Y', '*'), ('Z', 'a'),
+        ]
+        for selector in selectors:
+            expected = set(
+                '.'.join(fqn) for fqn in fqns
+                if graph_selector.is_selected_node(fqn, selector)
+            )
+            self.assertEqual(set(index.search(selector)), expected,
+                             msg=selector)
+
+    def test__fqn_index_match(self):
+        index = graph_selector.FQNIndex.from_manifest(self.manifest)
+        package_names = set(['X', 'Y'])
+        for spec in ['a', 'X.a', 'Y.*', '*', 'X.b', 'b', 'Z.a', 'X.a.b']:
+            qualified_name = spec.split('.')
+            expected = set(
+                unique_id for unique_id, node in self.manifest.nodes.items()
+                if graph_selector._node_is_match(qualified_name,
+                                                 package_names, node.fqn)
+            )
+            self.assertEqual(index.match(qualified_name, package_names),
+                             expected, msg=spec)
+
+    def test__select_by_name_in_subgraph(self):
+        subgraph = self.package_graph.subgraph(['m.X.a', 'm.Y.b'])
+        self.run_specs_and_assert(subgraph, ['X.*'], [], set(['m.X.a']))
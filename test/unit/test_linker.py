@@ -1,5 +1,10 @@
 import mock
+import random
+import threading
 import unittest
+from multiprocessing.dummy import Pool as ThreadPool
+
+import networkx as nx
 
 import dbt.utils
 
@@ -156,7 +161,9 @@ class LinkerTest(unittest.TestCase):
         for (l, r) in actual_deps:
             self.linker.dependency(l, r)
 
-        self.assertIsNotNone(self.linker.find_cycles())
+        cycle = self.linker.find_cycles()
+        self.assertIsNotNone(cycle)
+        self._assert_is_cycle(cycle)
 
     def test__find_cycles__no_cycles(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
@@ -165,3 +172,277 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def _assert_is_cycle(self, cycle):
+        nodes = cycle.split(' --> ')
+        self.assertEqual(nodes[0], nodes[-1])
+        self.assertEqual(len(set(nodes[:-1])), len(nodes) - 1)
+        for parent, child in zip(nodes, nodes[1:]):
+            self.assertTrue(self.linker.graph.has_edge(parent, child))
+
+    def test__find_cycles__self_loop(self):
+        self.linker.dependency('A', 'B')
+        self.linker.dependency('B', 'B')
+        self.assertEqual(self.linker.find_cycles(), 'B --> B')
+
+    def test__find_cycles__dense_graph(self):
+        rand = random.Random(1357)
+        nodes = ['n{}'.format(i) for i in range(200)]
+        for idx, node in enumerate(nodes):
+            self.linker.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 20)):
+                self.linker.dependency(node, parent)
+        self.assertIsNone(self.linker.find_cycles())
+
+        # close a cycle deep in the graph
+        self.linker.dependency('n10', 'n150')
+        cycle = self.linker.find_cycles()
+        self.assertIsNotNone(cycle)
+        self._assert_is_cycle(cycle)
+
+    def test__calculate_scores__matches_descendant_count(self):
+        rand = random.Random(1234)
+        nodes = ['n{}'.format(i) for i in range(60)]
+        for idx, node in enumerate(nodes):
+            self.linker.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 3)):
+                self.linker.dependency(node, parent)
+
+        blocking = set(rand.sample(nodes, 40))
+        self.is_blocking_dependency.side_effect = \
+            lambda n: n.unique_id in blocking
+
+        queue = self.linker.as_graph_queue(_mock_manifest(nodes))
+        for node in nodes:
+            expected = -len(
+                nx.descendants(self.linker.to_networkx(), node) & blocking
+            )
+            self.assertEqual(queue._scores[node], expected)
+
+    def test__subset_graph__preserves_reachability(self):
+        rand = random.Random(4321)
+        nodes = ['n{}'.format(i) for i in range(80)]
+        for idx, node in enumerate(nodes):
+            self.linker.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 2)):
+                self.linker.dependency(node, parent)
+
+        closure = nx.algorithms.transitive_closure(self.linker.to_networkx())
+        for size in (1, 5, 20, 80):
+            selected = set(rand.sample(nodes, size))
+            subset = linker._subset_graph(self.linker.graph, selected)
+            self.assertEqual(set(subset.nodes()), selected)
+            for node in selected:
+                self.assertEqual(
+                    subset.descendants(node),
+                    nx.descendants(closure, node) & selected
+                )
+
+    def test_graph_queue__many_threads(self):
+        rand = random.Random(99)
+        nodes = ['n{}'.format(i) for i in range(500)]
+        for idx, node in enumerate(nodes):
+            self.linker.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 3)):
+                self.linker.dependency(node, parent)
+        graph = self.linker.graph.copy()
+
+        queue = self.linker.as_graph_queue(_mock_manifest(nodes))
+        done = set()
+        out_of_order = []
+        done_lock = threading.Lock()
+
+        def run(node_id):
+            with done_lock:
+                if not set(graph.predecessors(node_id)) <= done:
+                    out_of_order.append(node_id)
+            return node_id
+
+        def callback(node_id):
+            with done_lock:
+                done.add(node_id)
+            queue.mark_done(node_id)
+
+        pool = ThreadPool(64)
+        while not queue.empty():
+            node = queue.get()
+            pool.apply_async(run, args=(node.unique_id,), callback=callback)
+        queue.join()
+        pool.close()
+        pool.join()
+
+        self.assertEqual(out_of_order, [])
+        self.assertEqual(done, set(nodes))
+        self.assert_would_join(queue)
+
+    def _make_slow_and_fast_chains(self):
+        # 'slow' has one child, 'fast' heads a chain of three quick nodes
+        self.linker.dependency('slow_child', 'slow')
+        self.linker.dependency('f1', 'fast')
+        self.linker.dependency('f2', 'f1')
+        self.linker.dependency('f3', 'f2')
+        return _mock_manifest(['slow', 'slow_child', 'fast', 'f1', 'f2', 'f3'])
+
+    def test_graph_queue__critical_path(self):
+        manifest = self._make_slow_and_fast_chains()
+        execution_times = {
+            'slow': 100, 'slow_child': 5, 'fast': 1, 'f1': 1, 'f2': 1, 'f3': 1,
+        }
+        queue = self.linker.as_graph_queue(manifest,
+                                           execution_times=execution_times)
+        self.assertEqual(queue._scores['slow'], (-105, -1))
+        self.assertEqual(queue._scores['fast'], (-4, -3))
+        self.assertEqual(queue.get(block=False).unique_id, 'slow')
+
+    def test_graph_queue__critical_path_no_history(self):
+        manifest = self._make_slow_and_fast_chains()
+        queue = self.linker.as_graph_queue(manifest,
+                                           execution_times={'other': 10})
+        self.assertEqual(queue._scores['fast'], -3)
+        self.assertEqual(queue.get(block=False).unique_id, 'fast')
+
+    def test_graph_queue__critical_path_partial_history(self):
+        manifest = self._make_slow_and_fast_chains()
+        # nodes without history are assumed to take the median known time
+        execution_times = {'slow': 100, 'slow_child': 20, 'fast': 30}
+        queue = self.linker.as_graph_queue(manifest,
+                                           execution_times=execution_times)
+        self.assertEqual(queue._scores['slow'], (-120, -1))
+        self.assertEqual(queue._scores['fast'], (-120, -3))
+        self.assertEqual(queue.get(block=False).unique_id, 'fast')
+
+    def test_graph_queue__get_dependent_nodes(self):
+        actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('E', 'D')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCDE'),
+                                           ['A', 'C', 'D'])
+        # only selected nodes are dependents, including through 'B'
+        self.assertEqual(queue.get_dependent_nodes('D'), {'A', 'C'})
+        self.assertEqual(queue.get_dependent_nodes('C'), {'A'})
+        self.assertEqual(queue.get_dependent_nodes('A'), set())
+
+        # removing nodes from the queue's graph does not change the answer
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'D')
+        queue.mark_done('D')
+        self.assertEqual(queue.get_dependent_nodes('D'), {'A', 'C'})
+
+    def test_reachability_index__matches_descendants(self):
+        rand = random.Random(2468)
+        nodes = ['n{}'.format(i) for i in range(80)]
+        for idx, node in enumerate(nodes):
+            self.linker.add_node(node)
+            for parent in rand.sample(nodes[:idx], min(idx, 2)):
+                self.linker.dependency(node, parent)
+
+        index = linker.ReachabilityIndex(self.linker.graph)
+        for node in nodes:
+            expected = nx.descendants(self.linker.to_networkx(), node)
+            self.assertEqual(index.get_dependent_nodes(node), expected)
+            # and again, from the memo
+            self.assertEqual(index.get_dependent_nodes(node), expected)
+
+        # looking up dependents first reuses their memoized descendants
+        index = linker.ReachabilityIndex(self.linker.graph)
+        for node in reversed(nodes):
+            expected = nx.descendants(self.linker.to_networkx(), node)
+            self.assertEqual(index.get_dependent_nodes(node), expected)
+
+    def _concurrency_manifest(self, nodes):
+        manifest = _mock_manifest(nodes)
+        for name, node in manifest.nodes.items():
+            data = {
+                'tags': ['heavy'] if name.startswith('h') else [],
+                'schema': 'analytics',
+                'config': {'materialized': 'view'},
+            }
+            node.get.side_effect = data.get
+        return manifest
+
+    def test_graph_queue__concurrency_limits(self):
+        nodes = ['h1', 'h2', 'h3', 'l1', 'l2']
+        for node in nodes:
+            self.linker.add_node(node)
+
+        manifest = self._concurrency_manifest(nodes)
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency={'tags': {'heavy': 2}}
+        )
+
+        got = set()
+        while True:
+            try:
+                got.add(queue.get(block=False).unique_id)
+            except Empty:
+                break
+        # only two of the three heavy nodes are handed out at once
+        self.assertEqual(len(got), 4)
+        self.assertEqual(len([n for n in got if n.startswith('h')]), 2)
+        self.assertEqual(len(queue.blocked), 1)
+
+        heavy = sorted(n for n in got if n.startswith('h'))[0]
+        queue.mark_done('l1')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+
+        # finishing a heavy node frees its slot for the blocked one
+        queue.mark_done(heavy)
+        last = queue.get(block=False).unique_id
+        self.assertTrue(last.startswith('h'))
+        self.assertNotIn(last, got)
+        self.assertEqual(queue.blocked, set())
+
+    def test_graph_queue__concurrency_limits_all_pools(self):
+        self.linker.dependency('B', 'A')
+        self.linker.add_node('C')
+
+        manifest = self._concurrency_manifest('ABC')
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency={'schemas': {'analytics': 1},
+                                   'materializations': {'table': 1}}
+        )
+        # everything is in the 'analytics' schema, so nodes run one at a time
+        # in priority order
+        order = []
+        while not queue.empty():
+            node = queue.get(block=False)
+            with self.assertRaises(Empty):
+                queue.get(block=False)
+            order.append(node.unique_id)
+            queue.mark_done(node.unique_id)
+        self.assertEqual(order, ['A', 'B', 'C'])
+
+    def test_graph_queue__concurrency_limits_wake_released_pool(self):
+        nodes = ['h1', 'h2', 'h3', 'h4', 'l1', 'l2']
+        for node in nodes:
+            self.linker.add_node(node)
+
+        manifest = self._concurrency_manifest(nodes)
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency={'tags': {'heavy': 1}}
+        )
+        got = []
+        while True:
+            try:
+                got.append(queue.get(block=False).unique_id)
+            except Empty:
+                break
+        self.assertEqual(len(queue.blocked), 3)
+
+        # finishing a node outside the pool doesn't look at the waiting ones
+        with mock.patch.object(queue, '_get_pools',
+                               wraps=queue._get_pools) as get_pools:
+            queue.mark_done('l1')
+            self.assertEqual(get_pools.call_count, 0)
+
+        heavy = [n for n in got if n.startswith('h')]
+        self.assertEqual(len(heavy), 1)
+        for _ in range(3):
+            queue.mark_done(heavy[-1])
+            heavy.append(queue.get(block=False).unique_id)
+            with self.assertRaises(Empty):
+                queue.get(block=False)
+        self.assertEqual(sorted(heavy), ['h1', 'h2', 'h3', 'h4'])
+        self.assertEqual(queue.blocked, set())
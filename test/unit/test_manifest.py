@@ -4,13 +4,16 @@ import mock
 import copy
 import os
 
+import dbt.exceptions
 import dbt.flags
 from dbt import tracking
 from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.parsed import ParsedNode
+from dbt.contracts.graph.parsed import ParsedNode, ParsedNodePatch, \
+    ParsedSourceDefinition, ParsedMacro, ParsedDocumentation
 from dbt.contracts.graph.compiled import CompiledNode
 from dbt.utils import timestring
 import freezegun
+import jinja2
 
 class ManifestTest(unittest.TestCase):
     def setUp(self):
@@ -271,6 +274,58 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(set(node), expected_keys)
 
+    def test__flat_graph(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        flat_graph = manifest.flat_graph()
+        self.assertIs(manifest.flat_graph(), flat_graph)
+        self.assertEqual(
+            {k: dict(v) for k, v in flat_graph.items()},
+            manifest.to_flat_graph()
+        )
+
+        # each node's dict is built once
+        flat_nodes = flat_graph['nodes']
+        dep = flat_nodes['model.root.dep']
+        self.assertIs(flat_nodes['model.root.dep'], dep)
+
+        # reads see nodes replaced after the view was created
+        nodes['model.root.dep'] = nodes['model.root.dep'].incorporate(
+            alias='dep_v2'
+        )
+        self.assertEqual(flat_nodes['model.root.dep']['alias'], 'dep_v2')
+
+        template = jinja2.Template(
+            "{% for node in graph.nodes.values() %}"
+            "{% if node.package_name == 'snowplow' %}{{ node.name }}"
+            "{% endif %}{% endfor %}"
+        )
+        self.assertEqual(template.render(graph=flat_graph), 'events')
+
+    def test__flat_graph_invalidated(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        flat_nodes = manifest.flat_graph()['nodes']
+        self.assertEqual(flat_nodes['model.root.dep']['description'], '')
+
+        patch = ParsedNodePatch(
+            name='dep',
+            description='All the deps',
+            original_file_path='models/schema.yml',
+            columns={},
+            docrefs=[],
+        )
+        manifest.patch_nodes({'dep': patch})
+        self.assertEqual(flat_nodes['model.root.dep']['description'],
+                         'All the deps')
+
+        node = nodes.pop('model.root.events').incorporate(alias='events_v2')
+        manifest.add_nodes({'model.root.events': node})
+        self.assertEqual(flat_nodes['model.root.events']['alias'],
+                         'events_v2')
+
     @mock.patch.object(tracking, 'active_user')
     def test_get_metadata(self, mock_user):
         mock_user.id = 'cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf'
@@ -367,6 +422,168 @@ class ManifestTest(unittest.TestCase):
         resource_fqns = manifest.get_resource_fqns()
         self.assertEqual(resource_fqns, expect)
 
+    def test_indexes(self):
+        nodes = copy.copy(self.nested_nodes)
+        nodes['model.root.dep'] = nodes['model.root.dep'].incorporate(
+            tags=['nightly', 'finance']
+        )
+        nodes['model.root.multi'] = nodes['model.root.multi'].incorporate(
+            tags=['nightly']
+        )
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+
+        self.assertEqual(manifest.get_unique_ids_by_tag('nightly'),
+                         {'model.root.dep', 'model.root.multi'})
+        self.assertEqual(manifest.get_unique_ids_by_tag('finance'),
+                         {'model.root.dep'})
+        self.assertEqual(manifest.get_unique_ids_by_tag('missing'), set())
+        self.assertEqual(manifest.get_unique_ids_by_resource_type('model'),
+                         set(nodes))
+        self.assertEqual(manifest.get_unique_ids_by_resource_type('seed'),
+                         set())
+
+        source = ParsedSourceDefinition(
+            unique_id='source.root.my_source.my_table',
+            name='my_table',
+            description='',
+            source_name='my_source',
+            source_description='',
+            loader='',
+            package_name='root',
+            root_path='',
+            path='schema.yml',
+            original_file_path='schema.yml',
+            columns={},
+            docrefs=[],
+            freshness={},
+            loaded_at_field=None,
+            database='dbt',
+            schema='raw',
+            identifier='my_table',
+            resource_type='source',
+            quoting={},
+        )
+        manifest.add_nodes({source.unique_id: source})
+        self.assertEqual(manifest.get_unique_ids_by_source_name('my_source'),
+                         {source.unique_id})
+        self.assertEqual(manifest.get_unique_ids_by_resource_type('source'),
+                         {source.unique_id})
+        self.assertEqual(manifest.get_unique_ids_by_source_name('other'),
+                         set())
+
+        patch = ParsedNodePatch(
+            name='multi',
+            description='patched',
+            original_file_path='schema.yml',
+            columns={},
+            docrefs=[],
+        )
+        manifest.patch_nodes({'multi': patch})
+        self.assertEqual(nodes['model.root.multi'].description, 'patched')
+        self.assertEqual(manifest.get_unique_ids_by_tag('nightly'),
+                         {'model.root.dep', 'model.root.multi'})
+
+
+    def test_get_unique_ids_for_schema_and_table(self):
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                            docs={}, generated_at=timestring(), disabled=[])
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('ANALYTICS',
+                                                         'Events'),
+            ['model.snowplow.events', 'model.root.events']
+        )
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('raw', 'events'),
+            []
+        )
+
+        seed = self.nested_nodes['model.root.dep'].incorporate(
+            unique_id='seed.root.raw_events', name='raw_events',
+            resource_type='seed', schema='raw', alias='events'
+        )
+        manifest.add_nodes({seed.unique_id: seed})
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('raw', 'events'),
+            ['seed.root.raw_events']
+        )
+
+    def _macro(self, package, name):
+        return ParsedMacro(
+            name=name,
+            resource_type='macro',
+            unique_id='macro.{}.{}'.format(package, name),
+            package_name=package,
+            depends_on={'macros': []},
+            original_file_path='macros.sql',
+            root_path='',
+            tags=[],
+            path='macros.sql',
+            raw_sql='{% macro ' + name + '() %}{% endmacro %}',
+        )
+
+    def _doc(self, package, name):
+        return ParsedDocumentation(
+            name=name,
+            unique_id='{}.{}'.format(package, name),
+            block_contents='contents',
+            package_name=package,
+            root_path='',
+            path='docs.md',
+            original_file_path='docs.md',
+            file_contents='',
+            resource_type='documentation',
+        )
+
+    def test_find_by_name(self):
+        macros = {
+            'macro.root.helper': self._macro('root', 'helper'),
+            'macro.dbt.helper': self._macro('dbt', 'helper'),
+        }
+        docs = {
+            'snowplow.events': self._doc('snowplow', 'events'),
+            'root.events': self._doc('root', 'events'),
+        }
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes),
+                            macros=macros, docs=docs,
+                            generated_at=timestring(), disabled=[])
+
+        found = manifest.find_refable_by_name('events', 'root')
+        self.assertEqual(found.unique_id, 'model.root.events')
+        # with no package, the first node added wins
+        found = manifest.find_refable_by_name('events', None)
+        self.assertEqual(found.unique_id, 'model.snowplow.events')
+        self.assertIsNone(manifest.find_refable_by_name('events', 'other'))
+        self.assertIsNone(manifest.find_refable_by_name('missing', None))
+        self.assertIsNone(manifest.find_source_by_name('root', 'events',
+                                                       None))
+
+        found = manifest.find_macro_by_name('helper', 'dbt')
+        self.assertEqual(found.unique_id, 'macro.dbt.helper')
+        self.assertIsNone(manifest.find_macro_by_name('other', None))
+
+        replacement = self._macro('root', 'helper')
+        manifest.add_macros({
+            'macro.root.helper': replacement,
+            'macro.root.other': self._macro('root', 'other'),
+        })
+        self.assertIs(manifest.find_macro_by_name('helper', None),
+                      replacement)
+        found = manifest.find_macro_by_name('other', None)
+        self.assertEqual(found.unique_id, 'macro.root.other')
+
+        self.assertIs(manifest.find_docs_by_name('events', 'root'),
+                      docs['root.events'])
+        self.assertIs(manifest.find_docs_by_name('events'),
+                      docs['snowplow.events'])
+        self.assertIsNone(manifest.find_docs_by_name('events', 'other'))
+
+    def test_find_docs_by_name_invalid(self):
+        doc = self._doc('root', 'events')
+        with self.assertRaises(dbt.exceptions.CompilationException):
+            Manifest(nodes={}, macros={}, docs={'root.events.x': doc},
+                     generated_at=timestring(), disabled=[])
+
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,166 @@
+import os
+import shutil
+import tempfile
+
+import mock
+
+import dbt.context.common
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedMacro
+from dbt.parser import ModelParser
+from dbt.parser.partial import ParseCache, PARSE_CACHE_FILE_NAME
+from dbt.utils import timestring
+
+from .test_parser import BaseParserTest, get_os_path
+from .utils import config_from_parts_or_dicts
+
+
+def macro(name, raw_sql):
+    return ParsedMacro(
+        name=name,
+        resource_type='macro',
+        unique_id='macro.root.{}'.format(name),
+        package_name='root',
+        depends_on={'macros': []},
+        original_file_path='macros.sql',
+        root_path=get_os_path('/usr/src/app'),
+        tags=[],
+        path='macros.sql',
+        raw_sql=raw_sql,
+    )
+
+
+class ParseCacheTest(BaseParserTest):
+    def setUp(self):
+        super(ParseCacheTest, self).setUp()
+        self.target_path = tempfile.mkdtemp()
+        self.path = os.path.join(self.target_path, PARSE_CACHE_FILE_NAME)
+        self.macros = {'macro.root.a': macro('a', 'select 1')}
+
+    def tearDown(self):
+        shutil.rmtree(self.target_path)
+        super(ParseCacheTest, self).tearDown()
+
+    def write_cache(self, env_vars=()):
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        for name in env_vars:
+            dbt.context.common.env_var(name)
+        cache.set(ParseCache.MACRO, 'root.macros.sql', 'x', ['macro'])
+        cache.set(ParseCache.NODE, 'model.root.a', 'x', {'name': 'a'})
+        cache.write(self.path)
+
+    def assert_rendered_cached(self, cache, cached=True):
+        self.assertEqual(cache.get(ParseCache.MACRO, 'root.macros.sql', 'x'),
+                         ['macro'])
+        result = cache.get(ParseCache.NODE, 'model.root.a', 'x')
+        if cached:
+            self.assertEqual(result, {'name': 'a'})
+        else:
+            self.assertIsNone(result)
+
+    def test_reuses_unchanged(self):
+        self.write_cache()
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        self.assertIsNone(cache.get(ParseCache.NODE, 'model.root.a', 'y'))
+        self.assertIsNone(cache.get(ParseCache.NODE, 'model.root.b', 'x'))
+
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        self.assert_rendered_cached(cache)
+
+    def test_drops_unused_entries(self):
+        self.write_cache()
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        cache.get(ParseCache.NODE, 'model.root.a', 'x')
+        cache.write(self.path)
+
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        self.assertIsNone(
+            cache.get(ParseCache.MACRO, 'root.macros.sql', 'x')
+        )
+        self.assertEqual(cache.get(ParseCache.NODE, 'model.root.a', 'x'),
+                         {'name': 'a'})
+
+    def test_macro_changed(self):
+        self.write_cache()
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros({'macro.root.a': macro('a', 'select 2')})
+        self.assert_rendered_cached(cache, cached=False)
+
+    def test_config_changed(self):
+        self.write_cache()
+        root_project = config_from_parts_or_dicts(
+            project=self.root_project_config.to_project_config(),
+            profile=self.root_project_config,
+            cli_vars='{"test_schema_name": "bar"}'
+        )
+        all_projects = dict(self.all_projects, root=root_project)
+        cache = ParseCache.load(self.path, all_projects)
+        cache.set_macros(self.macros)
+        self.assert_rendered_cached(cache, cached=False)
+
+    def test_env_var_changed(self):
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_CACHE': 'a'}):
+            self.write_cache(env_vars=['DBT_TEST_PARSE_CACHE'])
+            cache = ParseCache.load(self.path, self.all_projects)
+            cache.set_macros(self.macros)
+            self.assert_rendered_cached(cache)
+
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_CACHE': 'b'}):
+            cache = ParseCache.load(self.path, self.all_projects)
+            cache.set_macros(self.macros)
+            self.assert_rendered_cached(cache, cached=False)
+
+    def test_env_vars_read_by_earlier_parse(self):
+        # a long-running process read this while parsing something else
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_CACHE': 'a'}):
+            dbt.context.common.env_var('DBT_TEST_PARSE_CACHE')
+            self.write_cache()
+
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_CACHE': 'b'}):
+            cache = ParseCache.load(self.path, self.all_projects)
+            cache.set_macros(self.macros)
+            self.assert_rendered_cached(cache)
+
+    def test_parse_sql_nodes(self):
+        models = [{
+            'name': 'model_one',
+            'resource_type': 'model',
+            'package_name': 'root',
+            'original_file_path': 'model_one.sql',
+            'root_path': get_os_path('/usr/src/app'),
+            'path': 'model_one.sql',
+            'raw_sql': ("{{ config(materialized='table') }}"
+                        "select * from {{ ref('events') }}"),
+        }]
+        macro_manifest = Manifest(macros={}, nodes={}, docs={},
+                                  generated_at=timestring(), disabled=[])
+
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        parser = ModelParser(self.root_project_config, self.all_projects,
+                             macro_manifest, parse_cache=cache)
+        parsed, _ = parser.parse_sql_nodes(models)
+        cache.write(self.path)
+
+        cache = ParseCache.load(self.path, self.all_projects)
+        cache.set_macros(self.macros)
+        parser = ModelParser(self.root_project_config, self.all_projects,
+                             macro_manifest, parse_cache=cache)
+        with mock.patch.object(parser, 'parse_node') as parse_node:
+            cached, _ = parser.parse_sql_nodes(models)
+            self.assertFalse(parse_node.called)
+
+        self.assertEqual(cached, parsed)
+        node = cached['model.root.model_one']
+        self.assertEqual(node.refs, [['events']])
+        self.assertEqual(node.config['materialized'], 'table')
+
+        models[0]['raw_sql'] = 'select 1'
+        with mock.patch.object(parser, 'parse_node') as parse_node:
+            parser.parse_sql_nodes(models)
+            self.assertTrue(parse_node.called)
@@ -4,9 +4,12 @@ import mock
 import os
 import yaml
 
+import dbt.context.common
+import dbt.exceptions
 import dbt.flags
 import dbt.parser
 from dbt.parser import ModelParser, MacroParser, DataTestParser, SchemaParser, ParserUtils
+from dbt.parser.pool import ParsePool
 from dbt.parser.source_config import SourceConfig
 from dbt.utils import timestring
 from dbt.config import RuntimeConfig
@@ -2440,3 +2443,93 @@ class ParserTest(BaseParserTest):
                 )
             }, [])
         )
+
+
+class ParsePoolTest(BaseParserTest):
+    def setUp(self):
+        super(ParsePoolTest, self).setUp()
+        self.macro_manifest = Manifest(macros={}, nodes={}, docs={},
+                                       generated_at=timestring(), disabled=[])
+        self.pool = ParsePool(self.root_project_config, self.all_projects,
+                              self.macro_manifest, 2)
+        self.addCleanup(self.pool.close)
+
+    def model(self, name, raw_sql):
+        return {
+            'name': name,
+            'resource_type': 'model',
+            'package_name': 'root',
+            'original_file_path': name + '.sql',
+            'root_path': get_os_path('/usr/src/app'),
+            'path': name + '.sql',
+            'raw_sql': raw_sql,
+        }
+
+    def parser(self, parser_type, parse_pool):
+        return parser_type(self.root_project_config, self.all_projects,
+                           self.macro_manifest, parse_pool=parse_pool)
+
+    def test__models(self):
+        models = [
+            self.model('model_{}'.format(i),
+                       "{{ config(enabled=" + str(i % 3 != 0) + ") }}"
+                       "select * from {{ ref('model_" + str(i + 1) + "') }}")
+            for i in range(20)
+        ]
+        serial = self.parser(ModelParser, None).parse_sql_nodes(models)
+        pooled = self.parser(ModelParser, self.pool).parse_sql_nodes(models)
+        self.assertEqual(pooled, serial)
+        self.assertEqual(len(pooled[0]), 13)
+        self.assertEqual(pooled[1][0].name, 'model_0')
+
+    def test__env_vars_read(self):
+        models = [self.model('model_one',
+                             "{{ env_var('DBT_TEST_PARSE_POOL', 'x') }}")]
+        dbt.context.common.ENV_VARS_READ.discard('DBT_TEST_PARSE_POOL')
+        self.parser(ModelParser, self.pool).parse_sql_nodes(models)
+        self.assertIn('DBT_TEST_PARSE_POOL', dbt.context.common.ENV_VARS_READ)
+
+    def test__error_reported(self):
+        models = [self.model('model_one', 'select 1'),
+                  self.model('model_two', '{{ ref() }}')]
+        parser = self.parser(ModelParser, self.pool)
+        with mock.patch.object(parser, 'parse_sql_node',
+                               wraps=parser.parse_sql_node) as parse_sql_node:
+            with self.assertRaises(dbt.exceptions.CompilationException) as cm:
+                parser.parse_sql_nodes(models)
+            # only the node that failed in the pool is parsed again
+            parse_sql_node.assert_called_once_with(models[1], [])
+        self.assertIn('model_two', str(cm.exception))
+
+    def test__schema_files(self):
+        schema_yml = (
+            'version: 2\n'
+            'models:\n'
+            '  - name: model_one\n'
+            '    description: my model\n'
+            '    columns:\n'
+            '      - name: id\n'
+            '        tests: [unique, not_null]\n'
+        )
+        contents = {'/usr/src/app/models/schema.yml': schema_yml,
+                    '/usr/src/app/models/invalid.yml': '{'}
+        file_matches = [
+            {'searched_path': 'models', 'absolute_path': path,
+             'relative_path': os.path.basename(path)}
+            for path in sorted(contents)
+        ]
+        root_dir = get_os_path('/usr/src/app')
+        results = []
+        for parse_pool in (None, self.pool):
+            parser = self.parser(SchemaParser, parse_pool)
+            with mock.patch('dbt.clients.system.find_matching',
+                            return_value=file_matches), \
+                    mock.patch('dbt.clients.system.load_file_contents',
+                               side_effect=lambda p, strip: contents[p]):
+                results.append(parser.load_and_parse('root', root_dir,
+                                                     ['models']))
+
+        self.assertEqual(results[1], results[0])
+        tests, patches, sources = results[1]
+        self.assertEqual(len(tests), 2)
+        self.assertEqual(patches['model_one'].description, 'my model')
@@ -163,6 +163,19 @@ class TestPostgresAdapter(unittest.TestCase):
             {('dbt', 'foo', 'bar'), ('dbt', 'FOO', 'baz'), ('dbt', 'quux', 'bar')}
         )
 
+    @mock.patch.object(PostgresAdapter, 'execute')
+    def test_execute_main_records_latency(self, mock_execute):
+        mock_execute.return_value = ('SELECT 1', None)
+        self.assertEqual(
+            self.adapter.execute_main('select 1', unique_id='model.root.x'),
+            ('SELECT 1', None)
+        )
+        mock_execute.assert_called_once_with('select 1', auto_begin=False,
+                                             fetch=False)
+        latencies = self.adapter.connections.query_latencies.drain()
+        self.assertEqual(len(latencies), 1)
+        self.assertEqual(latencies[0][0], 'model.root.x')
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,242 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from dbt.adapters.base.connections import QueryLatencies
+from dbt.contracts.graph.manifest import CompileResultNode
+from dbt.contracts.results import ExecutionResult, RunModelResult
+from dbt.task.runnable import AdaptiveConcurrency, ResultCheckpoint, \
+    load_execution_times
+
+
+def _make_node(name):
+    return CompileResultNode(
+        name=name,
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        resource_type='model',
+        unique_id='model.root.{}'.format(name),
+        fqn=['root', name],
+        empty=False,
+        package_name='root',
+        root_path='/usr/src/app',
+        refs=[],
+        sources=[],
+        depends_on={'nodes': [], 'macros': []},
+        config={
+            'enabled': True,
+            'materialized': 'view',
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        },
+        tags=[],
+        path='{}.sql'.format(name),
+        original_file_path='{}.sql'.format(name),
+        raw_sql='select 1',
+        compiled=True,
+        compiled_sql='select 1',
+        extra_ctes_injected=True,
+        extra_ctes=[],
+        injected_sql='select 1',
+    )
+
+
+class ResultCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'run_results.checkpoint')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _write(self, *results, **kwargs):
+        checkpoint = ResultCheckpoint(self.path)
+        checkpoint.open(resume=kwargs.get('resume', False))
+        for result in results:
+            checkpoint.write(result)
+        checkpoint.close()
+        return checkpoint
+
+    def test_load_succeeded(self):
+        ok = RunModelResult(_make_node('ok'), status='CREATE VIEW',
+                            execution_time=2.5)
+        error = RunModelResult(_make_node('error'), error='bad', status='ERROR')
+        skipped = RunModelResult(_make_node('skipped'), skip=True)
+        checkpoint = self._write(ok, error, skipped)
+
+        results = checkpoint.load_succeeded()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].node.unique_id, 'model.root.ok')
+        self.assertEqual(results[0].status, 'CREATE VIEW')
+        self.assertEqual(results[0].execution_time, 2.5)
+
+    def test_resume_appends(self):
+        self._write(RunModelResult(_make_node('a')))
+        checkpoint = self._write(RunModelResult(_make_node('b')), resume=True)
+        self.assertEqual(
+            [r.node.unique_id for r in checkpoint.load_succeeded()],
+            ['model.root.a', 'model.root.b']
+        )
+
+        checkpoint = self._write(RunModelResult(_make_node('c')))
+        self.assertEqual(
+            [r.node.unique_id for r in checkpoint.load_succeeded()],
+            ['model.root.c']
+        )
+
+    def test_truncated_line_ignored(self):
+        checkpoint = self._write(RunModelResult(_make_node('a')))
+        with open(self.path, 'a') as fp:
+            fp.write('{"node": {"unique_id": "model.roo')
+        self.assertEqual(len(checkpoint.load_succeeded()), 1)
+
+    def test_missing_and_remove(self):
+        checkpoint = ResultCheckpoint(self.path)
+        self.assertEqual(checkpoint.load_succeeded(), [])
+        self._write(RunModelResult(_make_node('a')))
+        checkpoint.remove()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_load_execution_times(self):
+        first = os.path.join(self.tempdir, 'first.json')
+        second = os.path.join(self.tempdir, 'second.json')
+        with open(first, 'w') as fp:
+            fp.write('{"results": [{"node": {"unique_id": "a"}, '
+                     '"error": null, "execution_time": 2}, '
+                     '{"node": {"unique_id": "b"}, '
+                     '"error": "bad", "execution_time": 1}]}')
+        with open(second, 'w') as fp:
+            fp.write('{"results": [{"node": {"unique_id": "a"}, '
+                     '"error": null, "skip": false, "execution_time": 4}]}')
+        missing = os.path.join(self.tempdir, 'missing.json')
+
+        self.assertEqual(load_execution_times([first, second, missing]),
+                         {'a': 3.0})
+
+
+class AdaptiveConcurrencyTest(unittest.TestCase):
+    def setUp(self):
+        self.latencies = QueryLatencies()
+        execution_times = {'model.root.fast': 1.0, 'model.root.slow': 5.0}
+        self.adaptive = AdaptiveConcurrency(2, 4, self.latencies,
+                                            execution_times)
+
+    def _run_window(self, latency, unique_id='model.root.fast'):
+        for _ in range(AdaptiveConcurrency.WINDOW_SIZE):
+            self.latencies.record(latency, unique_id)
+        self.adaptive.acquire()
+        self.adaptive.release()
+
+    def _limits(self):
+        return [threads for _, threads in self.adaptive.history]
+
+    def test_grows_only_when_saturated(self):
+        self._run_window(1.0)
+        self.assertEqual(self.adaptive.limit, 2)
+
+        # a node had to wait for a slot, and latency held steady
+        self.adaptive._waited = True
+        self._run_window(1.1)
+        self.assertEqual(self.adaptive.limit, 3)
+
+        for _ in range(3):
+            self.adaptive._waited = True
+            self._run_window(1.0)
+        self.assertEqual(self.adaptive.limit, 4)
+        self.assertEqual(self._limits(), [2, 3, 4])
+
+    def test_backs_off_when_latency_rises(self):
+        self._run_window(1.0)
+        self.adaptive._waited = True
+        self._run_window(1.0)
+        self.assertEqual(self.adaptive.limit, 3)
+
+        self._run_window(5.0)
+        self.assertEqual(self.adaptive.limit, 2)
+        self.assertEqual(self.adaptive.baseline, 5.0)
+        # latency held at its new level, so the lower limit is enough
+        self._run_window(5.0)
+        self.assertEqual(self.adaptive.limit, 2)
+        self._run_window(10.0)
+        self.assertEqual(self.adaptive.limit, 1)
+        self._run_window(20.0)
+        self.assertEqual(self.adaptive.limit, 1)
+        self.assertEqual(self.adaptive.baseline, 20.0)
+        self.assertEqual(self._limits(), [2, 3, 2, 1])
+
+    def test_recovers_after_backoff(self):
+        self._run_window(1.0)
+        self._run_window(5.0)
+        self._run_window(10.0)
+        self.assertEqual(self.adaptive.limit, 1)
+
+        for _ in range(3):
+            self.adaptive._waited = True
+            self._run_window(1.0)
+        self.assertEqual(self.adaptive.limit, 4)
+        self.assertEqual(self.adaptive.baseline, 1.0)
+        self.assertEqual(self._limits(), [2, 1, 2, 3, 4])
+
+    def test_model_mix_changes(self):
+        self._run_window(1.0, 'model.root.fast')
+        # slower models, running no slower than they used to
+        self._run_window(5.0, 'model.root.slow')
+        self.assertEqual(self.adaptive.limit, 2)
+        self.assertEqual(self.adaptive.baseline, 1.0)
+
+        self.adaptive._waited = True
+        self._run_window(5.0, 'model.root.slow')
+        self.assertEqual(self.adaptive.limit, 3)
+        self._run_window(1.0, 'model.root.fast')
+        self.assertEqual(self.adaptive.limit, 3)
+
+        # the same models, five times slower
+        self._run_window(25.0, 'model.root.slow')
+        self.assertEqual(self.adaptive.limit, 2)
+        self.assertEqual(self._limits(), [2, 3, 2])
+
+    def test_nodes_without_history_not_measured(self):
+        self._run_window(1.0, 'model.root.new')
+        self._run_window(1.0, None)
+        self.assertIsNone(self.adaptive.baseline)
+        self.assertEqual(self.latencies.drain(), [])
+
+        adaptive = AdaptiveConcurrency(2, 4, self.latencies, {})
+        for _ in range(AdaptiveConcurrency.WINDOW_SIZE):
+            self.latencies.record(1.0, 'model.root.fast')
+        adaptive.acquire()
+        adaptive.release()
+        self.assertIsNone(adaptive.baseline)
+        self.assertEqual(adaptive.limit, 2)
+
+    def test_partial_window_does_not_adjust(self):
+        self.latencies.record(1.0, 'model.root.fast')
+        self.adaptive.acquire()
+        self.adaptive.release()
+        self.assertIsNone(self.adaptive.baseline)
+        self.assertEqual(self.adaptive.active, 0)
+
+    def test_serialized_in_execution_result(self):
+        self._run_window(1.0)
+        self.adaptive._waited = True
+        self._run_window(1.0)
+        result = ExecutionResult(
+            results=[],
+            elapsed_time=1.0,
+            generated_at='2019-01-01T00:00:00Z',
+            concurrency=self.adaptive.serialize(),
+        )
+        serialized = result.serialize()
+        self.assertEqual(
+            [c['threads'] for c in serialized['concurrency']], [2, 3]
+        )
+        del serialized['concurrency']
+        self.assertNotIn('concurrency', ExecutionResult(**serialized)
+                         .serialize())
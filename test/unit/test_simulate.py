@@ -0,0 +1,52 @@
+import mock
+import unittest
+
+from dbt import linker
+from dbt.task.simulate import simulate_schedule, find_critical_path
+
+
+def _mock_manifest(nodes):
+    return mock.MagicMock(nodes={
+        n: mock.MagicMock(unique_id=n) for n in nodes
+    })
+
+
+class SimulateTest(unittest.TestCase):
+    def setUp(self):
+        self.patcher = mock.patch.object(linker, 'is_blocking_dependency')
+        self.is_blocking_dependency = self.patcher.start()
+        self.is_blocking_dependency.return_value = True
+        self.linker = linker.Linker()
+        # A and B are independent roots, C depends on both, D on C
+        self.linker.dependency('C', 'A')
+        self.linker.dependency('C', 'B')
+        self.linker.dependency('D', 'C')
+        self.manifest = _mock_manifest('ABCD')
+        self.durations = {'A': 10, 'B': 4, 'C': 2, 'D': 1}
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def _simulate(self, threads):
+        queue = self.linker.as_graph_queue(self.manifest)
+        return simulate_schedule(queue, self.durations, threads)
+
+    def test_simulate_schedule__one_thread(self):
+        makespan, busy_time = self._simulate(1)
+        self.assertEqual(makespan, 17)
+        self.assertEqual(busy_time, 17)
+
+    def test_simulate_schedule__two_threads(self):
+        makespan, busy_time = self._simulate(2)
+        # A and B run in parallel, then C, then D
+        self.assertEqual(makespan, 13)
+        self.assertEqual(busy_time, 17)
+
+    def test_find_critical_path(self):
+        length, path = find_critical_path(self.linker.graph, self.durations)
+        self.assertEqual(length, 13)
+        self.assertEqual(path, ['A', 'C', 'D'])
+
+    def test_find_critical_path__empty(self):
+        self.assertEqual(find_critical_path(linker.Linker().graph, {}),
+                         (0.0, []))